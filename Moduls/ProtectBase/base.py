@@ -2,7 +2,10 @@ import pygame
 import math
 from typing import List, Optional
 from core import Vector2, WeaponType
-from .bullet import Bullet
+from game_clock import get_ticks
+from spatial import SpatialHash
+from bullet_pool import BulletPool
+from render_cache import render_text
 
 
 class Base:
@@ -26,30 +29,30 @@ class Base:
         
         self.chain_radius = 150
         
-    def update(self, dt: float, zombies: List, connected_players: List) -> List[Bullet]:
-        bullets = []
+    def update(self, dt: float, zombies: List, connected_players: List,
+               zombie_grid: Optional[SpatialHash], bullets: BulletPool,
+               now: Optional[int] = None):
+        current_time = get_ticks() if now is None else now
         
         if self.health <= 0:
             self.active = False
-            return bullets
+            return
         
         movement = self.calculate_movement(connected_players, dt)
-        if movement.length() > 0:
-            self.position = self.position + movement
+        if movement.length_squared() > 0:
+            self.position.iadd(movement)
             
-        self.target_zombie = self.find_nearest_zombie(zombies)
+        self.target_zombie = self.find_nearest_zombie(zombies, zombie_grid)
         
-        if self.target_zombie and self.can_fire():
-            direction = (self.target_zombie.position - self.position)
-            if direction.length() > 0:
-                direction = direction.normalize()
-                bullets.append(self.create_bullet(direction))
-                self.last_fire_time = pygame.time.get_ticks()
+        if self.target_zombie and self.can_fire(current_time):
+            direction = self.target_zombie.position - self.position
+            if direction.length_squared() > 0:
+                direction.normalize_ip()
+                self.fire_bullet(bullets, direction)
+                self.last_fire_time = current_time
         
         self.check_level_progression()
         self.update_player_weapons(connected_players)
-        
-        return bullets
     
     def calculate_movement(self, connected_players: List, dt: float) -> Vector2:
         if not connected_players:
@@ -73,45 +76,35 @@ class Base:
                 if hasattr(player, 'ai') and hasattr(player.ai, 'move_direction'):
                     move_dir = player.ai.move_direction
             
-            if move_dir.length() > 0:
+            # move_dir may be the bot AI's own vector, so it is not normalized in place
+            length = move_dir.length()
+            if length > 0:
                 moving_players.append(player)
-                total_direction = total_direction + move_dir.normalize()
+                total_direction.iadd(move_dir, 1 / length)
         
         if len(moving_players) == 0:
             return Vector2(0, 0)
         
-        if total_direction.length() > 0:
-            total_direction = total_direction.normalize()
+        if total_direction.length_squared() > 0:
             speed = 100
-            return total_direction * speed * dt
+            return total_direction.normalize_ip().imul(speed * dt)
         
         return Vector2(0, 0)
     
-    def find_nearest_zombie(self, zombies: List) -> Optional[object]:
-        if not zombies:
-            return None
-        
-        active_zombies = [z for z in zombies if z.active]
-        if not active_zombies:
-            return None
-        
-        nearest_zombie = None
-        nearest_distance = 400
-        
-        for zombie in active_zombies:
-            distance = (self.position - zombie.position).length()
-            if distance < nearest_distance:
-                nearest_zombie = zombie
-                nearest_distance = distance
+    def find_nearest_zombie(self, zombies: List, zombie_grid: Optional[SpatialHash] = None) -> Optional[object]:
+        if zombie_grid is None:
+            if not zombies:
+                return None
+            zombie_grid = SpatialHash.from_items(zombies)
         
-        return nearest_zombie
+        return zombie_grid.nearest(self.position.x, self.position.y, 400)
     
-    def can_fire(self) -> bool:
-        current_time = pygame.time.get_ticks()
+    def can_fire(self, now: Optional[int] = None) -> bool:
+        current_time = get_ticks() if now is None else now
         return current_time - self.last_fire_time >= self.fire_rate
     
-    def create_bullet(self, direction: Vector2) -> Bullet:
-        return Bullet(self.position, direction, self.damage, player_id=0, speed=350)
+    def fire_bullet(self, bullets: BulletPool, direction: Vector2) -> int:
+        return bullets.fire(self.position, direction, self.damage, player_id=0, speed=350)
     
     def check_level_progression(self):
         kills_needed = (15 + 15) * 5
@@ -188,9 +181,8 @@ class Base:
         health_width = int(bar_width * (self.health / self.max_health))
         pygame.draw.rect(screen, (0, 200, 0), (bar_x, bar_y, health_width, bar_height))
         
-        font = pygame.font.Font(None, 28)
         level_text = f"BASE LVL {self.level}"
-        text_surface = font.render(level_text, True, (255, 255, 255))
+        text_surface = render_text(level_text, 28, (255, 255, 255))
         text_rect = text_surface.get_rect(center=(screen_x, screen_y - self.size // 2 - 35))
         screen.blit(text_surface, text_rect)
         
@@ -18,9 +18,8 @@ class Bullet:
         if not self.active:
             return
 
-        movement = self.velocity * dt
-        self.position = self.position + movement
-        self.travel_distance += movement.length()
+        self.position.iadd(self.velocity, dt)
+        self.travel_distance += self.velocity.length() * dt
         if self.travel_distance >= self.range:
             self.active = False
 
@@ -1,10 +1,24 @@
 import random
 import math
+import time
+from contextlib import contextmanager, ExitStack
 import pygame
-from core import Vector2, GameState, PlayerState, WeaponType, GameMode
+from core import Vector2, GameState, PlayerState, WeaponType, GameMode, within, within_xy
+from game_clock import use_clock, FixedTimestep, GameClock, VirtualClock
+from interpolation import Interpolator, lerp_position
+from spatial import SpatialHash
+from horde import ZombieHorde
+from bullet_pool import BulletPool
+from entities import EntityList
+from render_cache import get_font, render_text
+from profiler import FrameProfiler
+from replay import InputRecorder, new_recording_path
+from autosave import AUTOSAVE_INTERVAL_MS, AUTOSAVER
+from compositor import OverlayCompositor
+from Moduls.ProtectBase.bullet import Bullet
 from Moduls.ProtectBase.player import Player
 from Moduls.ProtectBase.helper_bot import HelperBot
-from Moduls.ProtectBase.save_load import save_game
+from Moduls.ProtectBase.save_load import save_game, autosave
 from Moduls.ProtectBase.world import World
 from Moduls.ProtectBase.zombie import Zombie, ZombieType
 from Moduls.ProtectBase.base import Base
@@ -24,12 +38,26 @@ ZOMBIE_TYPE_WEIGHTS = {
 
 
 class GameEngine:
-    def __init__(self, screen, width, height):
+    def __init__(self, screen, width, height, use_horde=False, headless=False, time_scale=1.0):
         self.screen = screen
         self.screen_width = width
         self.screen_height = height
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
+        # Fixed simulation steps (advance_frame), rendered interpolated.
+        # Headless: no display or fonts, driven by run_headless().
+        # time_scale > 1 fast-forwards: game time and dt run that much faster.
+        self.headless = headless
+        # Game time advances with simulation steps, one sample per step;
+        # `now` is what every timer in the step reads
+        self.virtual_clock = VirtualClock()
+        self.game_clock = GameClock(self.virtual_clock, time_scale)
+        self.timestep = FixedTimestep()
+        self.interpolator = Interpolator()
+        self.frame_steps = 0
+        self.profiler = FrameProfiler()
+        self.recorder = None
+        self.now = self.game_clock.now
+        self.font = None if headless else get_font(36)
+        self.small_font = None if headless else get_font(24)
         self.clock = pygame.time.Clock()
         
         self.state = "PLAYING"
@@ -38,17 +66,22 @@ class GameEngine:
         self.pause_bg_green = False
         
         self.players = []
-        self.zombies = []
-        self.bullets = []
+        self.use_horde = use_horde
+        self.zombies = ZombieHorde(Zombie, ZombieType) if use_horde else EntityList()
+        self.bullets = BulletPool(Bullet)
+        self.zombie_grid = SpatialHash()
         self.world = World()
         self.camera = Vector2(0, 0)
+        self.prev_camera = Vector2(0, 0)
         
         self.base = None
         
-        self.game_start_time = pygame.time.get_ticks()
+        self.game_start_time = self.now
         self.game_time = 0
+        self.last_autosave_time = 0
         self.current_day = 1
         self.is_night = False
+        self.compositor = OverlayCompositor()
         self.zombie_strength = 1
         self.zombies_killed = 0
         self.zombie_kills_by_type = {ztype.value: 0 for ztype in ALL_ZOMBIE_TYPES}
@@ -208,10 +241,13 @@ class GameEngine:
 
     def restart_game(self):
         print("[INFO] O'yin qayta boshlandi")
+        # A restart is not reproducible from the session seed
+        self.stop_recording()
         self.setup_players(getattr(self, '_last_selected_slots', [{'type': 'player', 'id': 1, 'name': 'Player 1'}]))
         self.setup_world()
         self.state = "PLAYING"
-        self.game_start_time = pygame.time.get_ticks()
+        self.game_start_time = self.now
+        self.last_autosave_time = 0
 
     def update_day_night_cycle(self):
         day_length = 15 * 60 * 1000
@@ -224,16 +260,16 @@ class GameEngine:
         self.is_night = day_progress >= 8 / 15
 
     def update_players(self, dt):
+        self.zombie_grid.rebuild(self.zombies)
         if self.base:
-            base_bullets = self.base.update(dt, self.zombies, self.players)
-            self.bullets.extend(base_bullets)
+            self.base.update(dt, self.zombies, self.players, self.zombie_grid, self.bullets, self.now)
         
         alive_positions = [p.position for p in self.players if p.state == PlayerState.ALIVE]
         for player in self.players:
             if player.state != PlayerState.DEAD:
                 other_players = [p for p in self.players if p.id != player.id]
-                new_bullets = player.update(dt, self.world.power_ups, self.zombies, other_players)
-                self.bullets.extend(new_bullets)
+                player.update(dt, self.world.power_ups, self.zombies, other_players, self.zombie_grid, self.bullets,
+                              self.now)
         
         self.world.update(alive_positions if alive_positions else [self.base.position] if self.base else [])
 
@@ -243,36 +279,49 @@ class GameEngine:
             alive_positions.append(self.base.position)
         
         protection_circles = [p.get_protection_circle_info() for p in self.players]
+        if self.use_horde:
+            self.update_horde(dt, alive_positions, protection_circles)
+            return
         
-        for zombie in self.zombies[:]:
-            if not zombie.active:
-                self.zombies.remove(zombie)
-                continue
+        self.zombies.remove_inactive()
+        for zombie in self.zombies:
             zombie.update(dt, alive_positions, protection_circles)
             
             for player in self.players:
                 if player.state != PlayerState.ALIVE:
                     continue
-                distance = (zombie.position - player.position).length()
-                if distance < 25 and zombie.can_attack(pygame.time.get_ticks()):
-                    damage = zombie.attack(pygame.time.get_ticks())
-                    player.take_damage(damage)
+                if within(zombie.position, player.position, 25) and zombie.can_attack(self.now):
+                    damage = zombie.attack(self.now)
+                    player.take_damage(damage, self.now)
             
             if self.base and self.base.active:
-                distance = (zombie.position - self.base.position).length()
-                if distance < self.base.size // 2 + 10 and zombie.can_attack(pygame.time.get_ticks()):
-                    damage = zombie.attack(pygame.time.get_ticks())
+                if within(zombie.position, self.base.position, self.base.size // 2 + 10) and zombie.can_attack(self.now):
+                    damage = zombie.attack(self.now)
                     self.base.take_damage(damage)
 
+    def update_horde(self, dt, alive_positions, protection_circles):
+        self.zombies.remove_inactive()
+        self.zombies.update(dt, alive_positions, protection_circles)
+        current_time = self.now
+        positions = [p.position for p in self.players]
+        reaches = [25] * len(self.players)
+        if self.base:
+            positions.append(self.base.position)
+            reaches.append(self.base.size // 2 + 10)
+        for zombie, in_reach in self.zombies.attackers(positions, reaches, current_time):
+            for player, hit in zip(self.players, in_reach):
+                if hit and player.state == PlayerState.ALIVE and zombie.can_attack(current_time):
+                    damage = zombie.attack(current_time)
+                    player.take_damage(damage, current_time)
+            if self.base and self.base.active and in_reach[-1] and zombie.can_attack(current_time):
+                damage = zombie.attack(current_time)
+                self.base.take_damage(damage)
+
     def update_bullets(self, dt):
-        for bullet in self.bullets[:]:
-            if not bullet.active:
-                self.bullets.remove(bullet)
-                continue
-            bullet.update(dt)
+        self.bullets.update(dt)
 
     def spawn_zombies(self):
-        current_time = pygame.time.get_ticks()
+        current_time = self.now
         spawn_rate = 1200
         if self.is_night:
             spawn_rate *= 0.4
@@ -305,7 +354,7 @@ class GameEngine:
         self.zombies.append(Zombie(spawn_pos, self.zombie_strength, ztype))
 
     def spawn_power_ups(self):
-        current_time = pygame.time.get_ticks()
+        current_time = self.now
         if current_time >= self.next_power_up_time:
             kills_for_power_up = 10 + random.randint(0, 10)
             if self.zombies_killed >= kills_for_power_up:
@@ -324,15 +373,17 @@ class GameEngine:
                 self.next_power_up_time = current_time + (10 + random.random() * 10) * 1000
 
     def check_collisions(self):
-        for bullet in self.bullets[:]:
-            if not bullet.active:
-                continue
-            for zombie in self.zombies[:]:
+        self.zombie_grid.rebuild(self.zombies)
+        bullets = self.bullets
+        for slot in bullets.live_slots():
+            bullet_x = bullets.x.item(slot)
+            bullet_y = bullets.y.item(slot)
+            for zombie in self.zombie_grid.query(bullet_x, bullet_y, 15):
                 if not zombie.active:
                     continue
-                distance = (bullet.position - zombie.position).length()
-                if distance < 15:
-                    killed = zombie.take_damage(bullet.damage)
+                zombie_pos = zombie.position
+                if within_xy(bullet_x, bullet_y, zombie_pos.x, zombie_pos.y, 15):
+                    killed = zombie.take_damage(bullets.damage.item(slot))
                     if killed:
                         self.zombies_killed += 1
                         if hasattr(self, "zombie_kills_by_type"):
@@ -341,20 +392,20 @@ class GameEngine:
                                 self.zombie_kills_by_type[ztype.value] += 1
                         if self.base:
                             self.base.add_zombie_kill()
-                    bullet.active = False
+                    bullets.release(slot)
                     break
         
+        power_ups = self.world.power_ups
+        power_ups.remove_inactive()
         for player in self.players:
             if player.state != PlayerState.ALIVE:
                 continue
-            for power_up in self.world.power_ups[:]:
+            for power_up in power_ups:
                 if not power_up.active:
                     continue
-                distance = (player.position - power_up.position).length()
-                if distance < 20:
+                if within(player.position, power_up.position, 20):
                     player.collect_power_up()
-                    power_up.active = False
-                    self.world.power_ups.remove(power_up)
+                    power_ups.remove(power_up)
 
     def check_game_over(self):
         if self.base and not self.base.active:
@@ -415,6 +466,12 @@ class GameEngine:
                 if event.key == pygame.K_F11:
                     self.toggle_fullscreen()
                 
+                if event.key == pygame.K_F3:
+                    self.profiler.toggle_overlay()
+                
+                if event.key == pygame.K_F4:
+                    self.profiler.toggle_csv()
+                
                 if event.key == pygame.K_ESCAPE:
                     if self.state == "PLAYING":
                         self.state = "PAUSED"
@@ -463,19 +520,124 @@ class GameEngine:
         elif self.state == "GAME_OVER":
             self.handle_game_over_click(pos)
 
+    def advance_frame(self, frame_dt):
+        """Run the fixed-length simulation steps that `frame_dt` seconds of real time cover."""
+        self.frame_steps = self.timestep.advance(frame_dt)
+        for _ in range(self.frame_steps):
+            self.store_previous_state()
+            self.step_update(self.timestep.step)
+
+    def profile_counts(self):
+        """Entity counts recorded with every profiled frame."""
+        return {
+            "steps": self.frame_steps,
+            "players": len(self.players),
+            "zombies": len(self.zombies),
+            "bullets": len(self.bullets),
+            "chunks": len(self.world.chunks),
+        }
+
+    def end_frame(self):
+        """Draw the profiler overlay (if shown) and close the profiled frame."""
+        if self.screen is not None:
+            self.profiler.render(self.screen)
+        self.profiler.end_frame(self.profile_counts())
+
+    def moving_objects(self):
+        """Entities drawn interpolated through their `position`; pooled ones blend their arrays."""
+        objects = list(self.players)
+        objects.extend(p.drone for p in self.players if p.drone)
+        if not self.use_horde:
+            objects.extend(self.zombies)
+        if self.base:
+            objects.append(self.base)
+        return objects
+
+    def store_previous_state(self):
+        """Remember where everything was before the next simulation step."""
+        self.interpolator.capture(self.moving_objects())
+        self.bullets.store_previous()
+        if self.use_horde:
+            self.zombies.store_previous()
+        self.prev_camera = Vector2(self.camera.x, self.camera.y)
+
+    @contextmanager
+    def interpolated(self):
+        """
+        Blend every entity `timestep.alpha` of the way from the previous step
+        to the current one while rendering; yields the blended camera.
+        """
+        alpha = self.timestep.alpha
+        with ExitStack() as stack:
+            stack.enter_context(self.interpolator.blend(self.moving_objects(), alpha))
+            stack.enter_context(self.bullets.interpolated(alpha))
+            if self.use_horde:
+                stack.enter_context(self.zombies.interpolated(alpha))
+            yield lerp_position(self.prev_camera.x, self.prev_camera.y, self.camera, alpha)
+
+    def start_recording(self, seed, modul_name, selected_slots, path=None):
+        """
+        Record this session's input for replay.replay(). Call right after
+        setup, on an engine built after replay.seed_session(seed).
+        """
+        meta = {
+            "module": modul_name,
+            "slots": selected_slots,
+            "use_horde": self.use_horde,
+            "time_scale": self.game_clock.time_scale,
+            "width": self.screen_width,
+            "height": self.screen_height,
+        }
+        self.recorder = InputRecorder(path or new_recording_path(modul_name), seed, self.timestep.step, meta)
+        print(f"[GameEngine] Recording session: {self.recorder.path}")
+
+    def stop_recording(self):
+        if self.recorder is not None:
+            print(f"[GameEngine] Recording saved: {self.recorder.close()}")
+            self.recorder = None
+
+    def autosave(self):
+        """Every AUTOSAVE_INTERVAL_MS of game time, hand a snapshot to the background autosaver."""
+        if self.headless or self.state != "PLAYING":
+            return
+        if self.game_time - self.last_autosave_time < AUTOSAVE_INTERVAL_MS:
+            return
+        self.last_autosave_time = self.game_time
+        autosave(self, modul_name="ProtectBase")
+
     def step_update(self, dt):
+        if self.recorder is not None:
+            self.recorder.capture(self)
+        self.virtual_clock.advance(dt)
+        self.now = self.game_clock.tick()
+        self.game_time = self.now - self.game_start_time
         if self.state != "PLAYING":
             return
-        
-        self.update_day_night_cycle()
-        self.update_players(dt)
-        self.update_zombies(dt)
-        self.update_bullets(dt)
-        self.spawn_zombies()
-        self.spawn_power_ups()
-        self.check_collisions()
-        self.update_camera()
-        self.check_game_over()
+        dt *= self.game_clock.time_scale
+        
+        # Code that reads get_ticks() instead of `now` sees this engine's clock
+        with use_clock(self.game_clock):
+            phase = self.profiler.phase
+            with phase("update_day_night_cycle"):
+                self.update_day_night_cycle()
+            with phase("update_players"):
+                self.update_players(dt)
+            with phase("update_zombies"):
+                self.update_zombies(dt)
+            with phase("update_bullets"):
+                self.update_bullets(dt)
+            with phase("spawn_zombies"):
+                self.spawn_zombies()
+            with phase("spawn_power_ups"):
+                self.spawn_power_ups()
+            with phase("check_collisions"):
+                self.check_collisions()
+            with phase("update_camera"):
+                self.update_camera()
+            with phase("check_game_over"):
+                self.check_game_over()
+            with phase("autosave"):
+                self.autosave()
 
     def _init_pause_menu_buttons(self):
         center_x = self.screen_width // 2
@@ -489,12 +651,9 @@ class GameEngine:
         }
 
     def render_pause_menu(self):
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.fill(BLACK)
-        overlay.set_alpha(128)
-        self.screen.blit(overlay, (0, 0))
+        self.compositor.tint(self.screen, BLACK, 128)
         
-        title = self.font.render("PAUSED - PROTECT BASE", True, WHITE)
+        title = render_text("PAUSED - PROTECT BASE", 36, WHITE)
         title_rect = title.get_rect(center=(self.screen_width // 2, 250))
         self.screen.blit(title, title_rect)
         
@@ -508,7 +667,7 @@ class GameEngine:
         for btn_name, btn_rect in self.pause_menu_buttons.items():
             pygame.draw.rect(self.screen, (70, 70, 70), btn_rect)
             pygame.draw.rect(self.screen, WHITE, btn_rect, 2)
-            btn_text = self.font.render(btn_name.title(), True, WHITE)
+            btn_text = render_text(btn_name.title(), 36, WHITE)
             btn_text_rect = btn_text.get_rect(center=btn_rect.center)
             self.screen.blit(btn_text, btn_text_rect)
 
@@ -521,7 +680,7 @@ class GameEngine:
             pygame.draw.rect(self.screen, (60, 60, 60), dialog_rect)
             pygame.draw.rect(self.screen, WHITE, dialog_rect, 2)
 
-            prompt = self.font.render("Save name:", True, WHITE)
+            prompt = render_text("Save name:", 36, WHITE)
             self.screen.blit(prompt, (dialog_x + 20, dialog_y + 16))
 
             input_rect = pygame.Rect(dialog_x + 20, dialog_y + 56, dialog_w - 40, 36)
@@ -530,13 +689,13 @@ class GameEngine:
 
             # Render input text
             txt = self.pause_save_input_text if hasattr(self, 'pause_save_input_text') else ''
-            input_text_surface = self.font.render(txt, True, WHITE)
+            input_text_surface = render_text(txt, 36, WHITE)
             # clip if too long
             max_w = input_rect.w - 10
             if input_text_surface.get_width() > max_w:
                 # show only last part
                 text_to_show = txt[-(max_w // 10):]
-                input_text_surface = self.font.render(text_to_show, True, WHITE)
+                input_text_surface = render_text(text_to_show, 36, WHITE)
             self.screen.blit(input_text_surface, (input_rect.x + 6, input_rect.y + 4))
 
             # Buttons
@@ -546,13 +705,13 @@ class GameEngine:
 
             pygame.draw.rect(self.screen, (70, 130, 70), save_btn)
             pygame.draw.rect(self.screen, WHITE, save_btn, 2)
-            save_text = self.font.render("Save", True, WHITE)
+            save_text = render_text("Save", 36, WHITE)
             save_text_rect = save_text.get_rect(center=save_btn.center)
             self.screen.blit(save_text, save_text_rect)
 
             pygame.draw.rect(self.screen, (130, 70, 70), cancel_btn)
             pygame.draw.rect(self.screen, WHITE, cancel_btn, 2)
-            cancel_text = self.font.render("Cancel", True, WHITE)
+            cancel_text = render_text("Cancel", 36, WHITE)
             cancel_text_rect = cancel_text.get_rect(center=cancel_btn.center)
             self.screen.blit(cancel_text, cancel_text_rect)
 
@@ -562,20 +721,17 @@ class GameEngine:
             self.pause_save_dialog_cancel = cancel_btn
 
     def render_game_over(self):
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.fill(BLACK)
-        overlay.set_alpha(180)
-        self.screen.blit(overlay, (0, 0))
+        self.compositor.tint(self.screen, BLACK, 180)
         
         if self.base and self.base.level >= 999:
-            title = self.font.render("VICTORY!", True, (255, 215, 0))
+            title = render_text("VICTORY!", 36, (255, 215, 0))
         else:
-            title = self.font.render("GAME OVER - BASE DESTROYED!", True, RED)
+            title = render_text("GAME OVER - BASE DESTROYED!", 36, RED)
         title_rect = title.get_rect(center=(self.screen_width // 2, 300))
         self.screen.blit(title, title_rect)
         
         if self.base:
-            stats_text = self.font.render(f"Base Level: {self.base.level} | Kills: {self.base.zombie_kills}", True, WHITE)
+            stats_text = render_text(f"Base Level: {self.base.level} | Kills: {self.base.zombie_kills}", 36, WHITE)
             stats_rect = stats_text.get_rect(center=(self.screen_width // 2, 400))
             self.screen.blit(stats_text, stats_rect)
         
@@ -586,50 +742,58 @@ class GameEngine:
         play_again_rect = pygame.Rect(center_x - 160, 500, button_width, button_height)
         pygame.draw.rect(self.screen, (70, 130, 70), play_again_rect)
         pygame.draw.rect(self.screen, WHITE, play_again_rect, 2)
-        play_text = self.font.render("Play Again", True, WHITE)
+        play_text = render_text("Play Again", 36, WHITE)
         play_text_rect = play_text.get_rect(center=play_again_rect.center)
         self.screen.blit(play_text, play_text_rect)
         
         menu_rect = pygame.Rect(center_x + 10, 500, button_width, button_height)
         pygame.draw.rect(self.screen, (130, 70, 70), menu_rect)
         pygame.draw.rect(self.screen, WHITE, menu_rect, 2)
-        menu_text = self.font.render("Main Menu", True, WHITE)
+        menu_text = render_text("Main Menu", 36, WHITE)
         menu_text_rect = menu_text.get_rect(center=menu_rect.center)
         self.screen.blit(menu_text, menu_text_rect)
 
     def render_hud(self):
         if self.base:
             base_info = f"BASE HP: {self.base.health}/{self.base.max_health} | LVL: {self.base.level} | Kills: {self.base.zombie_kills}"
-            info_text = self.font.render(base_info, True, WHITE)
+            info_text = render_text(base_info, 36, WHITE)
             pygame.draw.rect(self.screen, (0, 0, 0, 128), (10, 10, info_text.get_width() + 20, 40))
             self.screen.blit(info_text, (20, 20))
         
         day_text = f"Day {self.current_day}" + (" (Night)" if self.is_night else "")
-        day_surface = self.small_font.render(day_text, True, WHITE)
+        day_surface = render_text(day_text, 24, WHITE)
         self.screen.blit(day_surface, (self.screen_width - day_surface.get_width() - 20, 20))
 
     def render(self):
-        self.world.render(self.screen, self.camera, self.screen_width, self.screen_height)
-        
-        if self.base:
-            self.base.render_chains(self.screen, self.camera, self.players)
-            self.base.render(self.screen, self.camera)
-        
-        for player in self.players:
-            player.render(self.screen, self.camera)
-        
-        for zombie in self.zombies:
-            zombie.render(self.screen, self.camera)
+        phase = self.profiler.phase
+        with use_clock(self.game_clock), self.interpolated() as camera:
+            with phase("render_world"):
+                self.world.render(self.screen, camera, self.screen_width, self.screen_height)
+            
+            with phase("render_entities"):
+                if self.base:
+                    self.base.render_chains(self.screen, camera, self.players)
+                    self.base.render(self.screen, camera)
+                
+                for player in self.players:
+                    player.render(self.screen, camera)
+                
+                for zombie in self.zombies:
+                    zombie.render(self.screen, camera)
+                
+                for bullet in self.bullets:
+                    bullet.render(self.screen, camera)
         
-        for bullet in self.bullets:
-            bullet.render(self.screen, self.camera)
+        with phase("render_hud"):
+            self.render_hud()
         
-        self.render_hud()
+        with phase("render_overlays"):
+            if self.state == "PAUSED":
+                self.render_pause_menu()
+            elif self.state == "GAME_OVER":
+                self.render_game_over()
         
-        if self.state == "PAUSED":
-            self.render_pause_menu()
-        elif self.state == "GAME_OVER":
-            self.render_game_over()
+        self.end_frame()
 
     def run(self, selected_slots=None):
         self._last_selected_slots = selected_slots or []
@@ -638,22 +802,55 @@ class GameEngine:
         
         running = True
         while running:
-            dt = self.clock.tick(60) / 1000.0
-            self.game_time = pygame.time.get_ticks() - self.game_start_time
+            frame_dt = self.clock.tick(60) / 1000.0
             
             running = self.handle_events()
             
             if self.state == "MAIN_MENU":
+                self.profiler.stop_csv()
+                AUTOSAVER.flush()
                 return "MAIN_MENU"
             
-            self.step_update(dt)
+            self.advance_frame(frame_dt)
             self.render()
             
             pygame.display.flip()
         
+        self.profiler.stop_csv()
+        AUTOSAVER.flush()
         pygame.quit()
         return None
 
+    def run_headless(self, selected_slots, ticks: int, dt: float = 1 / 60) -> dict:
+        """
+        Simulate `ticks` steps of `dt` seconds as fast as possible, without
+        rendering. Returns throughput and end-of-run stats.
+        """
+        if not self.headless:
+            raise RuntimeError("run_headless needs GameEngine(..., headless=True)")
+        self._last_selected_slots = selected_slots
+        self.setup_players(selected_slots)
+        self.setup_world()
+
+        steps = 0
+        start = time.perf_counter()
+        while steps < ticks and self.state == "PLAYING":
+            self.step_update(dt)
+            steps += 1
+        elapsed = time.perf_counter() - start
+
+        return {
+            "ticks": steps,
+            "wall_seconds": elapsed,
+            "ticks_per_second": steps / elapsed if elapsed > 0 else float("inf"),
+            "game_seconds": self.game_time / 1000,
+            "state": self.state,
+            "day": self.current_day,
+            "zombies": len(self.zombies),
+            "kills": sum(p.zombie_kills for p in self.players),
+            "max_level": max((p.level for p in self.players), default=0),
+        }
+
 
 def run_game(screen, width, height, selected_slots=None):
     engine = GameEngine(screen, width, height)
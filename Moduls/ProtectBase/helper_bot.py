@@ -1,7 +1,7 @@
 import random
 import math
 
-from core import Vector2, WeaponType, PlayerState, GameMode
+from core import Vector2, WeaponType, PlayerState, GameMode, within
 from .zombie import ZombieType
 from .player import Player
 from .bot_ai import BotAI, BotState
@@ -47,17 +47,15 @@ class HelperBot(Player):
         self.base_speed = 130
         self.auto_orbit_speed = 0.5
 
-    def update(self, dt, power_ups, zombies, other_players):
-        bullets = []
-        
+    def update(self, dt, power_ups, zombies, other_players, zombie_grid, bullets, now=None):
         if self.state == PlayerState.DEAD:
-            return bullets
+            return
         
         if self.state == PlayerState.DOWNED:
-            bullets += super().update(dt, power_ups, zombies, other_players)
-            return bullets
+            super().update(dt, power_ups, zombies, other_players, zombie_grid, bullets, now)
+            return
         
-        ai_result = self.ai.update(dt, zombies, other_players, power_ups)
+        ai_result = self.ai.update(dt, zombies, other_players, power_ups, zombie_grid)
         
         if self.connected_to_base:
             self.update_bot_orbit(dt, zombies)
@@ -78,16 +76,14 @@ class HelperBot(Player):
         
         self._validate_position()
         
-        bullets += super().update(dt, power_ups, zombies, other_players)
-        return bullets
+        super().update(dt, power_ups, zombies, other_players, zombie_grid, bullets, now)
 
     def update_bot_orbit(self, dt, zombies):
         if not self.connected_to_base:
             return
         
-        active_zombies = [z for z in zombies if z.active]
-        if active_zombies:
-            nearest_zombie = min(active_zombies, key=lambda z: (self.position - z.position).length())
+        nearest_zombie = self.ai.get_zombie_grid(zombies).nearest(self.position.x, self.position.y)
+        if nearest_zombie is not None:
             zombie_dir = nearest_zombie.position - self.connected_to_base.position
             target_angle = math.atan2(zombie_dir.y, zombie_dir.x)
             
@@ -123,8 +119,7 @@ class HelperBot(Player):
             self.reviving_target = None
             return
         
-        dist = (self.reviving_target.position - self.position).length()
-        if dist < 60:
+        if within(self.reviving_target.position, self.position, 60):
             self.reviving_target.being_revived = True
             self.reviving_target.reviver_player = self
             self.reviving_target.revive_progress += dt * 1000
@@ -3,7 +3,8 @@ import random
 from enum import Enum
 from typing import List, Optional, TYPE_CHECKING
 
-from core import Vector2, PlayerState
+from core import Vector2, PlayerState, within, within_inclusive, items_within, count_within, first_within
+from spatial import SpatialHash
 
 if TYPE_CHECKING:
     from .player import Player
@@ -37,6 +38,8 @@ class BotAI:
         self.target_zombie: Optional['Zombie'] = None
         self.target_player: Optional['Player'] = None
         self.state_timer = 0
+        # Shared per-frame zombie index handed in by the engine
+        self.zombie_grid: Optional[SpatialHash] = None
         
         self.follow_distance = 120
         self.attack_range = 280
@@ -52,17 +55,11 @@ class BotAI:
         if not zombies:
             return ThreatLevel.NONE
         
-        close_zombies = 0
-        very_close_zombies = 0
-        
-        for zombie in zombies:
-            if not zombie.active:
-                continue
-            dist = (zombie.position - self.bot.position).length()
-            if dist < self.escape_range:
-                very_close_zombies += 1
-            elif dist < self.attack_range:
-                close_zombies += 1
+        bot_position = self.bot.position
+        # escape_range is inside attack_range, so only those need a second look
+        in_attack_range = items_within(bot_position, (z for z in zombies if z.active), self.attack_range)
+        very_close_zombies = count_within(bot_position, in_attack_range, self.escape_range)
+        close_zombies = len(in_attack_range) - very_close_zombies
         
         if very_close_zombies >= 3:
             return ThreatLevel.CRITICAL
@@ -78,61 +75,50 @@ class BotAI:
 
     def find_nearest_alive_player(self, players: List['Player']) -> Optional['Player']:
         nearest = None
-        min_dist = float('inf')
+        min_dist_sq = float('inf')
         for p in players:
             if p.state == PlayerState.ALIVE and p is not self.bot:
-                dist = (p.position - self.bot.position).length()
-                if dist < min_dist:
-                    min_dist = dist
+                dist_sq = p.position.distance_squared_to(self.bot.position)
+                if dist_sq < min_dist_sq:
+                    min_dist_sq = dist_sq
                     nearest = p
         return nearest
 
     def find_downed_player(self, players: List['Player']) -> Optional['Player']:
         for p in players:
             if p.state == PlayerState.DOWNED and p is not self.bot:
-                dist = (p.position - self.bot.position).length()
-                if dist < 300:
+                if within(p.position, self.bot.position, 300):
                     return p
         return None
 
+    def get_zombie_grid(self, zombies: List['Zombie']) -> SpatialHash:
+        if self.zombie_grid is None:
+            return SpatialHash.from_items(zombies)
+        return self.zombie_grid
+
     def find_nearest_zombie(self, zombies: List['Zombie']) -> Optional['Zombie']:
-        nearest = None
-        min_dist = float('inf')
-        for z in zombies:
-            if not z.active:
-                continue
-            dist = (z.position - self.bot.position).length()
-            if dist < min_dist:
-                min_dist = dist
-                nearest = z
-        return nearest
+        return self.get_zombie_grid(zombies).nearest(self.bot.position.x, self.bot.position.y)
 
     def find_zombie_threatening_player(self, zombies: List['Zombie'], player: 'Player') -> Optional['Zombie']:
-        nearest = None
-        min_dist = float('inf')
-        for z in zombies:
-            if not z.active:
-                continue
-            dist = (z.position - player.position).length()
-            if dist < self.protect_range and dist < min_dist:
-                min_dist = dist
-                nearest = z
-        return nearest
+        return self.get_zombie_grid(zombies).nearest(player.position.x, player.position.y, self.protect_range)
 
     def calculate_escape_direction(self, zombies: List['Zombie']) -> Vector2:
         if not zombies:
             return Vector2(0, 0)
         
         escape_vec = Vector2(0, 0)
+        bot_position = self.bot.position
         for z in zombies:
             if not z.active:
                 continue
-            dist = (z.position - self.bot.position).length()
-            if dist < self.attack_range and dist > 0:
-                away = self.bot.position - z.position
+            zombie_position = z.position
+            if not within(zombie_position, bot_position, self.attack_range):
+                continue
+            dist = zombie_position.distance_to(bot_position)
+            if dist > 0:
+                # escape_vec += (bot - zombie) / dist
                 weight = 1.0 / max(dist, 1)
-                escape_vec.x += away.x * weight
-                escape_vec.y += away.y * weight
+                escape_vec.iadd(bot_position, weight).iadd(zombie_position, -weight)
         
         if escape_vec.length() > 0:
             return escape_vec.normalize()
@@ -146,8 +132,7 @@ class BotAI:
         
         downed_player = self.find_downed_player(players)
         if downed_player:
-            dist_to_downed = (downed_player.position - self.bot.position).length()
-            if dist_to_downed < 300:
+            if within(downed_player.position, self.bot.position, 300):
                 self.target_player = downed_player
                 return BotState.REVIVE_PLAYER
         
@@ -170,8 +155,7 @@ class BotAI:
         if (need_health or need_shield) and power_ups:
             for pu in power_ups:
                 if pu.active:
-                    dist = (pu.position - self.bot.position).length()
-                    if dist < 400:
+                    if within(pu.position, self.bot.position, 400):
                         self.target_position = pu.position
                         return BotState.COLLECT_POWERUP
         
@@ -182,8 +166,7 @@ class BotAI:
                 return BotState.ATTACK
         
         if nearest_player:
-            dist_to_player = (nearest_player.position - self.bot.position).length()
-            if dist_to_player > self.follow_distance:
+            if not within_inclusive(nearest_player.position, self.bot.position, self.follow_distance):
                 self.target_player = nearest_player
                 return BotState.FOLLOW_PLAYER
         
@@ -216,8 +199,7 @@ class BotAI:
     def _execute_idle(self, dt: float, players: List['Player']) -> dict:
         nearest_player = self.find_nearest_alive_player(players)
         if nearest_player:
-            dist = (nearest_player.position - self.bot.position).length()
-            if dist > self.follow_distance * 0.5:
+            if not within_inclusive(nearest_player.position, self.bot.position, self.follow_distance * 0.5):
                 direction = (nearest_player.position - self.bot.position)
                 if direction.length() > 0:
                     return {
@@ -251,21 +233,22 @@ class BotAI:
         if not self.target_zombie:
             return {'move_direction': Vector2(0, 0), 'shooting': False, 'target_zombie': None}
         
-        dist = (self.target_zombie.position - self.bot.position).length()
+        target_position = self.target_zombie.position
+        bot_position = self.bot.position
         direction = Vector2(0, 0)
         
-        if dist < self.escape_range:
-            away = self.bot.position - self.target_zombie.position
+        if within(target_position, bot_position, self.escape_range):
+            away = bot_position - target_position
             if away.length() > 0:
                 direction = away.normalize()
-        elif dist > self.attack_range * 0.8:
-            toward = self.target_zombie.position - self.bot.position
+        elif not within_inclusive(target_position, bot_position, self.attack_range * 0.8):
+            toward = target_position - bot_position
             if toward.length() > 0:
                 direction = toward.normalize() * 0.5
         
         return {
             'move_direction': direction,
-            'shooting': dist < self.attack_range,
+            'shooting': within(target_position, bot_position, self.attack_range),
             'target_zombie': self.target_zombie
         }
 
@@ -313,11 +296,9 @@ class BotAI:
         if dist > 30:
             move_dir = direction.normalize()
         
-        zombie_dist = (self.target_zombie.position - self.bot.position).length()
-        
         return {
             'move_direction': move_dir,
-            'shooting': zombie_dist < self.attack_range,
+            'shooting': within(self.target_zombie.position, self.bot.position, self.attack_range),
             'target_zombie': self.target_zombie
         }
 
@@ -332,17 +313,14 @@ class BotAI:
             self.target_position = None
             return {'move_direction': Vector2(0, 0), 'shooting': False, 'target_zombie': None}
         
-        for z in zombies:
-            if not z.active:
-                continue
-            zdist = (z.position - self.bot.position).length()
-            if zdist < self.escape_range:
-                escape_dir = self.calculate_escape_direction(zombies)
-                return {
-                    'move_direction': escape_dir,
-                    'shooting': False,
-                    'target_zombie': None
-                }
+        bot_position = self.bot.position
+        if first_within(bot_position, (z for z in zombies if z.active), self.escape_range) is not None:
+            escape_dir = self.calculate_escape_direction(zombies)
+            return {
+                'move_direction': escape_dir,
+                'shooting': False,
+                'target_zombie': None
+            }
         
         return {
             'move_direction': direction.normalize() if dist > 0 else Vector2(0, 0),
@@ -372,7 +350,9 @@ class BotAI:
             'reviving': True
         }
 
-    def update(self, dt: float, zombies: List['Zombie'], players: List['Player'], power_ups) -> dict:
+    def update(self, dt: float, zombies: List['Zombie'], players: List['Player'], power_ups,
+               zombie_grid: Optional[SpatialHash] = None) -> dict:
+        self.zombie_grid = zombie_grid if zombie_grid is not None else SpatialHash.from_items(zombies)
         self.previous_state = self.state
         self.state = self.decide_state(zombies, players, power_ups)
         
@@ -1,9 +1,24 @@
 import random
 import math
+import time
+from contextlib import contextmanager, ExitStack
 import pygame
-from core import Vector2, GameState, PlayerState, WeaponType, GameMode
+from core import Vector2, GameState, PlayerState, WeaponType, GameMode, within, within_xy
+from game_clock import use_clock, FixedTimestep, GameClock, VirtualClock
+from interpolation import Interpolator, lerp_position
+from spatial import SpatialHash
+from horde import ZombieHorde
+from bullet_pool import BulletPool
+from entities import EntityList
+from render_cache import get_font, render_text
+from profiler import FrameProfiler
+from replay import InputRecorder, new_recording_path
+from autosave import AUTOSAVE_INTERVAL_MS, AUTOSAVER
+from compositor import OverlayCompositor, night_level, NIGHT_TINT_ALPHA, NIGHT_TINT_COLOR
+from Moduls.default.bullet import Bullet
 from Moduls.default.player import Player
 from Moduls.default.helper_bot import HelperBot
+from Moduls.default.save_load import autosave
 from Moduls.default.world import World
 from Moduls.default.zombie import Zombie, ZombieType
 
@@ -26,13 +41,30 @@ ZOMBIE_TYPE_WEIGHTS = {
 class GameEngine:
     """
     Complete game engine encapsulating all gameplay logic.
+    With use_horde=True zombies are simulated by the NumPy ZombieHorde backend.
+    The simulation runs in fixed steps (advance_frame) and render() draws
+    entities interpolated between the last two steps.
+    With headless=True no display or fonts are needed (screen may be None)
+    and run_headless() drives the simulation as fast as possible.
+    time_scale > 1 fast-forwards: game time and dt run that much faster.
     """
-    def __init__(self, screen, width, height):
+    def __init__(self, screen, width, height, use_horde=False, headless=False, time_scale=1.0):
         self.screen = screen
         self.screen_width = width
         self.screen_height = height
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
+        self.headless = headless
+        # Game time advances with simulation steps, one sample per step;
+        # `now` is what every timer in the step reads
+        self.virtual_clock = VirtualClock()
+        self.game_clock = GameClock(self.virtual_clock, time_scale)
+        self.timestep = FixedTimestep()
+        self.interpolator = Interpolator()
+        self.frame_steps = 0
+        self.profiler = FrameProfiler()
+        self.recorder = None
+        self.now = self.game_clock.now
+        self.font = None if headless else get_font(36)
+        self.small_font = None if headless else get_font(24)
         self.clock = pygame.time.Clock()
         
         # Game state
@@ -43,16 +75,23 @@ class GameEngine:
         
         # Player & world
         self.players = []
-        self.zombies = []
-        self.bullets = []
+        self.use_horde = use_horde
+        self.zombies = ZombieHorde(Zombie, ZombieType) if use_horde else EntityList()
+        self.bullets = BulletPool(Bullet)
+        self.zombie_grid = SpatialHash()
         self.world = World()
         self.camera = Vector2(0, 0)
+        self.prev_camera = Vector2(0, 0)
         
         # Game timing & progression
-        self.game_start_time = pygame.time.get_ticks()
+        self.game_start_time = self.now
         self.game_time = 0
+        self.last_autosave_time = 0
         self.current_day = 1
         self.is_night = False
+        # 0..1 darkness of the night tint, ramps through dusk and dawn
+        self.night_level = 0.0
+        self.compositor = OverlayCompositor()
         self.zombie_strength = 1
         self.zombies_killed = 0
         self.zombie_kills_by_type = {ztype.value: 0 for ztype in ALL_ZOMBIE_TYPES}
@@ -237,10 +276,13 @@ class GameEngine:
     def restart_game(self):
         """Restart the game."""
         print("[INFO] O'yin qayta boshlandi")
+        # A restart is not reproducible from the session seed
+        self.stop_recording()
         self.setup_players(getattr(self, '_last_selected_slots', [{'type': 'player', 'id': 1, 'name': 'Player 1', 'pos_x': 0, 'pos_y': 0}]))
         self.setup_world()
         self.state = "PLAYING"
-        self.game_start_time = pygame.time.get_ticks()
+        self.game_start_time = self.now
+        self.last_autosave_time = 0
 
     def update_day_night_cycle(self):
         """Update day/night cycle and zombie strength."""
@@ -252,45 +294,57 @@ class GameEngine:
             if self.current_day % 7 == 0:
                 self.zombie_strength += 1
         self.is_night = day_progress >= 8 / 15
+        self.night_level = night_level(day_progress, 8 / 15)
 
     def update_players(self, dt):
         """Update all players."""
         alive_positions = [p.position for p in self.players if p.state == PlayerState.ALIVE]
+        # One zombie index per frame, shared by every shooter's targeting
+        self.zombie_grid.rebuild(self.zombies)
         for player in self.players:
             if player.state != PlayerState.DEAD:
                 other_players = [p for p in self.players if p.id != player.id]
-                new_bullets = player.update(dt, self.world.power_ups, self.zombies, other_players)
-                self.bullets.extend(new_bullets)
+                player.update(dt, self.world.power_ups, self.zombies, other_players, self.zombie_grid, self.bullets,
+                              self.now)
         self.world.update(alive_positions)
 
     def update_zombies(self, dt):
         """Update all zombies."""
         alive_positions = [p.position for p in self.players if p.state == PlayerState.ALIVE]
         protection_circles = [p.get_protection_circle_info() for p in self.players]
-        for zombie in self.zombies[:]:
-            if not zombie.active:
-                self.zombies.remove(zombie)
-                continue
+        if self.use_horde:
+            self.update_horde(dt, alive_positions, protection_circles)
+            return
+        self.zombies.remove_inactive()
+        for zombie in self.zombies:
             zombie.update(dt, alive_positions, protection_circles)
             for player in self.players:
                 if player.state != PlayerState.ALIVE:
                     continue
-                distance = (zombie.position - player.position).length()
-                if distance < 25 and zombie.can_attack(pygame.time.get_ticks()):
-                    damage = zombie.attack(pygame.time.get_ticks())
-                    player.take_damage(damage)
+                if within(zombie.position, player.position, 25) and zombie.can_attack(self.now):
+                    damage = zombie.attack(self.now)
+                    player.take_damage(damage, self.now)
+
+    def update_horde(self, dt, alive_positions, protection_circles):
+        """update_zombies for the horde backend: batched movement, per-attacker damage."""
+        self.zombies.remove_inactive()
+        self.zombies.update(dt, alive_positions, protection_circles)
+        current_time = self.now
+        positions = [p.position for p in self.players]
+        reaches = [25] * len(self.players)
+        for zombie, in_reach in self.zombies.attackers(positions, reaches, current_time):
+            for player, hit in zip(self.players, in_reach):
+                if hit and player.state == PlayerState.ALIVE and zombie.can_attack(current_time):
+                    damage = zombie.attack(current_time)
+                    player.take_damage(damage, current_time)
 
     def update_bullets(self, dt):
         """Update all bullets."""
-        for bullet in self.bullets[:]:
-            if not bullet.active:
-                self.bullets.remove(bullet)
-                continue
-            bullet.update(dt)
+        self.bullets.update(dt)
 
     def spawn_zombies(self):
         """Spawn zombies based on game state and difficulty."""
-        current_time = pygame.time.get_ticks()
+        current_time = self.now
         spawn_rate = 1200
         if self.is_night:
             spawn_rate *= 0.4
@@ -324,7 +378,7 @@ class GameEngine:
 
     def spawn_power_ups(self):
         """Spawn power-ups when enough zombies are killed."""
-        current_time = pygame.time.get_ticks()
+        current_time = self.now
         if current_time >= self.next_power_up_time:
             kills_for_power_up = 10 + random.randint(0, 10)
             if self.zombies_killed >= kills_for_power_up:
@@ -344,38 +398,40 @@ class GameEngine:
 
     def check_collisions(self):
         """Check and handle collisions between bullets/zombies and players/powerups."""
-        for bullet in self.bullets[:]:
-            if not bullet.active:
-                continue
-            for zombie in self.zombies[:]:
+        self.zombie_grid.rebuild(self.zombies)
+        bullets = self.bullets
+        for slot in bullets.live_slots():
+            bullet_x = bullets.x.item(slot)
+            bullet_y = bullets.y.item(slot)
+            for zombie in self.zombie_grid.query(bullet_x, bullet_y, 15):
                 if not zombie.active:
                     continue
-                distance = (bullet.position - zombie.position).length()
-                if distance < 15:
-                    killed = zombie.take_damage(bullet.damage)
+                zombie_pos = zombie.position
+                if within_xy(bullet_x, bullet_y, zombie_pos.x, zombie_pos.y, 15):
+                    killed = zombie.take_damage(bullets.damage.item(slot))
                     if killed:
                         self.zombies_killed += 1
                         if hasattr(self, "zombie_kills_by_type"):
                             ztype = getattr(zombie, "type", None)
                             if ztype is not None:
                                 self.zombie_kills_by_type[ztype.value] += 1
-                        player = next((p for p in self.players if p.id == bullet.player_id), None)
+                        player = next((p for p in self.players if p.id == bullets.player_id.item(slot)), None)
                         if player:
                             player.add_zombie_kill()
-                    bullet.active = False
+                    bullets.release(slot)
                     break
         
+        power_ups = self.world.power_ups
+        power_ups.remove_inactive()
         for player in self.players:
             if player.state != PlayerState.ALIVE:
                 continue
-            for power_up in self.world.power_ups[:]:
+            for power_up in power_ups:
                 if not power_up.active:
                     continue
-                distance = (player.position - power_up.position).length()
-                if distance < 20:
+                if within(player.position, power_up.position, 20):
                     player.collect_power_up()
-                    power_up.active = False
-                    self.world.power_ups.remove(power_up)
+                    power_ups.remove(power_up)
 
     def check_game_over(self):
         """Check if game is over (victory or all players dead/downed)."""
@@ -443,6 +499,12 @@ class GameEngine:
                 if event.key == pygame.K_F11:
                     self.toggle_fullscreen()
                 
+                if event.key == pygame.K_F3:
+                    self.profiler.toggle_overlay()
+                
+                if event.key == pygame.K_F4:
+                    self.profiler.toggle_csv()
+                
                 if event.key == pygame.K_ESCAPE:
                     if self.state == "PLAYING":
                         self.state = "PAUSED"
@@ -487,29 +549,129 @@ class GameEngine:
         elif self.state == "GAME_OVER":
             self.handle_game_over_click(pos)
 
+    def advance_frame(self, frame_dt):
+        """Run the fixed-length simulation steps that `frame_dt` seconds of real time cover."""
+        self.frame_steps = self.timestep.advance(frame_dt)
+        for _ in range(self.frame_steps):
+            self.store_previous_state()
+            self.step_update(self.timestep.step)
+
+    def profile_counts(self):
+        """Entity counts recorded with every profiled frame."""
+        return {
+            "steps": self.frame_steps,
+            "players": len(self.players),
+            "zombies": len(self.zombies),
+            "bullets": len(self.bullets),
+            "chunks": len(self.world.chunks),
+        }
+
+    def end_frame(self):
+        """Draw the profiler overlay (if shown) and close the profiled frame."""
+        if self.screen is not None:
+            self.profiler.render(self.screen)
+        self.profiler.end_frame(self.profile_counts())
+
+    def moving_objects(self):
+        """Entities drawn interpolated through their `position`; pooled ones blend their arrays."""
+        objects = list(self.players)
+        objects.extend(p.drone for p in self.players if p.drone)
+        if not self.use_horde:
+            objects.extend(self.zombies)
+        return objects
+
+    def store_previous_state(self):
+        """Remember where everything was before the next simulation step."""
+        self.interpolator.capture(self.moving_objects())
+        self.bullets.store_previous()
+        if self.use_horde:
+            self.zombies.store_previous()
+        self.prev_camera = Vector2(self.camera.x, self.camera.y)
+
+    @contextmanager
+    def interpolated(self):
+        """
+        Blend every entity `timestep.alpha` of the way from the previous step
+        to the current one while rendering; yields the blended camera.
+        """
+        alpha = self.timestep.alpha
+        with ExitStack() as stack:
+            stack.enter_context(self.interpolator.blend(self.moving_objects(), alpha))
+            stack.enter_context(self.bullets.interpolated(alpha))
+            if self.use_horde:
+                stack.enter_context(self.zombies.interpolated(alpha))
+            yield lerp_position(self.prev_camera.x, self.prev_camera.y, self.camera, alpha)
+
+    def start_recording(self, seed, modul_name, selected_slots, path=None):
+        """
+        Record this session's input for replay.replay(). Call right after
+        setup, on an engine built after replay.seed_session(seed).
+        """
+        meta = {
+            "module": modul_name,
+            "slots": selected_slots,
+            "use_horde": self.use_horde,
+            "time_scale": self.game_clock.time_scale,
+            "width": self.screen_width,
+            "height": self.screen_height,
+        }
+        self.recorder = InputRecorder(path or new_recording_path(modul_name), seed, self.timestep.step, meta)
+        print(f"[GameEngine] Recording session: {self.recorder.path}")
+
+    def stop_recording(self):
+        if self.recorder is not None:
+            print(f"[GameEngine] Recording saved: {self.recorder.close()}")
+            self.recorder = None
+
+    def autosave(self):
+        """Every AUTOSAVE_INTERVAL_MS of game time, hand a snapshot to the background autosaver."""
+        if self.headless or self.state != "PLAYING":
+            return
+        if self.game_time - self.last_autosave_time < AUTOSAVE_INTERVAL_MS:
+            return
+        self.last_autosave_time = self.game_time
+        autosave(self, modul_name="default")
+
     def step_update(self, dt):
-        """Update game logic (one frame)."""
+        """Update game logic (one frame); `dt` is wall time, scaled by the game clock."""
+        if self.recorder is not None:
+            self.recorder.capture(self)
+        self.virtual_clock.advance(dt)
+        self.now = self.game_clock.tick()
+        self.game_time = self.now - self.game_start_time
         if self.state != "PLAYING":
             return
-        
-        self.update_day_night_cycle()
-        self.update_players(dt)
-        self.update_zombies(dt)
-        self.update_bullets(dt)
-        self.spawn_zombies()
-        self.spawn_power_ups()
-        self.check_collisions()
-        self.update_camera()
-        self.check_game_over()
+        dt *= self.game_clock.time_scale
+        
+        # Code that reads get_ticks() instead of `now` sees this engine's clock
+        with use_clock(self.game_clock):
+            phase = self.profiler.phase
+            with phase("update_day_night_cycle"):
+                self.update_day_night_cycle()
+            with phase("update_players"):
+                self.update_players(dt)
+            with phase("update_zombies"):
+                self.update_zombies(dt)
+            with phase("update_bullets"):
+                self.update_bullets(dt)
+            with phase("spawn_zombies"):
+                self.spawn_zombies()
+            with phase("spawn_power_ups"):
+                self.spawn_power_ups()
+            with phase("check_collisions"):
+                self.check_collisions()
+            with phase("update_camera"):
+                self.update_camera()
+            with phase("check_game_over"):
+                self.check_game_over()
+            with phase("autosave"):
+                self.autosave()
 
     def render_pause_menu(self):
         """Render pause menu overlay."""
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.fill(BLACK)
-        overlay.set_alpha(128)
-        self.screen.blit(overlay, (0, 0))
+        self.compositor.tint(self.screen, BLACK, 128)
         
-        title = self.font.render("PAUSED", True, WHITE)
+        title = render_text("PAUSED", 36, WHITE)
         title_rect = title.get_rect(center=(self.screen_width // 2, 250))
         self.screen.blit(title, title_rect)
         
@@ -531,25 +693,25 @@ class GameEngine:
             pygame.draw.rect(self.screen, (50, 50, 50), (dialog_x, dialog_y, dialog_width, dialog_height))
             
             # Title
-            save_title = self.font.render("Save Game", True, WHITE)
+            save_title = render_text("Save Game", 36, WHITE)
             self.screen.blit(save_title, (dialog_x + 20, dialog_y + 10))
             
             # Input box
             input_box_rect = pygame.Rect(dialog_x + 20, dialog_y + 60, dialog_width - 40, 40)
             pygame.draw.rect(self.screen, WHITE, input_box_rect, 2)
-            input_text = self.small_font.render(self.pause_save_input_text, True, WHITE)
+            input_text = render_text(self.pause_save_input_text, 24, WHITE)
             self.screen.blit(input_text, (input_box_rect.x + 5, input_box_rect.y + 8))
             
             # Save button
             save_btn_rect = pygame.Rect(dialog_x + 20, dialog_y + 110, 170, 40)
             pygame.draw.rect(self.screen, (60, 180, 70), save_btn_rect, border_radius=8)
-            save_btn_text = self.small_font.render("Save", True, WHITE)
+            save_btn_text = render_text("Save", 24, WHITE)
             self.screen.blit(save_btn_text, save_btn_rect.move(50, 10))
             
             # Cancel button
             cancel_btn_rect = pygame.Rect(dialog_x + 210, dialog_y + 110, 170, 40)
             pygame.draw.rect(self.screen, (200, 100, 100), cancel_btn_rect, border_radius=8)
-            cancel_btn_text = self.small_font.render("Cancel", True, WHITE)
+            cancel_btn_text = render_text("Cancel", 24, WHITE)
             self.screen.blit(cancel_btn_text, cancel_btn_rect.move(45, 10))
             
             self.pause_save_dialog_input = input_box_rect
@@ -571,23 +733,20 @@ class GameEngine:
         for text, y in buttons:
             btn_rect = pygame.Rect(center_x - button_width // 2, y, button_width, button_height)
             pygame.draw.rect(self.screen, (74, 124, 89), btn_rect)
-            rendered_text = self.small_font.render(text, True, WHITE)
+            rendered_text = render_text(text, 24, WHITE)
             text_rect = rendered_text.get_rect(center=(center_x, y + button_height // 2))
             self.screen.blit(rendered_text, text_rect)
 
     def render_game_over(self):
         """Render game over screen."""
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.fill(BLACK)
-        overlay.set_alpha(200)
-        self.screen.blit(overlay, (0, 0))
+        self.compositor.tint(self.screen, BLACK, 200)
         
         max_level = max((p.level for p in self.players), default=1)
         is_victory = max_level >= 999
         title_text = "VICTORY!" if is_victory else "GAME OVER"
         title_color = GREEN if is_victory else RED
         
-        title = self.font.render(title_text, True, title_color)
+        title = render_text(title_text, 36, title_color)
         title_rect = title.get_rect(center=(self.screen_width // 2, 200))
         self.screen.blit(title, title_rect)
         
@@ -600,7 +759,7 @@ class GameEngine:
         ]
         
         for i, stat in enumerate(stats):
-            text = self.small_font.render(stat, True, WHITE)
+            text = render_text(stat, 24, WHITE)
             text_rect = text.get_rect(center=(self.screen_width // 2, 300 + i * 30))
             self.screen.blit(text, text_rect)
         
@@ -611,14 +770,14 @@ class GameEngine:
         play_again_x = center_x - 170
         pygame.draw.rect(self.screen, (74, 124, 89),
                          (play_again_x, 500, button_width, button_height))
-        text = self.small_font.render("Play Again", True, WHITE)
+        text = render_text("Play Again", 24, WHITE)
         text_rect = text.get_rect(center=(play_again_x + button_width // 2, 525))
         self.screen.blit(text, text_rect)
         
         main_menu_x = center_x + 170 - button_width
         pygame.draw.rect(self.screen, (139, 69, 19),
                          (main_menu_x, 500, button_width, button_height))
-        text = self.small_font.render("Main Menu", True, WHITE)
+        text = render_text("Main Menu", 24, WHITE)
         text_rect = text.get_rect(center=(main_menu_x + button_width // 2, 525))
         self.screen.blit(text, text_rect)
 
@@ -637,28 +796,34 @@ class GameEngine:
 
     def render(self):
         """Render the game or menu overlay."""
+        phase = self.profiler.phase
         if self.state == "PLAYING":
-            self.world.render(self.screen, self.camera, self.screen_width, self.screen_height)
-            for zombie in self.zombies:
-                zombie.render(self.screen, self.camera)
-            for bullet in self.bullets:
-                bullet.render(self.screen, self.camera)
-            for player in self.players:
-                player.render(self.screen, self.camera)
+            with use_clock(self.game_clock), self.interpolated() as camera:
+                with phase("render_world"):
+                    self.world.render(self.screen, camera, self.screen_width, self.screen_height)
+                with phase("render_entities"):
+                    for zombie in self.zombies:
+                        zombie.render(self.screen, camera)
+                    for bullet in self.bullets:
+                        bullet.render(self.screen, camera)
+                    for player in self.players:
+                        player.render(self.screen, camera)
             
-            if self.is_night:
-                night_surface = pygame.Surface((self.screen_width, self.screen_height))
-                night_surface.fill((0, 0, 50))
-                night_surface.set_alpha(100)
-                self.screen.blit(night_surface, (0, 0))
+            with phase("render_overlays"):
+                self.compositor.tint(self.screen, NIGHT_TINT_COLOR, NIGHT_TINT_ALPHA * self.night_level)
             
-            self.render_hud()
+            with phase("render_hud"):
+                self.render_hud()
         
         elif self.state == "PAUSED":
-            self.render_pause_menu()
+            with phase("render_overlays"):
+                self.render_pause_menu()
         
         elif self.state == "GAME_OVER":
-            self.render_game_over()
+            with phase("render_overlays"):
+                self.render_game_over()
+        
+        self.end_frame()
 
     def render_hud(self):
         """Render heads-up display with player stats."""
@@ -684,7 +849,7 @@ class GameEngine:
                 color = YELLOW
             elif "State: DEAD" in info:
                 color = RED
-            text = self.small_font.render(info, True, color)
+            text = render_text(info, 24, color)
             self.screen.blit(text, (hud_x, 20 + i * 25))
         
         if len(self.players) > 1:
@@ -705,7 +870,7 @@ class GameEngine:
                         color = YELLOW
                     elif "State: DEAD" in info:
                         color = RED
-                    text = self.small_font.render(info, True, color)
+                    text = render_text(info, 24, color)
                     text_rect = text.get_rect(topright=(hud_x2, 20 + i * 25))
                     self.screen.blit(text, text_rect)
 
@@ -719,16 +884,47 @@ class GameEngine:
         while running:
             running = self.handle_events()
             
-            dt = self.clock.tick(60) / 1000.0
-            self.game_time = pygame.time.get_ticks() - self.game_start_time
-            
-            self.step_update(dt)
+            frame_dt = self.clock.tick(60) / 1000.0
+            self.advance_frame(frame_dt)
             
             self.render()
             pygame.display.flip()
             
             if self.state == "MAIN_MENU":
                 running = False
+        
+        self.profiler.stop_csv()
+        AUTOSAVER.flush()
+
+    def run_headless(self, selected_slots, ticks: int, dt: float = 1 / 60) -> dict:
+        """
+        Simulate `ticks` steps of `dt` seconds as fast as possible, without
+        rendering. Returns throughput and end-of-run stats.
+        """
+        if not self.headless:
+            raise RuntimeError("run_headless needs GameEngine(..., headless=True)")
+        self._last_selected_slots = selected_slots
+        self.setup_players(selected_slots)
+        self.setup_world()
+
+        steps = 0
+        start = time.perf_counter()
+        while steps < ticks and self.state == "PLAYING":
+            self.step_update(dt)
+            steps += 1
+        elapsed = time.perf_counter() - start
+
+        return {
+            "ticks": steps,
+            "wall_seconds": elapsed,
+            "ticks_per_second": steps / elapsed if elapsed > 0 else float("inf"),
+            "game_seconds": self.game_time / 1000,
+            "state": self.state,
+            "day": self.current_day,
+            "zombies": len(self.zombies),
+            "kills": sum(p.zombie_kills for p in self.players),
+            "max_level": max((p.level for p in self.players), default=0),
+        }
 
 
 def run_game(screen, width, height, selected_slots):
@@ -1,7 +1,7 @@
 import random
 import math
 
-from core import Vector2, WeaponType, PlayerState, GameMode
+from core import Vector2, WeaponType, PlayerState, GameMode, within
 from .zombie import ZombieType
 from .player import Player
 from .bot_ai import BotAI, BotState
@@ -46,17 +46,15 @@ class HelperBot(Player):
         self.ai = BotAI(self)
         self.base_speed = 130
 
-    def update(self, dt, power_ups, zombies, other_players):
-        bullets = []
-        
+    def update(self, dt, power_ups, zombies, other_players, zombie_grid, bullets, now=None):
         if self.state == PlayerState.DEAD:
-            return bullets
+            return
         
         if self.state == PlayerState.DOWNED:
-            bullets += super().update(dt, power_ups, zombies, other_players)
-            return bullets
+            super().update(dt, power_ups, zombies, other_players, zombie_grid, bullets, now)
+            return
         
-        ai_result = self.ai.update(dt, zombies, other_players, power_ups)
+        ai_result = self.ai.update(dt, zombies, other_players, power_ups, zombie_grid)
         
         move_dir = ai_result.get('move_direction', Vector2(0, 0))
         if move_dir.length() > 0:
@@ -76,8 +74,7 @@ class HelperBot(Player):
         
         self._validate_position()
         
-        bullets += super().update(dt, power_ups, zombies, other_players)
-        return bullets
+        super().update(dt, power_ups, zombies, other_players, zombie_grid, bullets, now)
 
     def get_speed(self):
         if self.ai.state == BotState.ESCAPE:
@@ -95,8 +92,7 @@ class HelperBot(Player):
             self.reviving_target = None
             return
         
-        dist = (self.reviving_target.position - self.position).length()
-        if dist < 60:
+        if within(self.reviving_target.position, self.position, 60):
             self.reviving_target.being_revived = True
             self.reviving_target.reviver_player = self
             self.reviving_target.revive_progress += dt * 1000
@@ -108,8 +104,10 @@ class HelperBot(Player):
     def _apply_push_back(self, other_players, dt):
         for p in other_players:
             if getattr(p, "state", None) == PlayerState.ALIVE and p is not self:
-                dist = (self.position - p.position).length()
-                if dist < 40 and dist > 0:
+                if not within(self.position, p.position, 40):
+                    continue
+                dist = self.position.distance_to(p.position)
+                if dist > 0:
                     push_dir = self.position - p.position
                     push_dir = push_dir.normalize()
                     push_strength = (40 - dist) / 40
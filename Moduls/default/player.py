@@ -1,12 +1,31 @@
 from typing import List, Optional
 
 from core import *
-from .bullet import Bullet
+from game_clock import get_ticks
 import pygame
 import math
 import random
 
 from .zombie import Zombie
+from spatial import SpatialHash
+from bullet_pool import BulletPool
+from render_cache import get_sprite, new_sprite_surface, render_text
+
+
+def build_body_sprite(color, size: int, label: Optional[str] = None) -> pygame.Surface:
+    """Square player/drone body, optionally with a centred label."""
+    surface = new_sprite_surface(size, size)
+    surface.fill(color)
+    if label is not None:
+        text = render_text(label, 16, WHITE)
+        surface.blit(text, text.get_rect(center=(size // 2, size // 2)))
+    return surface
+
+
+def build_protection_circle_sprite(radius) -> pygame.Surface:
+    circle_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(circle_surface, (135, 206, 235, 50), (radius, radius), radius)
+    return circle_surface
 
 
 class Player:
@@ -55,14 +74,15 @@ class Player:
         self.shooting = False
         self.target_zombie = None
 
-    def update(self, dt: float, power_ups: List, zombies: List[Zombie], other_players: List) -> List[Bullet]:
-        bullets = []
-        current_time = pygame.time.get_ticks()
+    def update(self, dt: float, power_ups: List, zombies: List[Zombie], other_players: List,
+               zombie_grid: Optional[SpatialHash], bullets: BulletPool,
+               now: Optional[int] = None):
+        current_time = get_ticks() if now is None else now
 
         # Handle downed state
         if self.state == PlayerState.DOWNED:
             self.update_downed_state(current_time, other_players)
-            return bullets
+            return
 
         # Handle invulnerability after revive
         if self.invulnerability_time > 0:
@@ -71,7 +91,7 @@ class Player:
                 self.invulnerability_time = 0
 
         if self.state == PlayerState.DEAD:
-            return bullets
+            return
         
         # Movement
         movement = Vector2(0, 0)
@@ -84,19 +104,18 @@ class Player:
         if self.move_right:
             movement.x += 1
 
-        if movement.length() > 0:
-            movement = movement.normalize()
-            self.position = self.position + movement * self.speed * dt
+        if movement.length_squared() > 0:
+            self.position.iadd(movement.normalize_ip(), self.speed * dt)
             
         # Auto-target nearest zombie
-        self.target_zombie = self.find_nearest_zombie(zombies)
+        self.target_zombie = self.find_nearest_zombie(zombies, zombie_grid)
 
         # Shooting with auto-aim
-        if self.shooting and self.can_fire() and self.target_zombie:
-            direction = (self.target_zombie.position - self.position)
-            if direction.length() > 0:
-                direction = direction.normalize()
-                bullets.append(self.create_bullet(direction))
+        if self.shooting and self.can_fire(current_time) and self.target_zombie:
+            direction = self.target_zombie.position - self.position
+            if direction.length_squared() > 0:
+                direction.normalize_ip()
+                self.fire_bullet(bullets, direction)
             # Dual pistols fire second bullet
             if self.weapon_type == WeaponType.DUAL_PISTOLS:
                 offset_angle = 0.1
@@ -105,7 +124,7 @@ class Player:
                     math.cos(angle + offset_angle),
                     math.sin(angle + offset_angle)
                 )
-                bullets.append(self.create_bullet(second_direction))
+                self.fire_bullet(bullets, second_direction)
 
             # Shot gun fire another bullet
             if self.weapon_type == WeaponType.SHOT_GUN:
@@ -117,36 +136,32 @@ class Player:
                     math.cos(angle - offset_angle),
                     math.sin(angle - offset_angle)
                 )
-                bullets.append(self.create_bullet(left_direction))
+                self.fire_bullet(bullets, left_direction)
 
                 # Right spread
                 right_direction = Vector2(
                     math.cos(angle + offset_angle),
                     math.sin(angle + offset_angle)
                 )
-                bullets.append(self.create_bullet(right_direction))
+                self.fire_bullet(bullets, right_direction)
 
-            self.last_fire_time = pygame.time.get_ticks()
+            self.last_fire_time = current_time
 
         # Update drone
         if self.drone:
             # Drone follows player with circular motion
-            offset_angle = pygame.time.get_ticks() * 0.001
-            offset = Vector2(math.cos(offset_angle) * 50, math.sin(offset_angle) * 50)
-            target_pos = self.position + offset
-            direction = (target_pos - self.drone.position)
-            if direction.length() > 0:
-                direction = direction.normalize()
-                self.drone.position = self.drone.position + direction * 150 * dt
+            offset_angle = current_time * 0.001
+            # Towards self.position + a 50 px orbit offset
+            direction = Vector2(math.cos(offset_angle) * 50, math.sin(offset_angle) * 50)
+            direction.iadd(self.position).isub(self.drone.position)
+            if direction.length_squared() > 0:
+                self.drone.position.iadd(direction.normalize_ip(), 150 * dt)
 
-            drone_bullets = self.drone.update(dt, self.position, zombies)
-            bullets.extend(drone_bullets)
+            self.drone.update(dt, self.position, zombies, zombie_grid, bullets, current_time)
 
         # Check level progression
         self.check_level_progression()
 
-        return bullets
-
     def update_downed_state(self, current_time: int, other_players: List):
         # Check if down timer expired
         if current_time - self.down_time >= self.down_timer_duration:
@@ -165,8 +180,7 @@ class Player:
 
         for other_player in other_players:
             if other_player.state == PlayerState.ALIVE and other_player.id != self.id:
-                distance = (self.position - other_player.position).length()
-                if distance <= self.protection_circle_radius:
+                if within_inclusive(self.position, other_player.position, self.protection_circle_radius):
                     self.being_revived = True
                     self.reviver_player = other_player
 
@@ -188,7 +202,7 @@ class Player:
             # If someone left the circle, deactivate protection
             any_player_in_circle = any(
                 other_player.state == PlayerState.ALIVE and
-                (self.position - other_player.position).length() <= self.protection_circle_radius
+                within_inclusive(self.position, other_player.position, self.protection_circle_radius)
                 for other_player in other_players if other_player.id != self.id
             )
             if not any_player_in_circle:
@@ -212,8 +226,8 @@ class Player:
             }
         return {'active': False, 'position': self.position, 'radius': 0}
 
-    def can_fire(self) -> bool:
-        current_time = pygame.time.get_ticks()
+    def can_fire(self, now: Optional[int] = None) -> bool:
+        current_time = get_ticks() if now is None else now
         fire_rates = {
             WeaponType.PISTOL: 1000,
             WeaponType.DUAL_PISTOLS: 500,
@@ -227,7 +241,7 @@ class Player:
         }
         return current_time - self.last_fire_time >= fire_rates[self.weapon_type]
 
-    def create_bullet(self, direction: Vector2) -> Bullet:
+    def fire_bullet(self, bullets: BulletPool, direction: Vector2) -> int:
         damages = {
             WeaponType.PISTOL: 7,
             WeaponType.DUAL_PISTOLS: 8,
@@ -239,27 +253,16 @@ class Player:
             WeaponType.MG_3: 17,
             WeaponType.MINI_GUN: 20
         }
-        return Bullet(self.position, direction, damages[self.weapon_type], self.id)
+        return bullets.fire(self.position, direction, damages[self.weapon_type], self.id)
 
-    def find_nearest_zombie(self, zombies: List[Zombie]) -> Optional[Zombie]:
-        if not zombies:
-            return None
-
-        active_zombies = [z for z in zombies if z.active]
-        if not active_zombies:
-            return None
+    def find_nearest_zombie(self, zombies: List[Zombie], zombie_grid: Optional[SpatialHash] = None) -> Optional[Zombie]:
+        if zombie_grid is None:
+            if not zombies:
+                return None
+            zombie_grid = SpatialHash.from_items(zombies)
 
         # Find zombie within range (300 units)
-        nearest_zombie = None
-        nearest_distance = 300
-
-        for zombie in active_zombies:
-            distance = (self.position - zombie.position).length()
-            if distance < nearest_distance:
-                nearest_zombie = zombie
-                nearest_distance = distance
-
-        return nearest_zombie
+        return zombie_grid.nearest(self.position.x, self.position.y, 300)
 
     def check_level_progression(self):
         kills_needed = 15 + random.randint(0, 15)
@@ -308,8 +311,8 @@ class Player:
         if self.drone:
             self.drone.add_kill()
 
-    def take_damage(self, damage: int):
-        current_time = pygame.time.get_ticks()
+    def take_damage(self, damage: int, now: Optional[int] = None):
+        current_time = get_ticks() if now is None else now
 
         # Check invulnerability
         if self.invulnerability_time > 0:
@@ -330,16 +333,17 @@ class Player:
             if self.health <= 0:
                 # ✅ Multiplayer rejimda downed holatiga o'tish
                 if self.can_go_down and self.multi_player_mode:
-                    self.go_down()
+                    self.go_down(current_time)
                 else:
                     self.state = PlayerState.DEAD
 
-    def go_down(self):
+    def go_down(self, now: Optional[int] = None):
         """Player goes down instead of dying immediately"""
+        current_time = get_ticks() if now is None else now
         self.state = PlayerState.DOWNED
-        self.down_time = pygame.time.get_ticks()
+        self.down_time = current_time
         self.protection_circle_active = True
-        self.protection_timer = pygame.time.get_ticks()
+        self.protection_timer = current_time
         self.revive_progress = 0
         self.being_revived = False
 
@@ -372,11 +376,9 @@ class Player:
                 int(self.position.y - camera.y)
             )
             pygame.draw.circle(screen, LIGHT_BLUE, circle_screen_pos, int(self.protection_circle_radius), 3)
-            circle_surface = pygame.Surface((self.protection_circle_radius * 2, self.protection_circle_radius * 2),
-                                            pygame.SRCALPHA)
-            pygame.draw.circle(circle_surface, (135, 206, 235, 50),
-                               (self.protection_circle_radius, self.protection_circle_radius),
-                               self.protection_circle_radius)
+            radius = self.protection_circle_radius
+            circle_surface = get_sprite(("protection_circle", radius),
+                                        lambda: build_protection_circle_sprite(radius))
             screen.blit(circle_surface, (circle_screen_pos[0] - self.protection_circle_radius,
                                          circle_screen_pos[1] - self.protection_circle_radius))
 
@@ -394,11 +396,10 @@ class Player:
             pygame.draw.rect(screen, WHITE,
                              (center_x - plus_size // 6, center_y - plus_size // 2, plus_size // 3, plus_size))
 
-            current_time = pygame.time.get_ticks()
+            current_time = get_ticks()
             time_left = max(0, self.down_timer_duration - (current_time - self.down_time))
             seconds_left = int(time_left / 1000)
-            font = pygame.font.Font(None, 24)
-            timer_text = font.render(str(seconds_left), True, RED)
+            timer_text = render_text(str(seconds_left), 24, RED)
             timer_rect = timer_text.get_rect(center=(center_x, screen_pos[1] - 10))
             screen.blit(timer_text, timer_rect)
 
@@ -414,9 +415,11 @@ class Player:
         # Draw alive player with invulnerability effect
         color = self.color
         if self.invulnerability_time > 0:
-            if int(pygame.time.get_ticks() / 100) % 2:
+            if int(get_ticks() / 100) % 2:
                 color = tuple(min(255, c + 100) for c in color)
-        pygame.draw.rect(screen, color, (*screen_pos, self.size, self.size))
+        color, size = tuple(color), self.size
+        body = get_sprite(("player", color, size), lambda: build_body_sprite(color, size))
+        screen.blit(body, screen_pos)
         
         # Draw weapon direction pointing to target
         if self.target_zombie and self.target_zombie.active:
@@ -480,7 +483,6 @@ class Player:
                           int(bar_width * shield_percent), bar_height))
 
     def render_level_indicator(self, screen, screen_pos):
-        font = pygame.font.Font(None, 24)
         level_text = f"LVL {self.level}"
 
         if self.level >= 999:
@@ -496,7 +498,7 @@ class Player:
         else:
             color = WHITE
 
-        text_surface = font.render(level_text, True, color)
+        text_surface = render_text(level_text, 24, color)
         text_rect = text_surface.get_rect()
         text_rect.centerx = screen_pos[0] + self.size // 2
         text_rect.bottom = screen_pos[1] - 5
@@ -517,41 +519,38 @@ class Drone:
         self.target = None
         self.size = 16
 
-    def update(self, dt: float, player_pos: Vector2, zombies: List[Zombie]) -> List[Bullet]:
-        bullets = []
+    def update(self, dt: float, player_pos: Vector2, zombies: List[Zombie],
+               zombie_grid: Optional[SpatialHash], bullets: BulletPool,
+               now: Optional[int] = None):
+        current_time = get_ticks() if now is None else now
 
         # Follow player with circular motion
-        offset_angle = pygame.time.get_ticks() * 0.001
-        offset = Vector2(math.cos(offset_angle) * 50, math.sin(offset_angle) * 50)
-        target_pos = player_pos + offset
-
-        direction = (target_pos - self.position).normalize()
-        self.position = self.position + direction * 150 * dt
+        offset_angle = current_time * 0.001
+        # Towards player_pos + a 50 px orbit offset
+        direction = Vector2(math.cos(offset_angle) * 50, math.sin(offset_angle) * 50)
+        direction.iadd(player_pos).isub(self.position)
+        self.position.iadd(direction.normalize_ip(), 150 * dt)
 
         # Find target
-        active_zombies = [z for z in zombies if z.active]
-        if active_zombies:
-            self.target = min(active_zombies,
-                              key=lambda z: (self.position - z.position).length())
+        if zombie_grid is None:
+            zombie_grid = SpatialHash.from_items(zombies)
+        nearest_zombie = zombie_grid.nearest(self.position.x, self.position.y)
+        if nearest_zombie is not None:
+            self.target = nearest_zombie
 
         # Attack target
         if self.target and self.target.active:
-            distance = (self.position - self.target.position).length()
-            current_time = pygame.time.get_ticks()
-
-            if distance <= 200:
+            if within_inclusive(self.position, self.target.position, 200):
                 if current_time - self.last_fire_time >= 1000:
                     shoot_direction = (self.target.position - self.position).normalize()
-                    bullets.append(Bullet(self.position, shoot_direction, 8, self.player_id, 300))
+                    bullets.fire(self.position, shoot_direction, 8, self.player_id, 300)
                     self.last_fire_time = current_time
 
                 if self.level >= 10 and current_time - self.last_rocket_time >= 5000:
                     shoot_direction = (self.target.position - self.position).normalize()
-                    bullets.append(Bullet(self.position, shoot_direction, 25, self.player_id, 200))
+                    bullets.fire(self.position, shoot_direction, 25, self.player_id, 200)
                     self.last_rocket_time = current_time
 
-        return bullets
-
     def add_kill(self):
         if random.random() < 0.1:
             self.level = min(self.level + 1, self.max_level)
@@ -563,10 +562,6 @@ class Drone:
         )
 
         color = ORANGE if self.level >= 10 else BLUE
-        pygame.draw.rect(screen, color, (*screen_pos, self.size, self.size))
-
-        font = pygame.font.Font(None, 16)
-        text = font.render(str(self.level), True, WHITE)
-        text_rect = text.get_rect(center=(screen_pos[0] + self.size // 2,
-                                          screen_pos[1] + self.size // 2))
-        screen.blit(text, text_rect)
\ No newline at end of file
+        label, size = str(self.level), self.size
+        body = get_sprite(("drone", color, label, size), lambda: build_body_sprite(color, size, label))
+        screen.blit(body, screen_pos)
\ No newline at end of file
@@ -6,9 +6,10 @@ import pygame
 
 from .helper_bot import safe_get, safe_int, safe_bool, safe_enum, HelperBot
 from .bot_ai import BotState
+from autosave import AUTOSAVER, replace_atomically
 from core import Vector2, WeaponType, PlayerState, GameMode
 from .player import Player, Drone
-from .world import World, PowerUp, WorldObject
+from .world import World, PowerUp, ChunkDelta, CHUNK_SIZE, DEFAULT_WORLD_SEED
 from .zombie import Zombie, ZombieType
 
 # Savlarni Documents/Unknown_World/saves/(modul_nomi)/ da saqlaymiz
@@ -21,10 +22,46 @@ SAVE_ROOT = DOCUMENTS_PATH
 AUTOSAVE_PATH = os.path.join(SAVE_ROOT, "autosave.db")
 
 
+# save_game writes everything in one transaction of executemany batches,
+# reusing the prepared INSERT statements below. WAL with synchronous=NORMAL
+# only syncs at checkpoints, and an interrupted save still leaves the
+# previous one readable.
+SAVE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+)
+SAVE_TABLES = ("player", "zombie", "world", "chunk_delta", "world_object", "powerup", "summary", "meta")
+INSERT_PLAYER = "INSERT INTO player VALUES (" + ", ".join(["?"] * 29) + ")"
+INSERT_ZOMBIE = """
+    INSERT INTO zombie (
+        id, position_x, position_y, strength, health, max_health, speed, size, last_attack_time, active, type
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+INSERT_WORLD = "INSERT INTO world VALUES (1, ?)"
+INSERT_CHUNK_DELTA = "INSERT INTO chunk_delta VALUES (?, ?, ?, ?)"
+INSERT_WORLD_OBJECT = """
+    INSERT INTO world_object (
+        position_x, position_y, size_x, size_y, type, color
+    ) VALUES (?, ?, ?, ?, ?, ?)
+"""
+INSERT_POWERUP = """
+    INSERT INTO powerup (
+        id, position_x, position_y, type, size, active
+    ) VALUES (?, ?, ?, ?, ?, ?)
+"""
+INSERT_SUMMARY = "INSERT INTO summary VALUES (1, ?, ?, ?, ?, ?)"
+INSERT_META = "INSERT INTO meta VALUES (1, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+# load_game_data reads these tables LOAD_BATCH rows at a time and reports
+# progress as the share of their rows read so far
+LOAD_BATCH = 1000
+LOAD_TABLES = ("player", "zombie", "world_object", "powerup")
+
+
 def get_save_path(save_name, modul_name="default"):
     """Modul nomiga qarab save yo'lini qaytaradi"""
     modul_save_root = os.path.join(SAVE_ROOT, modul_name)
-    os.makedirs(modul_save_root, exist_ok=True)
     if save_name == "autosave":
         return os.path.join(modul_save_root, "autosave.db")
     return os.path.join(modul_save_root, f"{save_name}.db")
@@ -35,10 +72,14 @@ def get_last_session_path(game_mode, modul_name="default"):
 
 
 def save_last_session(game, modul_name="default"):
-    db_path = get_save_path("autosave", modul_name)
-    if os.path.exists(db_path):
-        os.remove(db_path)
-    save_game(game, "autosave", game.mode, modul_name)
+    """Write the autosave now; a temporary file is renamed over the old one."""
+    snapshot = snapshot_game(game)
+    replace_atomically(get_save_path("autosave", modul_name), lambda tmp_path: write_snapshot(tmp_path, snapshot))
+
+
+def autosave(game, modul_name="default"):
+    """Snapshot `game` on this thread and write the autosave in the background."""
+    AUTOSAVER.submit(get_save_path("autosave", modul_name), write_snapshot, snapshot_game(game))
 
 
 def create_tables(conn):
@@ -71,6 +112,23 @@ def create_tables(conn):
             type TEXT
         )
     ''')
+    # Scenery is regenerated from the world seed; a save only keeps what
+    # changed per chunk: removed generated objects here and placed objects
+    # in world_object. Saves without a world row store every object in
+    # world_object instead.
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS world (
+            id INTEGER PRIMARY KEY,
+            seed INTEGER
+        )
+    ''')
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS chunk_delta (
+            chunk_x INTEGER, chunk_y INTEGER,
+            replaced INTEGER, removed TEXT,
+            PRIMARY KEY (chunk_x, chunk_y)
+        )
+    ''')
     c.execute('''
         CREATE TABLE IF NOT EXISTS world_object (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -94,7 +152,22 @@ def create_tables(conn):
             is_night INTEGER, zombie_strength INTEGER,
             last_zombie_spawn INTEGER, next_power_up_time INTEGER,
             loaded_chunks TEXT,
-            zombie_kills_by_type TEXT
+            zombie_kills_by_type TEXT,
+            clock_time INTEGER
+        )
+    ''')
+    # Saved timestamps are on the engine clock, which starts at 0 for every
+    # engine; clock_time is where that clock stood (older saves lack it)
+    meta_columns = [row[1] for row in c.execute("PRAGMA table_info(meta)")]
+    if "clock_time" not in meta_columns:
+        c.execute("ALTER TABLE meta ADD COLUMN clock_time INTEGER")
+    # What the Load menu shows, read without loading the save (see save_index)
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS summary (
+            id INTEGER PRIMARY KEY,
+            players INTEGER, bots INTEGER,
+            game_time INTEGER, current_day INTEGER,
+            saved_at REAL
         )
     ''')
     conn.commit()
@@ -103,125 +176,164 @@ def create_tables(conn):
 def save_game(game, save_name, game_mode, modul_name="default"):
     print(f"[save_game][default] Saving '{save_name}' for module '{modul_name}' (players: {len(getattr(game, 'players', []))})")
     db_path = get_save_path(save_name, modul_name)
-    if os.path.exists(db_path):
-        conn = sqlite3.connect(db_path)
-        c = conn.cursor()
-        c.execute("DELETE FROM player")
-        c.execute("DELETE FROM zombie")
-        c.execute("DELETE FROM world_object")
-        c.execute("DELETE FROM powerup")
-        c.execute("DELETE FROM meta")
-        conn.commit()
-        conn.close()
+    start = time.perf_counter()
+    write_snapshot(db_path, snapshot_game(game))
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"[INFO] O'yin '{save_name}' DB holatda saqlandi: {db_path} ({elapsed_ms:.0f} ms)")
+
+
+def write_snapshot(db_path, snapshot):
+    """Write a snapshot_game() result to `db_path`; safe to call from a worker thread."""
+    # get_save_path only joins paths (the Load menu calls it every frame),
+    # so the module's save directory is created here, on the first save
+    os.makedirs(os.path.dirname(db_path), exist_ok=True)
     conn = sqlite3.connect(db_path)
-    create_tables(conn)
-    c = conn.cursor()
+    try:
+        for pragma in SAVE_PRAGMAS:
+            conn.execute(pragma)
+        create_tables(conn)
+        # One transaction: a save that fails part-way leaves the previous one intact
+        with conn:
+            _write_rows(conn.cursor(), snapshot)
+    finally:
+        conn.close()
 
-    # Playerlar
-    for idx, player in enumerate(game.players):
-        drone_json = None
-        if player.drone:
-            drone_json = json.dumps({
-                "position": [player.drone.position.x, player.drone.position.y],
-                "level": player.drone.level,
-                "max_level": player.drone.max_level,
-                "player_id": player.drone.player_id,
-                "last_fire_time": player.drone.last_fire_time,
-                "last_rocket_time": player.drone.last_rocket_time,
-                "size": player.drone.size
-            })
-        player_type = "bot" if isinstance(player, HelperBot) else "player"
-        player_color = list(getattr(player, "color", (200, 200, 200)))
-        
-        bot_ai_json = None
-        if isinstance(player, HelperBot) and hasattr(player, 'ai') and player.ai:
-            bot_ai_json = json.dumps({
-                "state": player.ai.state.value,
-                "previous_state": player.ai.previous_state.value,
-                "state_timer": player.ai.state_timer,
-                "follow_distance": player.ai.follow_distance,
-                "attack_range": player.ai.attack_range,
-                "escape_range": player.ai.escape_range,
-                "protect_range": player.ai.protect_range,
-                "revive_range": player.ai.revive_range,
-                "aggression": player.ai.aggression,
-                "caution": player.ai.caution,
-                "loyalty": player.ai.loyalty,
-                "base_speed": getattr(player, 'base_speed', 130)
-            })
-        
-        c.execute('''
-            INSERT INTO player VALUES (
-                ?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,
-                ?,?
+
+def _player_row(idx, player):
+    drone_json = None
+    if player.drone:
+        drone_json = json.dumps({
+            "position": [player.drone.position.x, player.drone.position.y],
+            "level": player.drone.level,
+            "max_level": player.drone.max_level,
+            "player_id": player.drone.player_id,
+            "last_fire_time": player.drone.last_fire_time,
+            "last_rocket_time": player.drone.last_rocket_time,
+            "size": player.drone.size
+        })
+    player_type = "bot" if isinstance(player, HelperBot) else "player"
+    player_color = list(getattr(player, "color", (200, 200, 200)))
+    
+    bot_ai_json = None
+    if isinstance(player, HelperBot) and hasattr(player, 'ai') and player.ai:
+        bot_ai_json = json.dumps({
+            "state": player.ai.state.value,
+            "previous_state": player.ai.previous_state.value,
+            "state_timer": player.ai.state_timer,
+            "follow_distance": player.ai.follow_distance,
+            "attack_range": player.ai.attack_range,
+            "escape_range": player.ai.escape_range,
+            "protect_range": player.ai.protect_range,
+            "revive_range": player.ai.revive_range,
+            "aggression": player.ai.aggression,
+            "caution": player.ai.caution,
+            "loyalty": player.ai.loyalty,
+            "base_speed": getattr(player, 'base_speed', 130)
+        })
+    
+    return (
+        idx,
+        player.position.x, player.position.y,
+        player.health, player.max_health, player.shield, player.max_shield,
+        player.level, player.zombie_kills,
+        player.weapon_type.name, player.ammo, player.state.name,
+        player.down_time, player.down_timer_duration,
+        int(player.protection_circle_active), player.protection_circle_radius,
+        player.protection_timer, player.protection_duration,
+        player.revive_progress, player.revive_duration, int(player.being_revived),
+        player.invulnerability_time, player.invulnerability_duration,
+        player.last_fire_time, player.last_damage_time,
+        drone_json,
+        player_type,
+        json.dumps(player_color),
+        bot_ai_json
+    )
+
+
+def snapshot_game(game):
+    """
+    Everything save_game writes, copied into plain row tuples on the calling
+    thread. Placed world objects never change, so only the delta lists are
+    copied and the writer builds their rows.
+    """
+    world = game.world
+    return {
+        "players": [_player_row(idx, player) for idx, player in enumerate(game.players)],
+        "zombies": [
+            (
+                zombie.entity_id, zombie.position.x, zombie.position.y, zombie.strength, zombie.health,
+                zombie.max_health, zombie.speed, zombie.size, zombie.last_attack_time, int(zombie.active),
+                zombie.type.value
             )
-        ''', (
-            idx,
-            player.position.x, player.position.y,
-            player.health, player.max_health, player.shield, player.max_shield,
-            player.level, player.zombie_kills,
-            player.weapon_type.name, player.ammo, player.state.name,
-            player.down_time, player.down_timer_duration,
-            int(player.protection_circle_active), player.protection_circle_radius,
-            player.protection_timer, player.protection_duration,
-            player.revive_progress, player.revive_duration, int(player.being_revived),
-            player.invulnerability_time, player.invulnerability_duration,
-            player.last_fire_time, player.last_damage_time,
-            drone_json,
-            player_type,
-            json.dumps(player_color),
-            bot_ai_json
-        ))
+            for zombie in game.zombies
+        ],
+        "world": (world.seed,),
+        "chunk_deltas": [
+            (chunk_x, chunk_y, int(delta.replaced), json.dumps(sorted(delta.removed)))
+            for (chunk_x, chunk_y), delta in world.chunk_deltas.items()
+            if delta.replaced or delta.removed
+        ],
+        "placed_objects": [tuple(delta.added) for delta in world.chunk_deltas.values() if delta.added],
+        # Loaded rows whose chunk was never used are saved as they are
+        "placed_rows": [tuple(delta.rows) for delta in world.chunk_deltas.values() if delta.rows],
+        "power_ups": [
+            (p.entity_id, p.position.x, p.position.y, p.type, p.size, int(p.active))
+            for p in game.world.power_ups
+        ],
+        "meta": (
+            game.mode.name,
+            game.camera.x, game.camera.y,
+            game.game_time, game.zombies_killed, game.current_day,
+            int(game.is_night), game.zombie_strength,
+            game.last_zombie_spawn, game.next_power_up_time,
+            json.dumps(list(game.world.loaded_chunks)),
+            json.dumps(getattr(game, "zombie_kills_by_type", {})),
+            game.now
+        ),
+        "summary": (
+            sum(1 for player in game.players if not isinstance(player, HelperBot)),
+            sum(1 for player in game.players if isinstance(player, HelperBot)),
+            game.game_time, game.current_day, time.time()
+        ),
+    }
+
+
+def _write_rows(c, snapshot):
+    for table in SAVE_TABLES:
+        c.execute(f"DELETE FROM {table}")
+
+    # Playerlar
+    c.executemany(INSERT_PLAYER, snapshot["players"])
 
     # Zombielar
-    for zombie in game.zombies:
-        c.execute('''
-            INSERT INTO zombie (
-                position_x, position_y, strength, health, max_health, speed, size, last_attack_time, active, type
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            zombie.position.x, zombie.position.y, zombie.strength, zombie.health, zombie.max_health,
-            zombie.speed, zombie.size, zombie.last_attack_time, int(zombie.active), zombie.type.value
-        ))
-
-    # World Objects
-    for obj in game.world.objects:
-        c.execute('''
-            INSERT INTO world_object (
-                position_x, position_y, size_x, size_y, type, color
-            ) VALUES (?, ?, ?, ?, ?, ?)
-        ''', (
-            obj.position.x, obj.position.y, obj.size.x, obj.size.y, obj.type, json.dumps(list(obj.color))
-        ))
+    c.executemany(INSERT_ZOMBIE, snapshot["zombies"])
 
-    # PowerUps
-    for p in game.world.power_ups:
-        c.execute('''
-            INSERT INTO powerup (
-                position_x, position_y, type, size, active
-            ) VALUES (?, ?, ?, ?, ?)
-        ''', (
-            p.position.x, p.position.y, p.type, p.size, int(p.active)
-        ))
+    # World: seed and per-chunk deltas
+    c.execute(INSERT_WORLD, snapshot["world"])
+    c.executemany(INSERT_CHUNK_DELTA, snapshot["chunk_deltas"])
 
-    # Meta
-    c.execute('''
-        INSERT INTO meta VALUES (
-            1, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
-        )
-    ''', (
-        game.mode.name,
-        game.camera.x, game.camera.y,
-        game.game_time, game.zombies_killed, game.current_day,
-        int(game.is_night), game.zombie_strength,
-        game.last_zombie_spawn, game.next_power_up_time,
-        json.dumps(list(game.world.loaded_chunks)),
-        json.dumps(getattr(game, "zombie_kills_by_type", {}))
+    # Placed world objects: a world has only a few distinct colours, so each is JSON-encoded once
+    color_json = {}
+
+    def object_row(x, y, width, height, obj_type, color):
+        color = tuple(color)
+        encoded = color_json.get(color)
+        if encoded is None:
+            encoded = color_json[color] = json.dumps(list(color))
+        return x, y, width, height, obj_type, encoded
+
+    c.executemany(INSERT_WORLD_OBJECT, (
+        object_row(obj.position.x, obj.position.y, obj.size.x, obj.size.y, obj.type, obj.color)
+        for placed in snapshot["placed_objects"] for obj in placed
     ))
+    c.executemany(INSERT_WORLD_OBJECT, (object_row(*row) for rows in snapshot["placed_rows"] for row in rows))
 
-    conn.commit()
-    conn.close()
-    print(f"[INFO] O'yin '{save_name}' DB holatda saqlandi: {db_path}")
+    # PowerUps
+    c.executemany(INSERT_POWERUP, snapshot["power_ups"])
+
+    # Meta
+    c.execute(INSERT_META, snapshot["meta"])
+    c.execute(INSERT_SUMMARY, snapshot["summary"])
 
 
 def load_last_session():
@@ -259,6 +371,33 @@ def try_load_game_any_mode(save_name, modul_name="default"):
     return None, None
 
 
+class LoadProgress:
+    """Turns rows read into progress_callback percentages."""
+    def __init__(self, callback, total_rows):
+        self.callback = callback
+        self.total_rows = max(1, total_rows)
+        self.rows = 0
+        self.percent = -1
+
+    def advance(self, rows):
+        self.rows += rows
+        percent = min(100, self.rows * 100 // self.total_rows)
+        if self.callback and percent != self.percent:
+            self.percent = percent
+            self.callback(percent)
+
+
+def _iter_rows(c, query, progress):
+    """Yield the rows of `query` from a cursor, one LOAD_BATCH at a time."""
+    cursor = c.execute(query)
+    while True:
+        rows = cursor.fetchmany(LOAD_BATCH)
+        if not rows:
+            return
+        yield from rows
+        progress.advance(len(rows))
+
+
 def load_game_data(save_name, progress_callback=None, modul_name="default"):
     db_path = get_save_path(save_name, modul_name)
     print("[DEBUG] DB path:", db_path)
@@ -270,8 +409,6 @@ def load_game_data(save_name, progress_callback=None, modul_name="default"):
     conn = sqlite3.connect(db_path)
     c = conn.cursor()
     data = {}
-    total = 5
-    step = 0
 
     # Meta
     meta = c.execute('SELECT * FROM meta WHERE id=1').fetchone()
@@ -284,7 +421,8 @@ def load_game_data(save_name, progress_callback=None, modul_name="default"):
         _, mode, camera_x, camera_y, game_time, zombies_killed, current_day,
         is_night, zombie_strength, last_zombie_spawn, next_power_up_time,
         loaded_chunks_json, zombie_kills_by_type_json
-    ) = meta
+    ) = meta[:13]
+    clock_time = meta[13] if len(meta) > 13 else None
     data["meta"] = {
         "mode": mode,
         "camera": [camera_x, camera_y],
@@ -295,6 +433,7 @@ def load_game_data(save_name, progress_callback=None, modul_name="default"):
         "zombie_strength": zombie_strength,
         "last_zombie_spawn": last_zombie_spawn,
         "next_power_up_time": next_power_up_time,
+        "clock_time": clock_time,
     }
     try:
         data["meta"]["zombie_kills_by_type"] = json.loads(
@@ -306,13 +445,12 @@ def load_game_data(save_name, progress_callback=None, modul_name="default"):
     except Exception:
         data["meta"]["loaded_chunks"] = []
 
-    step += 1
-    if progress_callback:
-        progress_callback(int(step * 100 / total))
+    total_rows = sum(c.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0] for table in LOAD_TABLES)
+    progress = LoadProgress(progress_callback, total_rows)
 
     # Playerlar
     player_data = []
-    player_rows = c.execute('SELECT * FROM player ORDER BY id ASC').fetchall()
+    player_rows = list(_iter_rows(c, 'SELECT * FROM player ORDER BY id ASC', progress))
     print("[DEBUG] player rows:", player_rows)
     for row in player_rows:
         if len(row) >= 29:
@@ -366,19 +504,17 @@ def load_game_data(save_name, progress_callback=None, modul_name="default"):
         }
         player_data.append(pdata)
     data["player"] = player_data
-    step += 1
-    if progress_callback:
-        progress_callback(int(step * 100 / total))
 
     # Zombielar
     zombies_data = []
-    for row in c.execute('SELECT * FROM zombie').fetchall():
+    for row in _iter_rows(c, 'SELECT * FROM zombie', progress):
         (
-            _, px, py, strength, health, max_health, speed, size,
+            zombie_id, px, py, strength, health, max_health, speed, size,
             last_attack_time, active, ztype_str
         ) = row
         ztype = ZombieType(ztype_str) if ztype_str else ZombieType.WALKER
         zombies_data.append({
+            "id": zombie_id,
             "position": [px, py],
             "strength": strength,
             "health": health,
@@ -390,31 +526,34 @@ def load_game_data(save_name, progress_callback=None, modul_name="default"):
             "type": ztype.value
         })
     data["zombies"] = zombies_data
-    step += 1
-    if progress_callback:
-        progress_callback(int(step * 100 / total))
-
-    # World Objects
-    world_objects_data = []
-    for row in c.execute('SELECT * FROM world_object').fetchall():
-        _, px, py, sx, sy, otype, color = row
-        color_tuple = json.loads(color)
-        world_objects_data.append({
-            "position": [px, py],
-            "size": [sx, sy],
-            "type": otype,
-            "color": color_tuple
-        })
-    data["worldObjects"] = world_objects_data
-    step += 1
-    if progress_callback:
-        progress_callback(int(step * 100 / total))
+
+    # World Objects: rows grouped by chunk, built into objects when their chunk is used
+    chunk_objects = {}
+    colors = {}
+    for _, px, py, sx, sy, otype, color in _iter_rows(c, 'SELECT * FROM world_object', progress):
+        color_tuple = colors.get(color)
+        if color_tuple is None:
+            color_tuple = colors[color] = tuple(json.loads(color))
+        key = (int(px // CHUNK_SIZE), int(py // CHUNK_SIZE))
+        chunk_objects.setdefault(key, []).append((px, py, sx, sy, otype, color_tuple))
+
+    try:
+        world_row = c.execute('SELECT seed FROM world WHERE id=1').fetchone()
+        delta_rows = c.execute('SELECT * FROM chunk_delta').fetchall()
+    except sqlite3.OperationalError:
+        # Saved before chunk deltas: world_object holds every object
+        world_row, delta_rows = None, []
+    chunk_deltas_data = [
+        {"chunk": [chunk_x, chunk_y], "replaced": bool(replaced), "removed": json.loads(removed)}
+        for chunk_x, chunk_y, replaced, removed in delta_rows
+    ]
 
     # PowerUps
     power_ups_data = []
-    for row in c.execute('SELECT * FROM powerup').fetchall():
-        _, px, py, ptype, size, active = row
+    for row in _iter_rows(c, 'SELECT * FROM powerup', progress):
+        powerup_id, px, py, ptype, size, active = row
         power_ups_data.append({
+            "id": powerup_id,
             "position": [px, py],
             "type": ptype,
             "size": size,
@@ -423,16 +562,26 @@ def load_game_data(save_name, progress_callback=None, modul_name="default"):
     world = {}
     world["power_ups"] = power_ups_data
     world["loaded_chunks"] = data.get("meta", {}).get("loaded_chunks", [])
+    world["seed"] = world_row[0] if world_row else None
+    world["chunk_deltas"] = chunk_deltas_data
+    world["chunk_objects"] = chunk_objects
     data["world"] = world
 
-    step += 1
-    if progress_callback:
-        progress_callback(int(step * 100 / total))
-
     conn.close()
     return data
 
 
+def _latest_timestamp(game):
+    """Newest timestamp restored from a save: where its engine clock stood at least."""
+    times = [game.game_time]
+    for player in game.players:
+        times += [player.last_fire_time, player.last_damage_time, player.down_time, player.protection_timer]
+        if player.drone:
+            times += [player.drone.last_fire_time, player.drone.last_rocket_time]
+    times += [int(zombie.last_attack_time) for zombie in game.zombies]
+    return max(times)
+
+
 def load_from_data(game, data):
     # --- Playerlar ---
     game.players.clear()
@@ -554,32 +703,38 @@ def load_from_data(game, data):
         zombie.size = safe_int(safe_get(zdata, "size", 20))
         zombie.last_attack_time = safe_int(safe_get(zdata, "last_attack_time", 0))
         zombie.active = safe_bool(safe_get(zdata, "active", True))
+        zombie.entity_id = zdata.get("id")
         game.zombies.append(zombie)
 
     # --- World ---
+    # Scenery is regenerated from the seed as chunks are needed and each
+    # chunk's delta is applied then, so only the start area is built here
     world_data = data.get("world", {})
-    game.world = World()
+    seed = world_data.get("seed")
+    chunk_deltas = {}
+    for d in world_data.get("chunk_deltas", []):
+        chunk_deltas[tuple(d["chunk"])] = ChunkDelta(removed=set(d.get("removed", [])),
+                                                     replaced=safe_bool(d.get("replaced", False)))
+    for key, rows in world_data.get("chunk_objects", {}).items():
+        delta = chunk_deltas.setdefault(key, ChunkDelta())
+        delta.rows = rows
+        if seed is None:
+            # Saved before chunk deltas: the rows are the chunk's whole scenery
+            delta.replaced = True
+    game.world = World(seed=DEFAULT_WORLD_SEED if seed is None else safe_int(seed), chunk_deltas=chunk_deltas)
 
     # PowerUps
     game.world.power_ups.clear()
     for p in world_data.get("power_ups", []):
         powerup = PowerUp(Vector2(*safe_get(p, "position", [0, 0])), safe_get(p, "type", "unknown"), size=safe_int(safe_get(p, "size", 20)))
         powerup.active = safe_bool(safe_get(p, "active", True))
+        powerup.entity_id = p.get("id")
         game.world.power_ups.append(powerup)
     
-    game.world.loaded_chunks = set(world_data.get("loaded_chunks", []))
-
-    # WorldObjects
-    game.world.objects.clear()
-    world_objects_data = data.get("worldObjects", [])
-    for o in world_objects_data:
-        obj = WorldObject(
-            Vector2(*safe_get(o, "position", [0, 0])),
-            Vector2(*safe_get(o, "size", [20, 20])),
-            safe_get(o, "type", "unknown"),
-            tuple(safe_get(o, "color", [255, 255, 255]))
-        )
-        game.world.objects.append(obj)
+    # The chunks around the players are built now, the ones loaded at save
+    # time follow on the background generator
+    game.world.generate_near([p.position for p in game.players])
+    game.world.request_chunks(world_data.get("loaded_chunks", []))
 
     # --- Meta ---
     meta = data.get("meta", {})
@@ -599,10 +754,17 @@ def load_from_data(game, data):
     game.is_night = meta.get("is_night", False)
     game.zombie_strength = meta.get("zombie_strength", 1)
 
-    # Timers
-    game.last_zombie_spawn = pygame.time.get_ticks()
-    game.next_power_up_time = pygame.time.get_ticks() + 5000
-    game.game_start_time = pygame.time.get_ticks()
+    # Timers: the restored timestamps are on the saving engine's clock, so
+    # this engine's clock continues from where that one stood
+    clock_time = meta.get("clock_time")
+    if clock_time is None:
+        clock_time = _latest_timestamp(game)
+    game.game_clock.reset(clock_time)
+    game.now = clock_time
+    game.last_zombie_spawn = clock_time
+    game.next_power_up_time = clock_time + 5000
+    game.game_start_time = clock_time - game.game_time
+    game.last_autosave_time = game.game_time
 
     # Ensure engine state is PLAYING
     try:
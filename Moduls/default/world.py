@@ -1,16 +1,69 @@
 import math
+import queue
 import random
-from typing import List
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
 
 import pygame
 
 from core import Vector2, BACKGROUND_COLOR
+from entities import EntityList
+from game_clock import get_ticks
 
 TREE_GREEN = (34, 139, 34)
 BROWN = (139, 69, 19)
 WHITE = (255, 255, 255)
 ROCK_GRAY = (150, 150, 150)
 
+# Chunks kept in memory before far-away ones are dropped. The 5x5 start
+# area plus the 3x3 around each player always fit; evicted chunks are
+# regenerated from their seed when a player comes back.
+DEFAULT_MAX_RESIDENT_CHUNKS = 64
+
+# Every world uses the same layout unless a seed is given
+DEFAULT_WORLD_SEED = 0
+CHUNK_SIZE = 1000
+
+# Background pre-generation: chunks around where each player will be this
+# many update() ticks from now are built on a worker thread, and at most
+# CHUNKS_PER_UPDATE finished chunks are merged into the world per tick.
+PREDICT_TICKS = 90
+CHUNKS_PER_UPDATE = 1
+
+# Pre-rendered chunk surfaces kept for drawing. Each is about 4 MB, and a
+# 1920x1080 view touches at most 6 chunks.
+DEFAULT_SURFACE_CACHE_SIZE = 9
+# Scenery may stick out past the right/bottom chunk edge by its size
+CHUNK_SURFACE_PAD = 32
+SURFACE_COLORKEY = (255, 0, 255)
+
+_chunk_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_chunk_executor() -> ThreadPoolExecutor:
+    """Worker shared by every World, started on first use."""
+    global _chunk_executor
+    if _chunk_executor is None:
+        _chunk_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chunk-gen")
+    return _chunk_executor
+
+MASK64 = (1 << 64) - 1
+
+
+def _splitmix64(value: int) -> int:
+    value = (value + 0x9E3779B97F4A7C15) & MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK64
+    return value ^ (value >> 31)
+
+
+def chunk_seed(world_seed: int, chunk_x: int, chunk_y: int) -> int:
+    """Hash the world seed and chunk coordinates into a 64-bit seed."""
+    value = _splitmix64(world_seed & MASK64)
+    value = _splitmix64(value ^ (chunk_x & MASK64))
+    return _splitmix64(value ^ (chunk_y & MASK64))
+
 
 class WorldObject:
     def __init__(self, position: Vector2, size: Vector2, obj_type: str, color):
@@ -18,6 +71,8 @@ class WorldObject:
         self.size = size
         self.type = obj_type
         self.color = color
+        # Index in its chunk's generate_chunk_objects() list; None once placed by hand
+        self.generated_index: Optional[int] = None
 
     def render(self, screen, camera):
         screen_pos = (
@@ -78,6 +133,81 @@ class WorldObject:
                          (*screen_pos, int(self.size.x), int(self.size.y)))
 
 
+def generate_chunk_objects(world_seed: int, chunk_x: int, chunk_y: int,
+                           chunk_size: int) -> List[WorldObject]:
+    """
+    Build the trees and rocks of one chunk. Uses its own Random instance,
+    so the result only depends on the arguments and it is safe to call
+    from any thread.
+    """
+    rng = random.Random(chunk_seed(world_seed, chunk_x, chunk_y))
+    base_x = chunk_x * chunk_size
+    base_y = chunk_y * chunk_size
+    chunk_objects = []
+
+    # Generate trees (archa)
+    tree_count = 30 + rng.randint(0, 20)
+    for _ in range(tree_count):
+        chunk_objects.append(WorldObject(
+            Vector2(base_x + rng.random() * chunk_size,
+                    base_y + rng.random() * chunk_size),
+            Vector2(18 + rng.random() * 6, 22 + rng.random() * 6),  # a bit smaller than before
+            "tree",
+            TREE_GREEN
+        ))
+
+    # Generate rocks (used to be house)
+    rock_count = 2 + rng.randint(0, 3)
+    for _ in range(rock_count):
+        chunk_objects.append(WorldObject(
+            Vector2(base_x + rng.random() * chunk_size,
+                    base_y + rng.random() * chunk_size),
+            Vector2(13 + rng.random() * 7, 14 + rng.random() * 7),  # smaller than tree
+            "rock",
+            ROCK_GRAY
+        ))
+
+    for index, obj in enumerate(chunk_objects):
+        obj.generated_index = index
+    return chunk_objects
+
+
+class ChunkDelta:
+    """
+    What changed in one chunk since it was generated: objects placed on it
+    and the generated_index of every generated object removed from it.
+    A `replaced` chunk ignores its generated scenery and holds only `added`
+    (worlds loaded from saves that stored every object).
+    Saves keep the world seed and these deltas instead of the scenery.
+    A loaded save's placed objects stay as `rows` until the chunk is used.
+    """
+    def __init__(self, added: Optional[List[WorldObject]] = None, removed: Optional[Set[int]] = None,
+                 replaced: bool = False, rows: Optional[List[tuple]] = None):
+        self.added = added if added is not None else []
+        self.removed = removed if removed is not None else set()
+        self.replaced = replaced
+        # (x, y, width, height, type, color) of placed objects not built yet
+        self.rows = rows if rows is not None else []
+
+    def hydrate(self) -> List[WorldObject]:
+        """Build the objects still waiting in `rows` and return `added`."""
+        if self.rows:
+            self.added.extend(WorldObject(Vector2(x, y), Vector2(width, height), obj_type, color)
+                              for x, y, width, height, obj_type, color in self.rows)
+            self.rows = []
+        return self.added
+
+    def apply(self, generated: List[WorldObject]) -> List[WorldObject]:
+        self.hydrate()
+        if self.replaced:
+            kept = []
+        elif self.removed:
+            kept = [obj for obj in generated if obj.generated_index not in self.removed]
+        else:
+            kept = list(generated)
+        return kept + self.added
+
+
 class PowerUp:
     def __init__(self, position: Vector2, type_: str = "unknown", size: int = 20):
         self.position = position
@@ -95,7 +225,7 @@ class PowerUp:
         )
 
         # Pulsing effect
-        pulse = abs(math.sin(pygame.time.get_ticks() * 0.005)) * 0.3 + 0.7
+        pulse = abs(math.sin(get_ticks() * 0.005)) * 0.3 + 0.7
         color = (int(0 * pulse), int(255 * pulse), int(0 * pulse))
 
         pygame.draw.rect(screen, color, (*screen_pos, self.size, self.size))
@@ -107,14 +237,122 @@ class PowerUp:
                          (screen_pos[0] + 6, screen_pos[1] + 2, 4, 12))
 
 
+class ChunkSurfaceCache:
+    """
+    LRU cache of chunk scenery rasterized into off-screen surfaces.
+    Trees and rocks never move, so a visible chunk costs one blit instead
+    of 2-4 draw calls per object.
+    """
+    def __init__(self, chunk_size: int, max_surfaces: int = DEFAULT_SURFACE_CACHE_SIZE):
+        self.chunk_size = chunk_size
+        self.max_surfaces = max_surfaces
+        self.surfaces: "OrderedDict[Tuple[int, int], pygame.Surface]" = OrderedDict()
+
+    def get(self, key: Tuple[int, int], chunk_objects: List[WorldObject]) -> pygame.Surface:
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+        surface = self.rasterize(key, chunk_objects)
+        self.surfaces[key] = surface
+        while len(self.surfaces) > self.max_surfaces:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def rasterize(self, key: Tuple[int, int], chunk_objects: List[WorldObject]) -> pygame.Surface:
+        size = self.chunk_size + CHUNK_SURFACE_PAD
+        surface = pygame.Surface((size, size))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        surface.fill(SURFACE_COLORKEY)
+        surface.set_colorkey(SURFACE_COLORKEY, pygame.RLEACCEL)
+        origin = Vector2(key[0] * self.chunk_size, key[1] * self.chunk_size)
+        for obj in chunk_objects:
+            obj.render(surface, origin)
+        return surface
+
+    def invalidate(self, key: Tuple[int, int]):
+        self.surfaces.pop(key, None)
+
+    def clear(self):
+        self.surfaces.clear()
+
+
 class World:
-    def __init__(self):
-        self.objects = []
-        self.power_ups = []
-        self.chunk_size = 1000
+    def __init__(self, max_resident_chunks: int = DEFAULT_MAX_RESIDENT_CHUNKS,
+                 seed: int = DEFAULT_WORLD_SEED, pregenerate: bool = True,
+                 surface_cache_size: int = DEFAULT_SURFACE_CACHE_SIZE,
+                 chunk_deltas: Optional[Dict[Tuple[int, int], ChunkDelta]] = None):
+        self.seed = seed
+        # World objects bucketed by (chunk_x, chunk_y) so rendering only
+        # visits the chunks on screen
+        self.chunks: Dict[Tuple[int, int], List[WorldObject]] = {}
+        # Changes to generated scenery, kept while a chunk is evicted and
+        # reapplied whenever it is generated again
+        self.chunk_deltas: Dict[Tuple[int, int], ChunkDelta] = dict(chunk_deltas or {})
+        self.power_ups = EntityList()
+        self.chunk_size = CHUNK_SIZE
         self.loaded_chunks = set()
+        self.max_resident_chunks = max_resident_chunks
+        # Chunk residency bookkeeping: last update() tick each chunk was near a player
+        self.chunk_last_used: Dict[Tuple[int, int], int] = {}
+        self.tick = 0
+        self.generated_chunks = 0
+        self.evicted_chunks = 0
+        # Background pre-generation state
+        self.pregenerate = pregenerate
+        self.pending_chunks = set()
+        self.ready_chunks = queue.Queue()
+        self.last_player_positions: List[Tuple[float, float]] = []
+        self.pregenerated_chunks = 0
+        # 0 disables the surface cache and draws every object each frame
+        self.surface_cache = ChunkSurfaceCache(self.chunk_size, surface_cache_size) if surface_cache_size else None
         self.generate_initial_world()
 
+    @property
+    def objects(self) -> List[WorldObject]:
+        """All resident world objects as a flat list."""
+        return [obj for chunk_objects in self.chunks.values() for obj in chunk_objects]
+
+    def chunk_key_of(self, position: Vector2) -> Tuple[int, int]:
+        return int(position.x // self.chunk_size), int(position.y // self.chunk_size)
+
+    def chunk_delta(self, key: Tuple[int, int]) -> ChunkDelta:
+        delta = self.chunk_deltas.get(key)
+        if delta is None:
+            delta = self.chunk_deltas[key] = ChunkDelta()
+        return delta
+
+    def add_object(self, obj: WorldObject):
+        """Place an object; it is recorded in its chunk's delta."""
+        key = self.chunk_key_of(obj.position)
+        obj.generated_index = None
+        self.chunk_delta(key).hydrate().append(obj)
+        self.chunks.setdefault(key, []).append(obj)
+        if self.surface_cache:
+            self.surface_cache.invalidate(key)
+
+    def remove_object(self, obj: WorldObject) -> bool:
+        key = self.chunk_key_of(obj.position)
+        chunk_objects = self.chunks.get(key)
+        if not chunk_objects or obj not in chunk_objects:
+            return False
+        chunk_objects.remove(obj)
+        delta = self.chunk_delta(key)
+        if obj.generated_index is None:
+            delta.added.remove(obj)
+        else:
+            delta.removed.add(obj.generated_index)
+        if self.surface_cache:
+            self.surface_cache.invalidate(key)
+        return True
+
+    def clear_objects(self):
+        self.chunks.clear()
+        self.chunk_deltas.clear()
+        if self.surface_cache:
+            self.surface_cache.clear()
+
     def generate_initial_world(self):
         for x in range(-2, 3):
             for y in range(-2, 3):
@@ -125,40 +363,101 @@ class World:
         if chunk_key in self.loaded_chunks:
             return
 
-        self.loaded_chunks.add(chunk_key)
+        self.integrate_chunk(chunk_x, chunk_y,
+                             generate_chunk_objects(self.seed, chunk_x, chunk_y, self.chunk_size))
 
-        base_x = chunk_x * self.chunk_size
-        base_y = chunk_y * self.chunk_size
-
-        # Seed random for consistent generation
-        random.seed(chunk_x * 1000 + chunk_y)
-
-        # Generate trees (archa)
-        tree_count = 30 + random.randint(0, 20)
-        for _ in range(tree_count):
-            self.objects.append(WorldObject(
-                Vector2(base_x + random.random() * self.chunk_size,
-                        base_y + random.random() * self.chunk_size),
-                Vector2(18 + random.random() * 6, 22 + random.random() * 6),  # a bit smaller than before
-                "tree",
-                TREE_GREEN
-            ))
-
-        # Generate rocks (used to be house)
-        rock_count = 2 + random.randint(0, 3)
-        for _ in range(rock_count):
-            self.objects.append(WorldObject(
-                Vector2(base_x + random.random() * self.chunk_size,
-                        base_y + random.random() * self.chunk_size),
-                Vector2(13 + random.random() * 7, 14 + random.random() * 7),  # smaller than tree
-                "rock",
-                ROCK_GRAY
-            ))
-
-        # Reset random seed
-        random.seed()
+    def integrate_chunk(self, chunk_x: int, chunk_y: int, chunk_objects: List[WorldObject]) -> bool:
+        """Add a generated chunk to the world unless it is already loaded."""
+        chunk_key = f"{chunk_x},{chunk_y}"
+        if chunk_key in self.loaded_chunks:
+            return False
+        self.loaded_chunks.add(chunk_key)
+        self.chunk_last_used[(chunk_x, chunk_y)] = self.tick
+        self.generated_chunks += 1
+        # Objects placed before the chunk was generated are in its delta too
+        delta = self.chunk_deltas.get((chunk_x, chunk_y))
+        self.chunks[(chunk_x, chunk_y)] = delta.apply(chunk_objects) if delta else chunk_objects
+        if self.surface_cache:
+            self.surface_cache.invalidate((chunk_x, chunk_y))
+        return True
+
+    def request_chunk(self, chunk_x: int, chunk_y: int):
+        """Queue a chunk for generation on the background worker."""
+        key = (chunk_x, chunk_y)
+        if key in self.pending_chunks or f"{chunk_x},{chunk_y}" in self.loaded_chunks:
+            return
+        self.pending_chunks.add(key)
+        future = get_chunk_executor().submit(
+            generate_chunk_objects, self.seed, chunk_x, chunk_y, self.chunk_size
+        )
+        future.add_done_callback(lambda done, key=key: self.ready_chunks.put((key, done)))
+
+    def request_chunks(self, chunk_keys):
+        """
+        Queue "x,y" chunk keys (e.g. a save's loaded_chunks) for background
+        generation, at most max_resident_chunks of them: more would only be
+        evicted again.
+        """
+        if not self.pregenerate:
+            return
+        for chunk_key in list(chunk_keys)[:self.max_resident_chunks]:
+            chunk_x, chunk_y = chunk_key.split(",")
+            self.request_chunk(int(chunk_x), int(chunk_y))
+
+    def integrate_ready_chunks(self, limit: int = CHUNKS_PER_UPDATE):
+        """Merge at most `limit` finished background chunks."""
+        integrated = 0
+        while integrated < limit:
+            try:
+                key, future = self.ready_chunks.get_nowait()
+            except queue.Empty:
+                return
+            self.pending_chunks.discard(key)
+            if future.exception() is not None:
+                print(f"[World] Chunk {key} generation failed: {future.exception()}")
+                continue
+            if self.integrate_chunk(key[0], key[1], future.result()):
+                self.pregenerated_chunks += 1
+                integrated += 1
+
+    def predict_chunks(self, player_positions: List[Vector2]) -> Set[Tuple[int, int]]:
+        """Request the 3x3 chunks around each player's extrapolated position; returns their keys."""
+        predicted = set()
+        previous = self.last_player_positions
+        for index, player_pos in enumerate(player_positions):
+            if index >= len(previous):
+                break
+            velocity_x = player_pos.x - previous[index][0]
+            velocity_y = player_pos.y - previous[index][1]
+            if velocity_x == 0 and velocity_y == 0:
+                continue
+            chunk_x = int((player_pos.x + velocity_x * PREDICT_TICKS) // self.chunk_size)
+            chunk_y = int((player_pos.y + velocity_y * PREDICT_TICKS) // self.chunk_size)
+            for x in range(chunk_x - 1, chunk_x + 2):
+                for y in range(chunk_y - 1, chunk_y + 2):
+                    self.request_chunk(x, y)
+                    predicted.add((x, y))
+        self.last_player_positions = [(p.x, p.y) for p in player_positions]
+        return predicted
 
     def update(self, player_positions: List[Vector2]):
+        self.tick += 1
+        predicted = set()
+        if self.pregenerate:
+            self.integrate_ready_chunks()
+            predicted = self.predict_chunks(player_positions)
+
+        # Chunks a player already stands next to are generated right away
+        # if the background worker has not delivered them yet
+        near_players = self.generate_near(player_positions)
+
+        if len(self.loaded_chunks) > self.max_resident_chunks:
+            # Chunks on the way are kept too, or they would be generated again
+            self.evict_chunks(near_players | predicted | self.pending_chunks)
+
+    def generate_near(self, player_positions: List[Vector2]) -> Set[Tuple[int, int]]:
+        """Generate the 3x3 chunks around each position now; returns their keys."""
+        near_players = set()
         for player_pos in player_positions:
             chunk_x = int(player_pos.x // self.chunk_size)
             chunk_y = int(player_pos.y // self.chunk_size)
@@ -166,6 +465,40 @@ class World:
             for x in range(chunk_x - 1, chunk_x + 2):
                 for y in range(chunk_y - 1, chunk_y + 2):
                     self.generate_chunk(x, y)
+                    self.chunk_last_used[(x, y)] = self.tick
+                    near_players.add((x, y))
+        return near_players
+
+    def evict_chunks(self, keep):
+        """Drop least recently used chunks until the resident budget is met."""
+        resident = set(self.chunks)
+        for chunk_key in self.loaded_chunks:
+            x, y = chunk_key.split(",")
+            resident.add((int(x), int(y)))
+        excess = len(resident) - self.max_resident_chunks
+        if excess <= 0:
+            return
+        candidates = sorted(resident - keep, key=lambda key: self.chunk_last_used.get(key, 0))
+        for chunk_x, chunk_y in candidates[:excess]:
+            self.unload_chunk(chunk_x, chunk_y)
+
+    def unload_chunk(self, chunk_x: int, chunk_y: int):
+        self.chunks.pop((chunk_x, chunk_y), None)
+        self.chunk_last_used.pop((chunk_x, chunk_y), None)
+        if self.surface_cache:
+            self.surface_cache.invalidate((chunk_x, chunk_y))
+        self.loaded_chunks.discard(f"{chunk_x},{chunk_y}")
+        self.evicted_chunks += 1
+
+    def get_stats(self) -> dict:
+        return {
+            "resident_chunks": len(self.loaded_chunks),
+            "objects": sum(len(chunk_objects) for chunk_objects in self.chunks.values()),
+            "generated_chunks": self.generated_chunks,
+            "evicted_chunks": self.evicted_chunks,
+            "pregenerated_chunks": self.pregenerated_chunks,
+            "pending_chunks": len(self.pending_chunks),
+        }
 
     def add_power_up(self, position: Vector2):
         self.power_ups.append(PowerUp(position))
@@ -180,12 +513,25 @@ class World:
         view_top = camera.y - 100
         view_bottom = camera.y + screen_height + 100
 
-        for obj in self.objects:
-            if (obj.position.x + obj.size.x >= view_left and
-                    obj.position.x <= view_right and
-                    obj.position.y + obj.size.y >= view_top and
-                    obj.position.y <= view_bottom):
-                obj.render(screen, camera)
+        # Objects sit inside their chunk but can overhang its left/top edge
+        # by their size, so start one margin earlier
+        chunk_size = self.chunk_size
+        for chunk_x in range(int((view_left - 100) // chunk_size), int(view_right // chunk_size) + 1):
+            for chunk_y in range(int((view_top - 100) // chunk_size), int(view_bottom // chunk_size) + 1):
+                chunk_objects = self.chunks.get((chunk_x, chunk_y))
+                if not chunk_objects:
+                    continue
+                if self.surface_cache:
+                    surface = self.surface_cache.get((chunk_x, chunk_y), chunk_objects)
+                    screen.blit(surface, (int(chunk_x * chunk_size - camera.x),
+                                          int(chunk_y * chunk_size - camera.y)))
+                    continue
+                for obj in chunk_objects:
+                    if (obj.position.x + obj.size.x >= view_left and
+                            obj.position.x <= view_right and
+                            obj.position.y + obj.size.y >= view_top and
+                            obj.position.y <= view_bottom):
+                        obj.render(screen, camera)
 
         # Render power-ups
         for power_up in self.power_ups:
@@ -4,7 +4,8 @@ from typing import List
 from enum import Enum
 import pygame
 
-from core import Vector2
+from core import Vector2, within_inclusive, within_xy
+from render_cache import get_sprite, new_sprite_surface
 
 RED = (255, 0, 0)
 GREEN = (0, 255, 0)
@@ -16,6 +17,20 @@ class ZombieType(Enum):
 
 ALL_ZOMBIE_TYPES = [ZombieType.WALKER, ZombieType.RUNNER, ZombieType.TANKER]
 
+def build_zombie_sprite(ztype: ZombieType, color, size: int) -> pygame.Surface:
+    """Zombie body drawn once into a sprite, top-left at the origin."""
+    if ztype == ZombieType.TANKER:
+        surface = new_sprite_surface(size, size + 8)
+        pygame.draw.ellipse(surface, color, (0, 0, size, size + 8))
+    elif ztype == ZombieType.RUNNER:
+        surface = new_sprite_surface(size, size)
+        pygame.draw.circle(surface, color, (size // 2, size // 2), size // 2)
+    else:
+        surface = new_sprite_surface(size, size)
+        pygame.draw.rect(surface, color, (0, 0, size, size))
+    return surface
+
+
 class Zombie:
     def __init__(self, position: Vector2, strength: int = 1, ztype: ZombieType = ZombieType.WALKER):
         self.type = ztype
@@ -48,41 +63,42 @@ class Zombie:
             return
 
         nearest_player = min(player_positions,
-                             key=lambda p: (self.position - p).length())
+                             key=self.position.distance_squared_to)
 
         # Check if zombie is trying to enter a protection circle
         for circle in protection_circles:
             if circle['active']:
-                distance_to_circle = (self.position - circle['position']).length()
+                circle_position = circle['position']
                 circle_radius = circle['radius']
 
                 # If zombie touches the circle, it dies
-                if distance_to_circle <= circle_radius + self.size // 2:
+                if within_inclusive(self.position, circle_position, circle_radius + self.size // 2):
                     self.active = False
                     return
 
                 # If zombie is moving towards the circle, redirect it
                 direction_to_player = (nearest_player - self.position).normalize()
-                direction_to_circle = (circle['position'] - self.position).normalize()
+                direction_to_circle = (circle_position - self.position).normalize()
 
                 # Calculate if the zombie's path would intersect the circle
-                future_pos = self.position + direction_to_player * self.speed * dt * 5
-                future_distance_to_circle = (future_pos - circle['position']).length()
+                lookahead = self.speed * dt * 5
+                future_x = self.position.x + direction_to_player.x * lookahead
+                future_y = self.position.y + direction_to_player.y * lookahead
 
-                if future_distance_to_circle < circle_radius + 20:
+                if within_xy(future_x, future_y, circle_position.x, circle_position.y, circle_radius + 20):
                     # Redirect zombie around the circle
                     perpendicular = Vector2(-direction_to_circle.y, direction_to_circle.x)
                     if random.random() < 0.5:
                         perpendicular = Vector2(direction_to_circle.y, -direction_to_circle.x)
 
                     redirect_direction = (direction_to_player + perpendicular * 2).normalize()
-                    self.position = self.position + redirect_direction * self.speed * dt
+                    self.position.iadd(redirect_direction, self.speed * dt)
                     return
 
-        direction = (nearest_player - self.position)
-        if direction.length() > 0:
-            direction = direction.normalize()
-            self.position += direction * self.speed * dt
+        direction = nearest_player - self.position
+        length = direction.length()
+        if length > 0:
+            self.position.iadd(direction, self.speed * dt / length)
         
         if (
             math.isnan(self.position.x) or math.isnan(self.position.y) or
@@ -120,13 +136,13 @@ class Zombie:
         # Rang va shakl
         if self.type == ZombieType.WALKER:
             color = (100 + self.strength * 20, 50, 50)
-            pygame.draw.rect(screen, color, (*screen_pos, self.size, self.size))
         elif self.type == ZombieType.RUNNER:
             color = (180, 100, 180)
-            pygame.draw.circle(screen, color, (screen_pos[0] + self.size // 2, screen_pos[1] + self.size // 2), self.size // 2)
-        elif self.type == ZombieType.TANKER:
+        else:
             color = (80, 30, 30)
-            pygame.draw.ellipse(screen, color, (*screen_pos, self.size, self.size + 8))
+        ztype, size = self.type, self.size
+        body = get_sprite(("zombie", ztype, color, size), lambda: build_zombie_sprite(ztype, color, size))
+        screen.blit(body, screen_pos)
 
         # Health bar
         if self.health < self.max_health:
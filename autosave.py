@@ -0,0 +1,81 @@
+"""
+Background autosave.
+
+The game thread takes a snapshot of the engine (plain row tuples, see each
+module's save_load.snapshot_game) and hands it to AUTOSAVER; a worker
+thread writes it to a temporary file and renames that over the autosave,
+so a periodic autosave costs the frame only the snapshot and a crash
+mid-write leaves the previous autosave in place.
+"""
+import os
+import threading
+from typing import Callable, Optional, Tuple
+
+# Game time between periodic autosaves
+AUTOSAVE_INTERVAL_MS = 60 * 1000
+
+
+def remove_database(path: str):
+    """Delete an SQLite file together with its WAL/shared-memory side files."""
+    for suffix in ("", "-wal", "-shm"):
+        try:
+            os.remove(path + suffix)
+        except FileNotFoundError:
+            pass
+
+
+def replace_atomically(path: str, write: Callable[[str], None]):
+    """Run write(tmp_path), then move the finished file over `path` in one step."""
+    tmp_path = path + ".tmp"
+    remove_database(tmp_path)
+    write(tmp_path)
+    os.replace(tmp_path, path)
+
+
+class AutoSaver:
+    """
+    Single background writer thread, started on the first submit().
+    If a new snapshot arrives while an older one is still waiting, the older
+    one is dropped: only the latest state matters and a slow disk never
+    builds a backlog.
+    """
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.pending: Optional[Tuple[str, Callable, object]] = None
+        self.busy = False
+        self.thread: Optional[threading.Thread] = None
+        self.saves = 0
+
+    def submit(self, path: str, write: Callable[[str, object], None], snapshot):
+        """Queue write(tmp_path, snapshot) for `path` and return immediately."""
+        with self.condition:
+            self.pending = (path, write, snapshot)
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+                self.thread.start()
+            self.condition.notify_all()
+
+    def _run(self):
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: self.pending is not None)
+                path, write, snapshot = self.pending
+                self.pending = None
+                self.busy = True
+            try:
+                replace_atomically(path, lambda tmp_path: write(tmp_path, snapshot))
+                self.saves += 1
+            except Exception as e:
+                print(f"[ERROR] Autosave yozilmadi: {path} {e}")
+            finally:
+                with self.condition:
+                    self.busy = False
+                    self.condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every submitted snapshot is on disk; False on timeout."""
+        with self.condition:
+            return self.condition.wait_for(lambda: self.pending is None and not self.busy, timeout)
+
+
+AUTOSAVER = AutoSaver()
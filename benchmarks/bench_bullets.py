@@ -0,0 +1,81 @@
+"""
+Bullet integration benchmark.
+
+Simulates sustained MINI_GUN fire (one shot per shooter every 50 ms) and
+compares BulletPool against the old list of Bullet objects, where every
+update copied the list and removed expired bullets with list.remove.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_bullets
+"""
+import math
+import random
+import time
+
+from bullet_pool import BulletPool
+from core import Vector2
+from Moduls.default.bullet import Bullet
+
+SHOOTER_COUNTS = [4, 16, 64, 256]
+FRAMES = 600
+DT = 1 / 60
+FIRE_INTERVAL = 0.05
+
+
+def directions(seed=1, count=1024):
+    rng = random.Random(seed)
+    return [Vector2(math.cos(a), math.sin(a)) for a in (rng.random() * 2 * math.pi for _ in range(count))]
+
+
+def run_list(shooters, aims):
+    bullets = []
+    origin = Vector2(0, 0)
+    cooldown = 0.0
+    shot = 0
+    for _ in range(FRAMES):
+        cooldown -= DT
+        if cooldown <= 0:
+            cooldown += FIRE_INTERVAL
+            for _ in range(shooters):
+                bullets.append(Bullet(origin, aims[shot % len(aims)], 20, 1))
+                shot += 1
+        for bullet in bullets[:]:
+            if not bullet.active:
+                bullets.remove(bullet)
+                continue
+            bullet.update(DT)
+    return len(bullets)
+
+
+def run_pool(shooters, aims):
+    bullets = BulletPool(Bullet)
+    origin = Vector2(0, 0)
+    cooldown = 0.0
+    shot = 0
+    for _ in range(FRAMES):
+        cooldown -= DT
+        if cooldown <= 0:
+            cooldown += FIRE_INTERVAL
+            for _ in range(shooters):
+                bullets.fire(origin, aims[shot % len(aims)], 20, 1)
+                shot += 1
+        bullets.update(DT)
+    return bullets.capacity
+
+
+def main():
+    aims = directions()
+    print(f"{FRAMES} frames at 60 FPS, one shot per shooter every {FIRE_INTERVAL * 1000:.0f} ms")
+    print(f"{'shooters':>8} {'list ms/frame':>14} {'pool ms/frame':>14} {'pool slots':>11}")
+    for shooters in SHOOTER_COUNTS:
+        start = time.perf_counter()
+        run_list(shooters, aims)
+        list_ms = (time.perf_counter() - start) * 1000 / FRAMES
+        start = time.perf_counter()
+        capacity = run_pool(shooters, aims)
+        pool_ms = (time.perf_counter() - start) * 1000 / FRAMES
+        print(f"{shooters:>8} {list_ms:>14.3f} {pool_ms:>14.3f} {capacity:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Bullet/zombie collision benchmark.
+
+Runs GameEngine.check_collisions against a growing horde and compares the
+spatial-hash path with the old all-pairs scan. Horde density is kept
+constant (the spawn ring grows with the zombie count), which is what a long
+night wave looks like on screen.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_collisions
+"""
+import math
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from core import Vector2
+from Moduls.default.game_logic import GameEngine
+from Moduls.default.zombie import Zombie
+
+ZOMBIE_COUNTS = [50, 100, 250, 500, 1000, 2000]
+BULLET_COUNT = 300
+ZOMBIES_PER_SQ_UNIT = 50 / (600 * 600)
+REPEATS = 20
+
+
+def populate(engine, zombie_count, seed=1):
+    rng = random.Random(seed)
+    half = math.sqrt(zombie_count / ZOMBIES_PER_SQ_UNIT) / 2
+    engine.zombies = [
+        Zombie(Vector2(rng.uniform(-half, half), rng.uniform(-half, half)), 1000)
+        for _ in range(zombie_count)
+    ]
+    engine.bullets.clear()
+    for _ in range(BULLET_COUNT):
+        angle = rng.random() * 2 * math.pi
+        engine.bullets.fire(
+            Vector2(rng.uniform(-half, half), rng.uniform(-half, half)),
+            Vector2(math.cos(angle), math.sin(angle)), 0, 1
+        )
+
+
+def brute_force_collisions(engine):
+    """The pre-grid check_collisions loop, kept here for comparison."""
+    for bullet in engine.bullets:
+        if not bullet.active:
+            continue
+        for zombie in engine.zombies[:]:
+            if not zombie.active:
+                continue
+            if (bullet.position - zombie.position).length() < 15:
+                zombie.take_damage(bullet.damage)
+                break
+
+
+def time_call(engine, zombie_count, func):
+    samples = []
+    for repeat in range(REPEATS):
+        populate(engine, zombie_count, seed=repeat)
+        start = time.perf_counter()
+        func(engine)
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return samples[len(samples) // 2] * 1000
+
+
+def main():
+    pygame.init()
+    engine = GameEngine(pygame.display.set_mode((1, 1)), 1200, 800)
+    print(f"{BULLET_COUNT} bullets, median of {REPEATS} runs")
+    print(f"{'zombies':>8} {'grid ms':>10} {'all-pairs ms':>14}")
+    for count in ZOMBIE_COUNTS:
+        grid_ms = time_call(engine, count, GameEngine.check_collisions)
+        brute_ms = time_call(engine, count, brute_force_collisions)
+        print(f"{count:>8} {grid_ms:>10.3f} {brute_ms:>14.3f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
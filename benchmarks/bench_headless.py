@@ -0,0 +1,42 @@
+"""
+Headless simulation throughput / soak test.
+
+Runs both game modules with helper bots on a virtual clock, no display,
+as fast as possible, and reports simulation ticks per second. With
+--time-scale=N every tick covers N times as much game time, so the same
+game minutes take N times fewer ticks.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_headless [game_minutes] [--horde] [--time-scale=N]
+"""
+import sys
+
+from Moduls.default.game_logic import GameEngine as DefaultEngine
+from Moduls.ProtectBase.game_logic import GameEngine as ProtectBaseEngine
+
+BOT_SLOTS = [
+    {'type': 'bot', 'id': 1, 'name': 'Bot 1'},
+    {'type': 'bot', 'id': 2, 'name': 'Bot 2'},
+    {'type': 'bot', 'id': 3, 'name': 'Bot 3'},
+]
+TICK_RATE = 60
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    minutes = float(args[0]) if args else 2
+    use_horde = "--horde" in sys.argv
+    time_scale = next((float(arg.split("=", 1)[1]) for arg in sys.argv if arg.startswith("--time-scale=")), 1.0)
+    ticks = int(minutes * 60 * TICK_RATE / time_scale)
+    print(f"{minutes:g} game minutes ({ticks} ticks at {TICK_RATE} Hz), horde={use_horde}, time_scale={time_scale:g}")
+    print(f"{'module':<12} {'ticks/s':>9} {'wall s':>8} {'speedup':>8} {'state':>10} {'zombies':>8} {'kills':>6}")
+    for name, engine_cls in (("default", DefaultEngine), ("ProtectBase", ProtectBaseEngine)):
+        engine = engine_cls(None, 1200, 800, use_horde=use_horde, headless=True, time_scale=time_scale)
+        stats = engine.run_headless(BOT_SLOTS, ticks, 1 / TICK_RATE)
+        speedup = stats["game_seconds"] / stats["wall_seconds"]
+        print(f"{name:<12} {stats['ticks_per_second']:>9.0f} {stats['wall_seconds']:>8.2f} {speedup:>7.1f}x "
+              f"{stats['state']:>10} {stats['zombies']:>8} {stats['kills']:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Replay a recorded session headlessly, for profiling and for checking
+that a change did not alter gameplay.
+
+Replays the log step by step, verifies the recorded state checksums and
+reports steps per second and p50/p99 per-phase step times. Logs of real
+sessions are written to Documents/Unknown_World/replays. --record makes
+a synthetic one: a headless session with two players whose movement and
+shooting are scripted from a fixed seed.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_replay LOG
+    python -m benchmarks.bench_replay --record LOG [game_minutes] [--module ProtectBase]
+"""
+import argparse
+import importlib
+import random
+import sys
+
+from benchmarks.bench_suite import percentile
+from profiler import FrameProfiler, UPDATE_PHASES
+from replay import replay, seed_session
+
+SCRIPT_SEED = 7
+SLOTS = [
+    {'type': 'player', 'id': 1, 'name': 'Player 1', 'pos_x': 0, 'pos_y': 0},
+    {'type': 'player', 'id': 2, 'name': 'Player 2', 'pos_x': 40, 'pos_y': 0},
+    {'type': 'bot', 'id': 101, 'name': 'Bot 1'},
+]
+
+
+def record(path, minutes, module):
+    game_logic = importlib.import_module(f"Moduls.{module}.game_logic")
+    seed = seed_session(SCRIPT_SEED)
+    engine = game_logic.GameEngine(None, 1200, 800, headless=True)
+    engine.setup_players(SLOTS)
+    engine.setup_world()
+    engine.start_recording(seed, module, SLOTS, path)
+    # Scripted input has its own RNG so it does not disturb the game's
+    script = random.Random(SCRIPT_SEED)
+    flags = ("move_up", "move_down", "move_left", "move_right", "shooting")
+    steps = int(minutes * 60 / engine.timestep.step)
+    for _ in range(steps):
+        for player in engine.players:
+            if getattr(player, "controls", None) and script.random() < 0.02:
+                setattr(player, script.choice(flags), script.random() < 0.5)
+        engine.step_update(engine.timestep.step)
+        if engine.state != "PLAYING":
+            break
+    engine.stop_recording()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("log")
+    parser.add_argument("minutes", nargs="?", type=float, default=2)
+    parser.add_argument("--record", action="store_true")
+    parser.add_argument("--module", default="default")
+    args = parser.parse_args()
+
+    if args.record:
+        record(args.log, args.minutes, args.module)
+
+    profiler = FrameProfiler(history=10 ** 6)
+    profiler.collect = True
+    stats = replay(args.log, profiler)
+    print(f"{stats['steps']} steps ({stats['game_seconds']:.0f} game s) in {stats['wall_seconds']:.2f} s: "
+          f"{stats['steps_per_second']:.0f} steps/s, state {stats['state']}, kills {stats['kills']}")
+    history = profiler.history
+    print(f"{'phase':<24} {'p50 ms':>8} {'p99 ms':>8}")
+    for name in ("frame_ms",) + UPDATE_PHASES:
+        values = [frame[name] for frame in history]
+        print(f"{name:<24} {percentile(values, 0.5):>8.3f} {percentile(values, 0.99):>8.3f}")
+    if stats["desync_step"] is None:
+        print(f"Replay matched the recording ({stats['checks']} checksums).")
+    else:
+        print(f"DESYNC: state differs from the recording at step {stats['desync_step']}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Save-game throughput for large worlds.
+
+Builds each game module headlessly, generates chunks until the world holds
+10k and 100k objects, places a few hundred extra objects by hand (the
+per-chunk deltas a save has to keep), adds a few hundred zombies and
+power-ups, and times save_game into a temporary directory and loading the
+save back into a fresh engine. Reports the median of a few runs and the
+file size.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_save [object counts...] [--repeats N] [--placed N]
+"""
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+
+from core import Vector2
+from Moduls.default import game_logic as default_logic, save_load as default_save, world as default_world
+from Moduls.ProtectBase import game_logic as protect_logic, save_load as protect_save, world as protect_world
+
+OBJECT_COUNTS = (10_000, 100_000)
+PLACED_OBJECTS = 200
+ZOMBIES = 500
+POWER_UPS = 50
+REPEATS = 3
+SLOTS = [{'type': 'bot', 'id': 1, 'name': 'Bot 1'}, {'type': 'bot', 'id': 2, 'name': 'Bot 2'}]
+MODULES = {
+    "default": (default_logic, default_save, default_world),
+    "ProtectBase": (protect_logic, protect_save, protect_world),
+}
+COLORS = [(34, 139, 34), (0, 100, 0), (128, 128, 128), (105, 105, 105)]
+
+
+def build_engine(logic, world_module, object_count, placed, rng):
+    engine = logic.GameEngine(None, 1200, 800, headless=True)
+    engine.setup_players(SLOTS)
+    engine.setup_world()
+    world = engine.world
+    world.pregenerate = False
+    # Square rings of chunks around the origin until the world is big enough
+    ring = 2
+    while len(world.objects) < object_count:
+        ring += 1
+        for x in range(-ring, ring + 1):
+            for y in range(-ring, ring + 1):
+                world.generate_chunk(x, y)
+    span = ring * world.chunk_size
+    for _ in range(placed):
+        position = Vector2(rng.uniform(-span, span), rng.uniform(-span, span))
+        obj_type = rng.choice(("tree", "rock"))
+        world.add_object(world_module.WorldObject(position, Vector2(40, 40), obj_type, rng.choice(COLORS)))
+    for _ in range(ZOMBIES):
+        engine.spawn_zombie()
+    for _ in range(POWER_UPS):
+        world.add_power_up(Vector2(rng.uniform(-1000, 1000), rng.uniform(-1000, 1000)))
+    return engine
+
+
+def time_load(logic, save_module, name):
+    start = time.perf_counter()
+    data = save_module.load_game_data("bench", modul_name=name)
+    engine = logic.GameEngine(None, 1200, 800, headless=True)
+    save_module.load_from_data(engine, data)
+    return time.perf_counter() - start
+
+
+def median(samples):
+    return sorted(samples)[len(samples) // 2]
+
+
+def option(argv, name, default):
+    if name in argv:
+        return int(argv[argv.index(name) + 1])
+    return default
+
+
+def main():
+    argv = sys.argv[1:]
+    repeats = option(argv, "--repeats", REPEATS)
+    placed = option(argv, "--placed", PLACED_OBJECTS)
+    counts = [int(arg) for index, arg in enumerate(argv)
+              if not arg.startswith("--") and (index == 0 or not argv[index - 1].startswith("--"))]
+    counts = counts or OBJECT_COUNTS
+    print(f"save/load, median of {repeats} runs, {placed} placed objects, "
+          f"{ZOMBIES} zombies, {POWER_UPS} power-ups")
+    print(f"{'module':<12} {'objects':>8} {'save ms':>9} {'load ms':>9} {'size KB':>9}")
+    with tempfile.TemporaryDirectory() as save_root:
+        for name, (logic, save_module, world_module) in MODULES.items():
+            save_module.SAVE_ROOT = save_root
+            for count in counts:
+                engine = build_engine(logic, world_module, count, placed, random.Random(count))
+                objects = len(engine.world.objects)
+                save_samples = []
+                load_samples = []
+                # save_game and load_from_data log every step
+                with contextlib.redirect_stdout(io.StringIO()):
+                    for _ in range(repeats):
+                        start = time.perf_counter()
+                        save_module.save_game(engine, "bench", engine.mode, modul_name=name)
+                        save_samples.append(time.perf_counter() - start)
+                        load_samples.append(time_load(logic, save_module, name))
+                size = os.path.getsize(save_module.get_save_path("bench", name)) / 1024
+                print(f"{name:<12} {objects:>8} {median(save_samples) * 1000:>9.1f} "
+                      f"{median(load_samples) * 1000:>9.1f} {size:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
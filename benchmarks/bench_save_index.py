@@ -0,0 +1,92 @@
+"""
+Load menu slot info cost with many saves.
+
+Saves one game, copies it to a few hundred save files and measures what
+a Load menu frame spends on the slot info: load_game_data for every
+visible slot (the old way) against SAVE_INDEX, cold and warm. Also pages
+through every save once per mode.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_save_index [save count]
+"""
+import contextlib
+import io
+import shutil
+import sys
+import tempfile
+import time
+
+from Moduls.default import game_logic, save_load
+from save_index import SaveIndex
+
+SAVES = 300
+PAGE_SIZE = 5
+FRAMES = 120
+SLOTS = [{'type': 'bot', 'id': 1, 'name': 'Bot 1'}, {'type': 'bot', 'id': 2, 'name': 'Bot 2'}]
+
+
+def make_saves(count):
+    engine = game_logic.GameEngine(None, 1200, 800, headless=True)
+    engine.setup_players(SLOTS)
+    engine.setup_world()
+    for _ in range(300):
+        engine.spawn_zombie()
+    save_load.save_game(engine, "bench_0", engine.mode, modul_name="default")
+    source = save_load.get_save_path("bench_0", "default")
+    names = ["bench_0"]
+    for i in range(1, count):
+        name = f"bench_{i}"
+        shutil.copyfile(source, save_load.get_save_path(name, "default"))
+        names.append(name)
+    return names
+
+
+def old_info(name):
+    data = save_load.load_game_data(name, modul_name="default")
+    players = data.get("player", [])
+    return sum(1 for p in players if p.get("type") == "player"), data["meta"]["game_time"]
+
+
+def time_frames(info, names, frames):
+    start = time.perf_counter()
+    for frame in range(frames):
+        for name in names:
+            info(name)
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else SAVES
+    # save_game and load_game_data log every step
+    with tempfile.TemporaryDirectory() as save_root, contextlib.redirect_stdout(io.StringIO()):
+        save_load.SAVE_ROOT = save_root
+        names = make_saves(count)
+        page = names[:PAGE_SIZE]
+        index = SaveIndex()
+
+        def new_info(name):
+            return index.summary(save_load.get_save_path(name, "default"))
+
+        results = [
+            ("load_game_data", time_frames(old_info, page, FRAMES // 10)),
+            ("SAVE_INDEX cold", time_frames(new_info, page, 1)),
+            ("SAVE_INDEX warm", time_frames(new_info, page, FRAMES)),
+        ]
+        # Every page once, as when scrolling to the end of the list
+        index = SaveIndex()
+        scans = [
+            ("load_game_data", time_frames(old_info, names, 1)),
+            ("SAVE_INDEX cold", time_frames(new_info, names, 1)),
+            ("SAVE_INDEX warm", time_frames(new_info, names, 1)),
+        ]
+    print(f"{count} saves, {PAGE_SIZE} visible slots")
+    print(f"{'slot info':<18} {'ms/frame':>9}")
+    for label, ms in results:
+        print(f"{label:<18} {ms:>9.3f}")
+    print(f"{'all saves':<18} {'ms':>9}")
+    for label, ms in scans:
+        print(f"{label:<18} {ms:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
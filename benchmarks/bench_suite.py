@@ -0,0 +1,186 @@
+"""
+Reproducible performance suite with scripted hordes.
+
+Builds each game module headlessly with a fixed seed, four Minigun players
+with drones plus two helper bots, and keeps the horde topped up at 100,
+500 and 2000 zombies (object and NumPy horde backends). Players and the
+base cannot die, so every scenario runs its full tick count. Reports
+ticks per second and p50/p99 tick and per-phase times, and compares them
+with a stored baseline: a scenario whose p50 or p99 tick time is more
+than --tolerance slower than the baseline is a regression (exit code 1).
+
+Baselines are machine-specific; record one on the machine you compare on.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_suite [--ticks N] [--only TEXT] [--tolerance 0.25]
+    python -m benchmarks.bench_suite --save-baseline
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+
+from core import WeaponType
+from profiler import FrameProfiler, UPDATE_PHASES
+from Moduls.default.game_logic import GameEngine as DefaultEngine
+from Moduls.default.player import Drone as DefaultDrone
+from Moduls.ProtectBase.game_logic import GameEngine as ProtectBaseEngine
+from Moduls.ProtectBase.player import Drone as ProtectBaseDrone
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+MODULES = {
+    "default": (DefaultEngine, DefaultDrone),
+    "ProtectBase": (ProtectBaseEngine, ProtectBaseDrone),
+}
+HORDE_SIZES = (100, 500, 2000)
+SLOTS = [
+    {'type': 'player', 'id': 1, 'name': 'P1', 'pos_x': -60, 'pos_y': 0},
+    {'type': 'player', 'id': 2, 'name': 'P2', 'pos_x': 60, 'pos_y': 0},
+    {'type': 'player', 'id': 3, 'name': 'P3', 'pos_x': 0, 'pos_y': -60},
+    {'type': 'player', 'id': 4, 'name': 'P4', 'pos_x': 0, 'pos_y': 60},
+    {'type': 'bot', 'id': 5, 'name': 'Bot 1'},
+    {'type': 'bot', 'id': 6, 'name': 'Bot 2'},
+]
+SEED = 1234
+TICK_DT = 1 / 60
+WARMUP_TICKS = 30
+
+
+def scenarios():
+    for module in MODULES:
+        for zombies in HORDE_SIZES:
+            for backend in ("objects", "horde"):
+                yield f"{module}/{zombies}/{backend}", module, zombies, backend == "horde"
+
+
+def percentile(values, q):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+def rounded(value):
+    """Round every float in a result tree so the baseline diffs stay readable."""
+    if isinstance(value, dict):
+        return {key: rounded(item) for key, item in value.items()}
+    return round(value, 4) if isinstance(value, float) else value
+
+
+def build_engine(module, use_horde):
+    engine_cls, drone_cls = MODULES[module]
+    random.seed(SEED)
+    engine = engine_cls(None, 1200, 800, use_horde=use_horde, headless=True)
+    engine.setup_players(SLOTS)
+    engine.setup_world()
+    for player in engine.players:
+        player.invulnerability_time = float("inf")
+        player.shooting = True
+        if player.id <= 4:
+            player.level = 100
+            player.weapon_type = WeaponType.MINI_GUN
+            player.drone = drone_cls(player.id)
+    if getattr(engine, "base", None):
+        engine.base.health = engine.base.max_health = 10 ** 9
+    return engine
+
+
+def top_up(engine, zombies):
+    while len(engine.zombies) < zombies:
+        engine.spawn_zombie()
+
+
+def run_scenario(module, zombies, use_horde, ticks):
+    engine = build_engine(module, use_horde)
+    top_up(engine, zombies)
+    for _ in range(WARMUP_TICKS):
+        engine.step_update(TICK_DT)
+        top_up(engine, zombies)
+
+    engine.profiler = FrameProfiler(history=ticks)
+    engine.profiler.collect = True
+    tick_ms = []
+    start = time.perf_counter()
+    for _ in range(ticks):
+        tick_start = time.perf_counter()
+        engine.step_update(TICK_DT)
+        tick_ms.append((time.perf_counter() - tick_start) * 1000)
+        engine.profiler.end_frame()
+        top_up(engine, zombies)
+    elapsed = time.perf_counter() - start
+
+    history = engine.profiler.history
+    return {
+        "ticks_per_second": ticks / elapsed,
+        "tick_ms": {"p50": percentile(tick_ms, 0.5), "p99": percentile(tick_ms, 0.99)},
+        "phases": {
+            name: {"p50": percentile([record[name] for record in history], 0.5),
+                   "p99": percentile([record[name] for record in history], 0.99)}
+            for name in UPDATE_PHASES
+        },
+        "kills": sum(p.zombie_kills for p in engine.players),
+    }
+
+
+def compare(name, result, baseline, tolerance):
+    """Return the regression messages for one scenario."""
+    previous = baseline.get("scenarios", {}).get(name)
+    if previous is None:
+        return []
+    regressions = []
+    for stat in ("p50", "p99"):
+        old, new = previous["tick_ms"][stat], result["tick_ms"][stat]
+        if new > old * (1 + tolerance):
+            regressions.append(f"{name}: tick {stat} {old:.3f} -> {new:.3f} ms (+{(new / old - 1) * 100:.0f}%)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ticks", type=int, default=300)
+    parser.add_argument("--only", default="", help="run scenarios whose name contains this text")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    results = {}
+    regressions = []
+    print(f"{args.ticks} ticks per scenario, seed {SEED}")
+    print(f"{'scenario':<26} {'ticks/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'vs base':>8}  slowest phase (p99)")
+    for name, module, zombies, use_horde in scenarios():
+        if args.only not in name:
+            continue
+        result = run_scenario(module, zombies, use_horde, args.ticks)
+        results[name] = result
+        previous = baseline.get("scenarios", {}).get(name)
+        change = f"{(result['tick_ms']['p50'] / previous['tick_ms']['p50'] - 1) * 100:+.0f}%" if previous else "-"
+        slowest = max(result["phases"], key=lambda phase: result["phases"][phase]["p99"])
+        print(f"{name:<26} {result['ticks_per_second']:>8.0f} {result['tick_ms']['p50']:>8.3f} "
+              f"{result['tick_ms']['p99']:>8.3f} {change:>8}  {slowest} {result['phases'][slowest]['p99']:.3f}")
+        regressions.extend(compare(name, result, baseline, args.tolerance))
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump({"ticks": args.ticks, "seed": SEED, "python": platform.python_version(),
+                       "machine": platform.machine(), "scenarios": rounded(results)}, f, indent=2, sort_keys=True)
+        print(f"Baseline saved: {args.baseline}")
+    elif regressions:
+        print(f"{len(regressions)} regression(s) over {args.tolerance:.0%}:")
+        for message in regressions:
+            print("  " + message)
+        sys.exit(1)
+    elif baseline:
+        print("No regressions against the baseline.")
+
+
+if __name__ == "__main__":
+    main()
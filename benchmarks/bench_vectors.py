@@ -0,0 +1,55 @@
+"""
+Vector2 allocation benchmark.
+
+Runs the object backend of both modules headlessly (four Minigun players
+with drones, two helper bots, 500 zombies kept alive) and counts how many
+Vector2 objects each simulation step creates, by instrumenting
+Vector2.__init__, plus the size of one instance.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_vectors [ticks]
+"""
+import sys
+import time
+
+import core
+from benchmarks.bench_suite import TICK_DT, build_engine, top_up
+
+ZOMBIES = 500
+
+
+def count_constructions(counter):
+    original = core.Vector2.__init__
+
+    def counted(self, *args, **kwargs):
+        counter[0] += 1
+        original(self, *args, **kwargs)
+
+    core.Vector2.__init__ = counted
+    return original
+
+
+def main():
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    instance = core.Vector2(1.0, 2.0)
+    size = sys.getsizeof(instance) + (sys.getsizeof(instance.__dict__) if hasattr(instance, "__dict__") else 0)
+    print(f"Vector2 instance: {size} bytes; {ticks} ticks with {ZOMBIES} zombies (object backend)")
+    print(f"{'module':<12} {'Vector2/tick':>13} {'ms/tick':>8}")
+    for module in ("default", "ProtectBase"):
+        engine = build_engine(module, use_horde=False)
+        top_up(engine, ZOMBIES)
+        counter = [0]
+        original = count_constructions(counter)
+        try:
+            start = time.perf_counter()
+            for _ in range(ticks):
+                engine.step_update(TICK_DT)
+                top_up(engine, ZOMBIES)
+            elapsed = time.perf_counter() - start
+        finally:
+            core.Vector2.__init__ = original
+        print(f"{module:<12} {counter[0] / ticks:>13.0f} {elapsed * 1000 / ticks:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
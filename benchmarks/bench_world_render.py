@@ -0,0 +1,92 @@
+"""
+World scenery rendering benchmark.
+
+Pans the camera in a circle over the start area and counts pygame draw
+calls and blits per frame in World.render, with and without the chunk
+surface cache. Each mode runs two laps: a cold one that starts with an
+empty cache and a warm one after it. The lap passes through more chunks
+than the default cache holds, so the warm lap still rasterizes a few.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_world_render
+"""
+import math
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from core import Vector2
+from Moduls.default.world import World
+
+SCREEN_SIZE = (1200, 800)
+FRAMES = 300
+PAN_RADIUS = 800
+DRAW_FUNCTIONS = ["polygon", "rect", "ellipse", "circle"]
+
+
+class CountingSurface(pygame.Surface):
+    def __init__(self, size, counter):
+        super().__init__(size)
+        self.counter = counter
+
+    def blit(self, *args, **kwargs):
+        self.counter["blit"] += 1
+        return super().blit(*args, **kwargs)
+
+
+def count_draw_calls(counter):
+    originals = {}
+    for name in DRAW_FUNCTIONS:
+        original = getattr(pygame.draw, name)
+        originals[name] = original
+
+        def counted(*args, _original=original, _name=name, **kwargs):
+            counter[_name] += 1
+            return _original(*args, **kwargs)
+
+        setattr(pygame.draw, name, counted)
+    return originals
+
+
+def run(world, screen, counter):
+    for key in counter:
+        counter[key] = 0
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        angle = frame / FRAMES * 2 * math.pi
+        camera = Vector2(math.cos(angle) * PAN_RADIUS - SCREEN_SIZE[0] / 2, math.sin(angle) * PAN_RADIUS - SCREEN_SIZE[1] / 2)
+        world.render(screen, camera, *SCREEN_SIZE)
+    elapsed_ms = (time.perf_counter() - start) * 1000 / FRAMES
+    return {key: value / FRAMES for key, value in counter.items()}, elapsed_ms
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    counter = {name: 0 for name in DRAW_FUNCTIONS + ["blit"]}
+    screen = CountingSurface(SCREEN_SIZE, counter)
+    originals = count_draw_calls(counter)
+    try:
+        results = [
+            ("per-object draw", World(pregenerate=False, surface_cache_size=0)),
+            ("chunk surfaces", World(pregenerate=False)),
+        ]
+        print(f"{FRAMES} frames at {SCREEN_SIZE[0]}x{SCREEN_SIZE[1]}, per-frame averages")
+        print(f"{'mode':<16} {'lap':<5} {'draw calls':>10} {'blits':>6} {'ms/frame':>9}")
+        for label, world in results:
+            for lap in ("cold", "warm"):
+                counts, elapsed_ms = run(world, screen, counter)
+                draws = sum(counts[name] for name in DRAW_FUNCTIONS)
+                print(f"{label:<16} {lap:<5} {draws:>10.1f} {counts['blit']:>6.1f} {elapsed_ms:>9.3f}")
+    finally:
+        for name, original in originals.items():
+            setattr(pygame.draw, name, original)
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
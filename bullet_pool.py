@@ -0,0 +1,181 @@
+import math
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+import numpy as np
+
+from core import Vector2
+from interpolation import lerp_arrays
+
+BULLET_RANGE = 300
+DEFAULT_CAPACITY = 256
+
+
+class BulletView:
+    """
+    Handle onto one BulletPool slot with the attributes of a module Bullet
+    (position, velocity, damage, player_id, active...). Mixed in front of
+    the module's Bullet class so Bullet.render works unchanged.
+    A view belongs to its slot: once the bullet expires the slot, and the
+    view, are recycled for the next shot.
+    """
+    @property
+    def position(self) -> Vector2:
+        pool, slot = self._pool, self._slot
+        return Vector2(pool.x.item(slot), pool.y.item(slot))
+
+    @position.setter
+    def position(self, value: Vector2):
+        self._pool.x[self._slot] = value.x
+        self._pool.y[self._slot] = value.y
+
+    @property
+    def velocity(self) -> Vector2:
+        pool, slot = self._pool, self._slot
+        return Vector2(pool.vx.item(slot), pool.vy.item(slot))
+
+    def _field(name, cast):
+        def getter(self):
+            return cast(getattr(self._pool, name).item(self._slot))
+
+        def setter(self, value):
+            getattr(self._pool, name)[self._slot] = value
+
+        return property(getter, setter)
+
+    damage = _field("damage", int)
+    player_id = _field("player_id", int)
+    range = _field("range", float)
+    travel_distance = _field("travel", float)
+    active = _field("active", bool)
+    del _field
+
+
+class BulletPool:
+    """
+    Preallocated structure-of-arrays bullet store.
+
+    `fire` writes a shot straight into the arrays, `update` moves every live
+    bullet and expires the ones past their range in one batch, and expired
+    slots are recycled ring-buffer style: the write cursor walks forward over
+    the arrays, so with bullets of similar lifetime the next slot is almost
+    always the oldest, already expired one. The pool only grows when every
+    slot is live. Iterating yields BulletView objects for live bullets.
+    """
+    def __init__(self, bullet_cls, capacity: int = DEFAULT_CAPACITY):
+        self.view_cls = type(f"Pooled{bullet_cls.__name__}", (BulletView, bullet_cls), {})
+        self.views: List[Optional[BulletView]] = []
+        self.cursor = 0
+        self.capacity = 0
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int):
+        old = self.capacity
+        self.capacity = capacity
+
+        def grow(name, dtype):
+            array = np.zeros(capacity, dtype=dtype)
+            if old:
+                array[:old] = getattr(self, name)
+            setattr(self, name, array)
+
+        grow("x", np.float64)
+        grow("y", np.float64)
+        grow("prev_x", np.float64)
+        grow("prev_y", np.float64)
+        grow("vx", np.float64)
+        grow("vy", np.float64)
+        grow("speed", np.float64)
+        grow("travel", np.float64)
+        grow("range", np.float64)
+        grow("damage", np.int64)
+        grow("player_id", np.int64)
+        grow("active", np.bool_)
+        self.views.extend([None] * (capacity - old))
+
+    def _claim(self) -> int:
+        slot = self.cursor
+        if self.active[slot]:
+            free = np.flatnonzero(~self.active)
+            if free.size:
+                ahead = np.searchsorted(free, slot)
+                slot = int(free[ahead] if ahead < free.size else free[0])
+            else:
+                slot = self.capacity
+                self._allocate(self.capacity * 2)
+        self.cursor = (slot + 1) % self.capacity
+        return slot
+
+    def fire(self, position: Vector2, direction: Vector2, damage: int, player_id: int,
+             speed: float = 400) -> int:
+        """Spawn a bullet; same arguments as Bullet(). Returns its slot."""
+        length = math.sqrt(direction.x * direction.x + direction.y * direction.y)
+        slot = self._claim()
+        self.x[slot] = self.prev_x[slot] = position.x
+        self.y[slot] = self.prev_y[slot] = position.y
+        if length == 0:
+            self.vx[slot] = self.vy[slot] = self.speed[slot] = 0
+        else:
+            self.vx[slot] = direction.x / length * speed
+            self.vy[slot] = direction.y / length * speed
+            self.speed[slot] = abs(speed)
+        self.travel[slot] = 0
+        self.range[slot] = BULLET_RANGE
+        self.damage[slot] = damage
+        self.player_id[slot] = player_id
+        self.active[slot] = True
+        return slot
+
+    def update(self, dt: float):
+        """Move every live bullet and expire those that reached their range."""
+        live = self.active
+        if not live.any():
+            return
+        np.add(self.x, self.vx * dt, out=self.x, where=live)
+        np.add(self.y, self.vy * dt, out=self.y, where=live)
+        np.add(self.travel, self.speed * dt, out=self.travel, where=live)
+        live &= self.travel < self.range
+
+    def store_previous(self):
+        """Remember positions before a simulation step, for interpolated()."""
+        np.copyto(self.prev_x, self.x)
+        np.copyto(self.prev_y, self.y)
+
+    @contextmanager
+    def interpolated(self, alpha: float):
+        """While active, views report positions `alpha` of the way into the last step."""
+        x, y = self.x, self.y
+        self.x, self.y = lerp_arrays(x, y, self.prev_x, self.prev_y, alpha)
+        try:
+            yield
+        finally:
+            self.x, self.y = x, y
+
+    def live_slots(self) -> List[int]:
+        return np.flatnonzero(self.active).tolist()
+
+    def release(self, slot: int):
+        self.active[slot] = False
+
+    def view(self, slot: int) -> BulletView:
+        view = self.views[slot]
+        if view is None:
+            view = self.view_cls.__new__(self.view_cls)
+            view._pool = self
+            view._slot = slot
+            self.views[slot] = view
+        return view
+
+    def clear(self):
+        self.active[:] = False
+        self.cursor = 0
+
+    def __iter__(self) -> Iterator[BulletView]:
+        for slot in self.live_slots():
+            yield self.view(slot)
+
+    def __len__(self):
+        return int(np.count_nonzero(self.active))
+
+    def __bool__(self):
+        return bool(self.active.any())
@@ -0,0 +1,58 @@
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+NIGHT_TINT_COLOR = (0, 0, 50)
+NIGHT_TINT_ALPHA = 100
+# Dusk and dawn each take this fraction of a day (30 s of a 15 min day)
+DAY_TRANSITION = 1 / 30
+
+
+def night_level(day_progress: float, night_start: float, transition: float = DAY_TRANSITION) -> float:
+    """
+    How dark it is (0 = day, 1 = night) at `day_progress` in [0, 1).
+    Dusk ramps up just before `night_start`, dawn ramps down over the
+    end of the day, so it is fully dark whenever the night gameplay starts.
+    """
+    if day_progress >= night_start:
+        return min(1.0, (1.0 - day_progress) / transition)
+    dusk_start = night_start - transition
+    if day_progress > dusk_start:
+        return (day_progress - dusk_start) / transition
+    return 0.0
+
+
+class OverlayCompositor:
+    """
+    Owns the full-screen tint layers (night, pause dim, game-over dim).
+    One surface per tint colour is kept and only rebuilt when the screen
+    size changes (resolution or fullscreen toggle); the per-frame opacity
+    is applied with set_alpha on the existing surface.
+    """
+    def __init__(self):
+        self.size: Optional[Tuple[int, int]] = None
+        self.layers: Dict[Tuple[int, int, int], pygame.Surface] = {}
+
+    def get_layer(self, size: Tuple[int, int], color) -> pygame.Surface:
+        if size != self.size:
+            self.layers.clear()
+            self.size = size
+        color = tuple(color)
+        layer = self.layers.get(color)
+        if layer is None:
+            layer = pygame.Surface(size)
+            if pygame.display.get_surface() is not None:
+                layer = layer.convert()
+            layer.fill(color)
+            self.layers[color] = layer
+        return layer
+
+    def tint(self, screen, color, alpha: int):
+        """Blend `color` over the whole screen at the given alpha (0-255)."""
+        alpha = int(alpha)
+        if alpha <= 0:
+            return
+        layer = self.get_layer(screen.get_size(), color)
+        if layer.get_alpha() != alpha:
+            layer.set_alpha(alpha)
+        screen.blit(layer, (0, 0))
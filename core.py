@@ -1,6 +1,8 @@
 import math
-from dataclasses import dataclass
 from enum import Enum
+from typing import Iterable, List, Optional
+
+import pygame
 
 # colors
 WHITE = (255, 255, 255)
@@ -59,10 +61,33 @@ class PlayerState(Enum):
     DEAD = 3
 
 
-@dataclass
 class Vector2:
-    x: float
-    y: float
+    """2D vector; operators return new vectors, iadd/isub/imul and +=, -=, *= work in place."""
+    __slots__ = ("x", "y")
+
+    def __init__(self, x: float = 0.0, y: float = 0.0):
+        self.x = x
+        self.y = y
+
+    def __repr__(self):
+        return f"Vector2(x={self.x!r}, y={self.y!r})"
+
+    def __eq__(self, other):
+        if isinstance(other, Vector2):
+            return self.x == other.x and self.y == other.y
+        return NotImplemented
+
+    __hash__ = None
+
+    def __iter__(self):
+        yield self.x
+        yield self.y
+
+    def __len__(self):
+        return 2
+
+    def __getitem__(self, index):
+        return (self.x, self.y)[index]
 
     def __add__(self, other):
         return Vector2(self.x + other.x, self.y + other.y)
@@ -73,11 +98,148 @@ class Vector2:
     def __mul__(self, scalar):
         return Vector2(self.x * scalar, self.y * scalar)
 
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return Vector2(-self.x, -self.y)
+
+    # ---- in place ------------------------------------------------------------
+
+    def iadd(self, other, scale: float = 1.0):
+        """self += other * scale, without a temporary vector."""
+        self.x += other.x * scale
+        self.y += other.y * scale
+        return self
+
+    def isub(self, other):
+        self.x -= other.x
+        self.y -= other.y
+        return self
+
+    def imul(self, scalar: float):
+        self.x *= scalar
+        self.y *= scalar
+        return self
+
+    def set(self, x: float, y: float):
+        self.x = x
+        self.y = y
+        return self
+
+    def __iadd__(self, other):
+        return self.iadd(other)
+
+    def __isub__(self, other):
+        return self.isub(other)
+
+    def __imul__(self, scalar):
+        return self.imul(scalar)
+
+    def normalize_ip(self):
+        length = self.length()
+        if length != 0:
+            self.x /= length
+            self.y /= length
+        return self
+
+    def copy(self):
+        return Vector2(self.x, self.y)
+
+    # ---- lengths and distances -----------------------------------------------
+
     def length(self):
         return math.sqrt(self.x * self.x + self.y * self.y)
 
+    def length_squared(self):
+        return self.x * self.x + self.y * self.y
+
+    def distance_to(self, other):
+        """(self - other).length() without the temporary vector."""
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return math.sqrt(dx * dx + dy * dy)
+
+    def distance_squared_to(self, other):
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy
+
     def normalize(self):
         length = self.length()
         if length == 0:
             return Vector2(0, 0)
         return Vector2(self.x / length, self.y / length)
+
+    # ---- pygame interop ------------------------------------------------------
+
+    def to_pygame(self) -> pygame.math.Vector2:
+        return pygame.math.Vector2(self.x, self.y)
+
+    @classmethod
+    def from_pygame(cls, vector) -> "Vector2":
+        return cls(vector.x, vector.y)
+
+
+# ---- proximity ---------------------------------------------------------------
+# Squared-distance range checks; the batch forms take items with a .position.
+
+def within(a, b, radius: float) -> bool:
+    """True if points `a` and `b` are less than `radius` apart."""
+    dx = a.x - b.x
+    dy = a.y - b.y
+    return dx * dx + dy * dy < radius * radius
+
+
+def within_inclusive(a, b, radius: float) -> bool:
+    """True if points `a` and `b` are at most `radius` apart."""
+    dx = a.x - b.x
+    dy = a.y - b.y
+    return dx * dx + dy * dy <= radius * radius
+
+
+def within_xy(ax: float, ay: float, bx: float, by: float, radius: float) -> bool:
+    """within() on raw coordinates."""
+    dx = ax - bx
+    dy = ay - by
+    return dx * dx + dy * dy < radius * radius
+
+
+def items_within(point, items: Iterable, radius: float) -> List:
+    """The `items` whose position is within `radius` of `point`, in order."""
+    x, y = point.x, point.y
+    radius_sq = radius * radius
+    result = []
+    for item in items:
+        position = item.position
+        dx = position.x - x
+        dy = position.y - y
+        if dx * dx + dy * dy < radius_sq:
+            result.append(item)
+    return result
+
+
+def first_within(point, items: Iterable, radius: float) -> Optional[object]:
+    """The first of `items` whose position is within `radius` of `point`, else None."""
+    x, y = point.x, point.y
+    radius_sq = radius * radius
+    for item in items:
+        position = item.position
+        dx = position.x - x
+        dy = position.y - y
+        if dx * dx + dy * dy < radius_sq:
+            return item
+    return None
+
+
+def count_within(point, items: Iterable, radius: float) -> int:
+    """How many of `items` have their position within `radius` of `point`."""
+    x, y = point.x, point.y
+    radius_sq = radius * radius
+    count = 0
+    for item in items:
+        position = item.position
+        dx = position.x - x
+        dy = position.y - y
+        if dx * dx + dy * dy < radius_sq:
+            count += 1
+    return count
@@ -0,0 +1,74 @@
+from typing import Dict, Iterable, Iterator, List, Optional
+
+
+class EntityList:
+    """
+    List-like store for simulation entities (zombies, power-ups) with O(1)
+    removal and stable ids.
+
+    remove() only tombstones an entity (active = False); remove_inactive()
+    drops every tombstoned entity in one pass and the engine calls it once
+    per tick, so a frame in which hundreds of zombies die costs O(n) instead
+    of O(n²). Until then tombstoned entities are still iterated, like the
+    horde's inactive slots, and callers skip them by `active`.
+    append() stamps each entity with an `entity_id` that is never reused
+    within the list, so saves and network peers can refer to an entity by
+    id; get() looks one up.
+    """
+    def __init__(self, entities: Iterable = ()):
+        self.items: List = []
+        self.by_id: Dict[int, object] = {}
+        self.next_id = 1
+        self.extend(entities)
+
+    def append(self, entity):
+        """Add `entity`, keeping its entity_id (e.g. from a save) unless it is taken."""
+        entity_id = getattr(entity, "entity_id", None)
+        if entity_id is None or entity_id in self.by_id:
+            entity_id = self.next_id
+            entity.entity_id = entity_id
+        self.next_id = max(self.next_id, entity_id + 1)
+        self.by_id[entity_id] = entity
+        self.items.append(entity)
+        return entity
+
+    def extend(self, entities: Iterable):
+        for entity in entities:
+            self.append(entity)
+
+    def remove(self, entity):
+        """Tombstone `entity`; it leaves the list at the next remove_inactive()."""
+        entity.active = False
+
+    def remove_inactive(self):
+        """Compact the list, dropping every inactive entity."""
+        items = self.items
+        if all(entity.active for entity in items):
+            return
+        by_id = self.by_id
+        live = []
+        for entity in items:
+            if entity.active:
+                live.append(entity)
+            else:
+                by_id.pop(entity.entity_id, None)
+        self.items = live
+
+    def get(self, entity_id: int) -> Optional[object]:
+        return self.by_id.get(entity_id)
+
+    def clear(self):
+        self.items = []
+        self.by_id.clear()
+
+    def __iter__(self) -> Iterator:
+        return iter(self.items)
+
+    def __getitem__(self, index):
+        return self.items[index]
+
+    def __len__(self):
+        return len(self.items)
+
+    def __bool__(self):
+        return bool(self.items)
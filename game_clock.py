@@ -0,0 +1,107 @@
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+import pygame
+
+# Simulation step length and the most steps one rendered frame may run
+SIM_DT = 1 / 60
+MAX_STEPS_PER_FRAME = 5
+
+
+class GameClock:
+    """
+    Per-tick simulation time in milliseconds. tick() samples the source once
+    at the start of a simulation step and every timer read in that step
+    sees the same `now`, so cooldowns agree with each other and a step
+    depends only on its inputs. time_scale > 1 fast-forwards game time
+    relative to the source.
+    """
+    def __init__(self, source: Optional[Callable[[], int]] = None, time_scale: float = 1.0):
+        self.source = source if source is not None else pygame.time.get_ticks
+        self.time_scale = time_scale
+        self._source_origin = self.source()
+        self._origin = self._source_origin
+        self.now = self._origin
+
+    def tick(self) -> int:
+        """Advance `now` to the source's current time and return it."""
+        elapsed = self.source() - self._source_origin
+        self.now = self._origin + int(elapsed * self.time_scale)
+        return self.now
+
+    def reset(self, now: int):
+        """Continue from `now`, e.g. the clock time a loaded save was made at."""
+        self._source_origin = self.source()
+        self._origin = now
+        self.now = now
+
+    def set_time_scale(self, time_scale: float):
+        """Change speed from the current `now` on, without jumping."""
+        self.tick()
+        self._source_origin = self.source()
+        self._origin = self.now
+        self.time_scale = time_scale
+
+
+class FixedTimestep:
+    """
+    Accumulator for a fixed-step simulation loop. advance() takes the real
+    frame time and returns how many `step`-second simulation steps are due;
+    the remainder carries over and `alpha` is how far the frame is into the
+    next step (0..1), for interpolated rendering. If a frame owes more than
+    `max_steps` steps the backlog is dropped, so a slow machine runs the
+    game slower instead of falling further behind every frame.
+    """
+    def __init__(self, step: float = SIM_DT, max_steps: int = MAX_STEPS_PER_FRAME):
+        self.step = step
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.alpha = 0.0
+
+    def advance(self, frame_dt: float) -> int:
+        self.accumulator += frame_dt
+        steps = int(self.accumulator / self.step)
+        if steps > self.max_steps:
+            steps = self.max_steps
+            self.accumulator = steps * self.step
+        self.accumulator -= steps * self.step
+        self.alpha = self.accumulator / self.step
+        return steps
+
+
+_clock: Optional[GameClock] = None
+
+
+def get_ticks() -> int:
+    """Game time in milliseconds: the active clock's `now`, else pygame.time.get_ticks."""
+    if _clock is None:
+        return pygame.time.get_ticks()
+    return _clock.now
+
+
+@contextmanager
+def use_clock(clock: Optional[GameClock]):
+    """Make `clock` the game time source inside the with block (None: wall-clock time)."""
+    global _clock
+    previous = _clock
+    _clock = clock
+    try:
+        yield clock
+    finally:
+        _clock = previous
+
+
+class VirtualClock:
+    """
+    Millisecond clock that only moves when advanced, so a headless engine
+    can simulate an hour of play as fast as the CPU allows.
+    """
+    def __init__(self, start_ms: int = 0):
+        self.ms = float(start_ms)
+
+    def advance(self, dt: float):
+        """Move time forward by `dt` seconds."""
+        self.ms += dt * 1000
+
+    def __call__(self) -> int:
+        return int(self.ms)
@@ -0,0 +1,319 @@
+import random
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core import Vector2
+from interpolation import lerp_arrays
+
+ATTACK_COOLDOWN = 1000
+
+
+class ZombieView:
+    """
+    Per-zombie handle into a ZombieHorde slot.
+    Exposes the same attributes as a module Zombie (position, health, type...)
+    so rendering, saving, collisions and networking keep working unchanged.
+    Mixed in front of the module's Zombie class, so its methods
+    (render, take_damage, can_attack, attack) run on top of the arrays.
+    """
+    @property
+    def position(self) -> Vector2:
+        horde, slot = self._horde, self._slot
+        return Vector2(horde.x.item(slot), horde.y.item(slot))
+
+    @position.setter
+    def position(self, value: Vector2):
+        self._horde.x[self._slot] = value.x
+        self._horde.y[self._slot] = value.y
+
+    @property
+    def type(self):
+        return self._horde.zombie_types[self._horde.type_index.item(self._slot)]
+
+    @type.setter
+    def type(self, value):
+        self._horde.type_index[self._slot] = self._horde.zombie_types.index(value)
+
+    def _field(name, cast):
+        def getter(self):
+            return cast(getattr(self._horde, name).item(self._slot))
+
+        def setter(self, value):
+            getattr(self._horde, name)[self._slot] = value
+
+        return property(getter, setter)
+
+    strength = _field("strength", int)
+    size = _field("size", int)
+    speed = _field("speed", float)
+    health = _field("health", int)
+    max_health = _field("max_health", int)
+    last_attack_time = _field("last_attack_time", float)
+    active = _field("active", bool)
+    entity_id = _field("entity_id", int)
+    del _field
+
+
+class ZombieHorde:
+    """
+    Structure-of-arrays zombie simulation backend.
+
+    All positions, speeds, health and types live in NumPy arrays and
+    `update` moves the whole horde with batched array operations (target
+    selection, movement, protection-circle deflection). The container
+    behaves like the engine's zombie list: iterate it, `append` zombies,
+    `remove`/`clear` them. Items are ZombieView objects. Like EntityList,
+    every zombie gets a stable `entity_id` and get() looks one up.
+    """
+    def __init__(self, zombie_cls, zombie_types, capacity: int = 256, seed: Optional[int] = None):
+        self.zombie_types = list(zombie_types)
+        self.view_cls = type(f"Horde{zombie_cls.__name__}", (ZombieView, zombie_cls), {})
+        self.zombie_cls = zombie_cls
+        self.rng = np.random.default_rng(seed if seed is not None else random.getrandbits(64))
+        self.views: List[Optional[ZombieView]] = []
+        self.free_slots: List[int] = []
+        self.high_water = 0
+        self.count = 0
+        self.by_id: Dict[int, int] = {}
+        self.next_id = 1
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int):
+        old = self.high_water
+        self.capacity = capacity
+
+        def grow(name, dtype):
+            array = np.zeros(capacity, dtype=dtype)
+            if old:
+                array[:old] = getattr(self, name)[:old]
+            setattr(self, name, array)
+
+        grow("x", np.float64)
+        grow("y", np.float64)
+        grow("prev_x", np.float64)
+        grow("prev_y", np.float64)
+        grow("speed", np.float64)
+        grow("health", np.int64)
+        grow("max_health", np.int64)
+        grow("size", np.int64)
+        grow("strength", np.int64)
+        grow("type_index", np.int8)
+        grow("last_attack_time", np.float64)
+        grow("active", np.bool_)
+        grow("used", np.bool_)
+        grow("entity_id", np.int64)
+        self.views.extend([None] * (capacity - len(self.views)))
+
+    # ---- list-like container -------------------------------------------------
+
+    def append(self, zombie) -> ZombieView:
+        """Copy a Zombie (or another horde's view) into a free slot."""
+        if isinstance(zombie, ZombieView) and zombie._horde is self:
+            return zombie
+        if self.free_slots:
+            slot = self.free_slots.pop()
+        else:
+            if self.high_water == self.capacity:
+                self._allocate(self.capacity * 2)
+            slot = self.high_water
+            self.high_water += 1
+        position = zombie.position
+        self.x[slot] = self.prev_x[slot] = position.x
+        self.y[slot] = self.prev_y[slot] = position.y
+        self.speed[slot] = zombie.speed
+        self.health[slot] = zombie.health
+        self.max_health[slot] = zombie.max_health
+        self.size[slot] = zombie.size
+        self.strength[slot] = zombie.strength
+        self.type_index[slot] = self.zombie_types.index(zombie.type)
+        self.last_attack_time[slot] = zombie.last_attack_time
+        self.active[slot] = zombie.active
+        self.used[slot] = True
+        entity_id = getattr(zombie, "entity_id", None)
+        if entity_id is None or entity_id in self.by_id:
+            entity_id = self.next_id
+        self.next_id = max(self.next_id, entity_id + 1)
+        self.entity_id[slot] = entity_id
+        self.by_id[entity_id] = slot
+        view = self.view_cls.__new__(self.view_cls)
+        view._horde = self
+        view._slot = slot
+        self.views[slot] = view
+        self.count += 1
+        return view
+
+    def extend(self, zombies):
+        for zombie in zombies:
+            self.append(zombie)
+
+    def remove(self, view: ZombieView):
+        if not isinstance(view, ZombieView) or view._horde is not self:
+            raise ValueError("zombie is not in this horde")
+        self._free(view._slot)
+
+    def _free(self, slot: int):
+        view = self.views[slot]
+        if view is not None:
+            # Whoever still holds the view (targets, saves) keeps a plain,
+            # detached Zombie with the final values instead of a slot that
+            # may be refilled by a new zombie.
+            snapshot = self.snapshot(slot)
+            view.__class__ = self.zombie_cls
+            view.__dict__.clear()
+            view.__dict__.update(snapshot)
+        self.views[slot] = None
+        self.by_id.pop(self.entity_id.item(slot), None)
+        self.used[slot] = False
+        self.active[slot] = False
+        self.free_slots.append(slot)
+        self.count -= 1
+
+    def snapshot(self, slot: int) -> dict:
+        return {
+            "position": Vector2(self.x.item(slot), self.y.item(slot)),
+            "speed": self.speed.item(slot),
+            "health": self.health.item(slot),
+            "max_health": self.max_health.item(slot),
+            "size": self.size.item(slot),
+            "strength": self.strength.item(slot),
+            "type": self.zombie_types[self.type_index.item(slot)],
+            "last_attack_time": self.last_attack_time.item(slot),
+            "active": bool(self.active.item(slot)),
+            "entity_id": self.entity_id.item(slot),
+        }
+
+    def get(self, entity_id: int) -> Optional[ZombieView]:
+        slot = self.by_id.get(entity_id)
+        return None if slot is None else self.views[slot]
+
+    def clear(self):
+        for slot in np.flatnonzero(self.used[:self.high_water]):
+            self._free(int(slot))
+        self.free_slots.clear()
+        self.high_water = 0
+
+    def remove_inactive(self):
+        n = self.high_water
+        for slot in np.flatnonzero(self.used[:n] & ~self.active[:n]):
+            self._free(int(slot))
+
+    def store_previous(self):
+        """Remember positions before a simulation step, for interpolated()."""
+        np.copyto(self.prev_x, self.x)
+        np.copyto(self.prev_y, self.y)
+
+    @contextmanager
+    def interpolated(self, alpha: float):
+        """While active, views report positions `alpha` of the way into the last step."""
+        x, y = self.x, self.y
+        self.x, self.y = lerp_arrays(x, y, self.prev_x, self.prev_y, alpha)
+        try:
+            yield
+        finally:
+            self.x, self.y = x, y
+
+    def __iter__(self) -> Iterator[ZombieView]:
+        views = self.views
+        for slot in np.flatnonzero(self.used[:self.high_water]).tolist():
+            yield views[slot]
+
+    def __getitem__(self, index):
+        return list(self)[index]
+
+    def __len__(self):
+        return self.count
+
+    def __bool__(self):
+        return self.count > 0
+
+    # ---- batched simulation --------------------------------------------------
+
+    def update(self, dt: float, player_positions: List[Vector2], protection_circles: List):
+        """Vectorized equivalent of calling Zombie.update on every zombie."""
+        n = self.high_water
+        if not n or not player_positions:
+            return
+        x = self.x[:n]
+        y = self.y[:n]
+        pending = self.used[:n] & self.active[:n] & (self.health[:n] > 0)
+        if not pending.any():
+            return
+
+        # Nearest alive player per zombie
+        px = np.fromiter((p.x for p in player_positions), np.float64, len(player_positions))
+        py = np.fromiter((p.y for p in player_positions), np.float64, len(player_positions))
+        nearest = np.argmin((px[None, :] - x[:, None]) ** 2 + (py[None, :] - y[:, None]) ** 2, axis=1)
+        to_x = px[nearest] - x
+        to_y = py[nearest] - y
+        dir_x, dir_y = _normalize(to_x, to_y)
+        step = self.speed[:n] * dt
+
+        for circle in protection_circles:
+            if not circle['active']:
+                continue
+            cx = circle['position'].x
+            cy = circle['position'].y
+            radius = circle['radius']
+            off_x = cx - x
+            off_y = cy - y
+            # Squared distances throughout, like core.within
+            circle_dist_sq = off_x * off_x + off_y * off_y
+
+            # Zombies touching the circle die
+            touch = radius + self.size[:n] // 2
+            touching = pending & (circle_dist_sq <= touch * touch)
+            self.active[:n][touching] = False
+            pending &= ~touching
+
+            # Zombies whose path crosses the circle walk around it
+            future_x = x + dir_x * step * 5 - cx
+            future_y = y + dir_y * step * 5 - cy
+            redirect = pending & (future_x * future_x + future_y * future_y < (radius + 20) ** 2)
+            if redirect.any():
+                circle_x, circle_y = _normalize(off_x, off_y)
+                flip = np.where(self.rng.random(n) < 0.5, -1.0, 1.0)
+                perp_x = -circle_y * flip
+                perp_y = circle_x * flip
+                move_x, move_y = _normalize(dir_x + perp_x * 2, dir_y + perp_y * 2)
+                x[redirect] += (move_x * step)[redirect]
+                y[redirect] += (move_y * step)[redirect]
+                pending &= ~redirect
+
+        x[pending] += (dir_x * step)[pending]
+        y[pending] += (dir_y * step)[pending]
+
+        bad = pending & ~(np.isfinite(x) & np.isfinite(y))
+        for slot in np.flatnonzero(bad):
+            print(f"[ERROR] {self.zombie_cls.__name__} pozitsiyasi noto'g'ri: {self.views[slot].position}")
+
+    def attackers(self, target_positions: Sequence[Vector2], reaches: Sequence[float],
+                  current_time: float) -> Iterator[Tuple[ZombieView, List[bool]]]:
+        """
+        Yield (zombie, in_reach) for every zombie that is off cooldown and
+        strictly within reach of at least one target. `in_reach[i]` tells
+        whether target i is in reach; the caller applies the game rules.
+        """
+        n = self.high_water
+        if not n or not target_positions:
+            return
+        ready = self.used[:n] & (current_time - self.last_attack_time[:n] >= ATTACK_COOLDOWN)
+        if not ready.any():
+            return
+        tx = np.fromiter((p.x for p in target_positions), np.float64, len(target_positions))
+        ty = np.fromiter((p.y for p in target_positions), np.float64, len(target_positions))
+        reach = np.asarray(reaches, dtype=np.float64)
+        dx = tx[None, :] - self.x[:n, None]
+        dy = ty[None, :] - self.y[:n, None]
+        in_reach = dx * dx + dy * dy < (reach * reach)[None, :]
+        candidates = ready & in_reach.any(axis=1)
+        for slot in np.flatnonzero(candidates).tolist():
+            yield self.views[slot], in_reach[slot].tolist()
+
+
+def _normalize(vx: np.ndarray, vy: np.ndarray):
+    """Unit vectors (0, 0 for zero-length), matching Vector2.normalize."""
+    length = np.hypot(vx, vy)
+    safe = np.where(length == 0, 1.0, length)
+    return np.where(length == 0, 0.0, vx / safe), np.where(length == 0, 0.0, vy / safe)
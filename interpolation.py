@@ -0,0 +1,65 @@
+from contextlib import contextmanager
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+
+from core import Vector2
+
+# Entities that moved further than this in one step (respawn, revive
+# teleport, a pool slot handed to a new entity) are drawn where they are
+# instead of sliding across the screen.
+MAX_BLEND_DISTANCE = 64
+
+
+def lerp_position(prev_x: float, prev_y: float, current: Vector2, alpha: float) -> Vector2:
+    """Point `alpha` of the way from the previous step's position to `current`."""
+    dx = current.x - prev_x
+    dy = current.y - prev_y
+    if dx * dx + dy * dy > MAX_BLEND_DISTANCE * MAX_BLEND_DISTANCE:
+        return current
+    return Vector2(prev_x + dx * alpha, prev_y + dy * alpha)
+
+
+def lerp_arrays(x: np.ndarray, y: np.ndarray, prev_x: np.ndarray, prev_y: np.ndarray,
+                alpha: float) -> Tuple[np.ndarray, np.ndarray]:
+    """lerp_position for whole coordinate arrays; returns new arrays."""
+    dx = x - prev_x
+    dy = y - prev_y
+    jumped = dx * dx + dy * dy > MAX_BLEND_DISTANCE * MAX_BLEND_DISTANCE
+    blend_x = prev_x + dx * alpha
+    blend_y = prev_y + dy * alpha
+    np.copyto(blend_x, x, where=jumped)
+    np.copyto(blend_y, y, where=jumped)
+    return blend_x, blend_y
+
+
+class Interpolator:
+    """
+    Previous-step positions of objects with a `position` Vector2 (players,
+    drones, zombies, the base). capture() runs before every fixed step;
+    blend() moves the objects partway to their current position for the
+    duration of a render and puts the simulated positions back afterwards.
+    """
+    def __init__(self):
+        self.previous: Dict[int, Tuple[object, float, float]] = {}
+
+    def capture(self, objects: Iterable):
+        self.previous = {id(obj): (obj, obj.position.x, obj.position.y) for obj in objects}
+
+    @contextmanager
+    def blend(self, objects: Iterable, alpha: float):
+        moved = []
+        for obj in objects:
+            entry = self.previous.get(id(obj))
+            if entry is None or entry[0] is not obj:
+                continue
+            current = obj.position
+            blended = lerp_position(entry[1], entry[2], current, alpha)
+            if blended is not current:
+                obj.position = blended
+                moved.append((obj, current))
+        try:
+            yield
+        finally:
+            for obj, current in moved:
+                obj.position = current
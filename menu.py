@@ -5,9 +5,12 @@ import traceback
 import pygame
 from loading import LoadingScreen
 from core import WHITE, BLACK, FPS
-from Moduls.default.save_load import save_game, delete_save, list_saved_games, load_game_data, load_from_data, save_last_session, AUTOSAVE_PATH, SAVE_ROOT
+from autosave import AUTOSAVER
+from Moduls.default.save_load import save_game, delete_save, list_saved_games, load_from_data, save_last_session, get_save_path, AUTOSAVE_PATH, SAVE_ROOT
+from save_index import SAVE_INDEX
 from network import HostServer, Client, get_local_ip
 from session import Session
+from replay import seed_session
 import importlib
 import Moduls.default.game_logic as game_logic
 
@@ -215,9 +218,15 @@ class Menu:
                 # Engine setup
                 modul_game_logic = importlib.import_module(f"Moduls.{modul_name}.game_logic")
                 if hasattr(modul_game_logic, "GameEngine"):
+                    # Seed before building the engine so the session can be replayed
+                    seed = seed_session()
                     engine = modul_game_logic.GameEngine(self.screen, self.screen_width, self.screen_height)
                     engine.setup_players(self.loading_selected_slots)
                     engine.setup_world()
+                    try:
+                        engine.start_recording(seed, modul_name, self.loading_selected_slots)
+                    except OSError as e:
+                        print(f"[MENU] Recording disabled: {e}")
                     self.game_engine = engine
                     self.state = "PLAYING"
         except Exception as e:
@@ -237,8 +246,18 @@ class Menu:
                 print(f"[MENU] Failed to import save_load for {modul_name}: {e}")
                 save_load_mod = importlib.import_module("Moduls.default.save_load")
 
+            # Progress bar while the save is read; pumping events keeps the window responsive
+            loading_screen = LoadingScreen(self.screen, self.screen_width, self.screen_height, self.font, self.small_font)
+            loading_screen.set_text(f"Loading {save_name}...")
+
+            def show_progress(percent):
+                loading_screen.set_percent(percent)
+                loading_screen.render()
+                pygame.display.flip()
+                pygame.event.pump()
+
             try:
-                data = save_load_mod.load_game_data(save_name, modul_name=modul_name)
+                data = save_load_mod.load_game_data(save_name, progress_callback=show_progress, modul_name=modul_name)
             except Exception as e:
                 print(f"[MENU] load_game_data error for {modul_name}: {e}")
                 return
@@ -738,17 +757,15 @@ class Menu:
             name_text = self.font.render(f"{i + page * page_size}. {save_name}", True, WHITE)
             self.screen.blit(name_text, slot_rect.move(20, 10))
             
-            try:
-                data = load_game_data(save_name, modul_name=load_selected_modul)
-                player_count = sum(1 for p in data.get("player", []) if p.get("type", "player") == "player")
-                bot_count = sum(1 for p in data.get("player", []) if p.get("type", "player") == "bot")
-                play_time = data.get("meta", {}).get("game_time", 0)
-                minutes = play_time // 60000
+            # Cached per file; reread only after the save changes
+            summary = SAVE_INDEX.summary(get_save_path(save_name, modul_name=load_selected_modul))
+            if summary:
+                minutes = summary["game_time"] // 60000
                 hours = minutes // 60
                 minutes = minutes % 60
                 time_str = f"{hours}h {minutes}m" if hours else f"{minutes}m"
-                info = f"Players: {player_count} | Bots: {bot_count} | Time: {time_str}"
-            except Exception:
+                info = f"Players: {summary['players']} | Bots: {summary['bots']} | Time: {time_str}"
+            else:
                 info = "Corrupted or missing data"
             info_text = self.small_font.render(info, True, WHITE)
             self.screen.blit(info_text, slot_rect.move(20, 40))
@@ -909,18 +926,20 @@ class Menu:
                 game_running = self.game_engine.handle_events()
                 if not game_running:
                     # Pygame QUIT bo'lsa
+                    # Let a pending autosave finish before the process exits
+                    AUTOSAVER.flush(timeout=5)
                     running = False
                     break
                 
-                dt = self.game_engine.clock.tick(60) / 1000.0
-                self.game_engine.game_time = pygame.time.get_ticks() - self.game_engine.game_start_time
+                frame_dt = self.game_engine.clock.tick(60) / 1000.0
                 
-                self.game_engine.step_update(dt)
+                self.game_engine.advance_frame(frame_dt)
                 self.game_engine.render()
                 pygame.display.flip()
                 
                 # Game MAIN_MENU ga qaytsa, loopni tugat
                 if self.game_engine.state == "MAIN_MENU":
+                    self.game_engine.stop_recording()
                     self.game_engine = None
                     self.state = "MAIN_MENU"
                     continue
@@ -0,0 +1,201 @@
+import csv
+import gc
+import os
+import sys
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from typing import Deque, Dict, List, Optional, Sequence
+
+import pygame
+
+from render_cache import render_text
+
+PROFILE_DIR = os.path.join(os.path.expanduser("~"), "Documents", "Unknown_World", "profiles")
+FRAME_BUDGET_MS = 1000 / 60
+HISTORY_FRAMES = 120
+# The overlay text is rebuilt this often so changing numbers don't churn the text cache
+OVERLAY_REFRESH_FRAMES = 15
+OVERLAY_FONT_SIZE = 20
+
+# Named after the engine methods they time
+UPDATE_PHASES = ("update_day_night_cycle", "update_players", "update_zombies", "update_bullets",
+                 "spawn_zombies", "spawn_power_ups", "check_collisions", "update_camera",
+                 "check_game_over", "autosave")
+RENDER_PHASES = ("render_world", "render_entities", "render_overlays", "render_hud")
+
+_NOT_TIMED = nullcontext()
+
+
+def _gc_collections() -> int:
+    return sum(generation["collections"] for generation in gc.get_stats())
+
+
+class FrameProfiler:
+    """
+    Per-frame cost of the engine's update and render phases.
+
+    Phases are only timed while the overlay is shown, a CSV is being
+    recorded or `collect` is set (benchmarks); otherwise phase() returns a
+    shared no-op context manager.
+    A frame runs from one end_frame() to the next, so with several fixed
+    steps in a frame a phase reports its total over those steps.
+    Each frame also records the caller's entity counts, the net change in
+    allocated memory blocks and the number of garbage collections.
+    """
+    def __init__(self, phases: Sequence[str] = UPDATE_PHASES + RENDER_PHASES,
+                 history: int = HISTORY_FRAMES):
+        self.phases = list(phases)
+        self.show_overlay = False
+        self.collect = False
+        self.history: Deque[Dict[str, float]] = deque(maxlen=history)
+        self.current: Dict[str, float] = {}
+        self.frame_index = 0
+        self.csv_path: Optional[str] = None
+        self.csv_file = None
+        self.csv_writer = None
+        self.overlay_lines: List[tuple] = []
+        self._reset_frame()
+
+    @property
+    def enabled(self) -> bool:
+        return self.collect or self.show_overlay or self.csv_file is not None
+
+    def _reset_frame(self):
+        self.current = {}
+        self.frame_start = time.perf_counter()
+        self.blocks_start = sys.getallocatedblocks()
+        self.collections_start = _gc_collections()
+
+    def phase(self, name: str):
+        """Context manager timing one phase; no-op while profiling is off."""
+        if not self.enabled:
+            return _NOT_TIMED
+        return self._timed(name)
+
+    @contextmanager
+    def _timed(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            self.current[name] = self.current.get(name, 0.0) + elapsed
+
+    def end_frame(self, counts: Optional[Dict[str, int]] = None):
+        """Close the current frame and start the next one."""
+        if self.enabled:
+            record = {"frame": self.frame_index,
+                      "frame_ms": (time.perf_counter() - self.frame_start) * 1000}
+            for name in self.phases:
+                record[name] = self.current.get(name, 0.0)
+            record.update(counts or {})
+            record["alloc_blocks"] = sys.getallocatedblocks() - self.blocks_start
+            record["gc_collections"] = _gc_collections() - self.collections_start
+            self.history.append(record)
+            if self.csv_file is not None:
+                self._write_csv(record)
+        self.frame_index += 1
+        self._reset_frame()
+
+    # ---- CSV export ----------------------------------------------------------
+
+    def start_csv(self, path: Optional[str] = None) -> str:
+        """Write one row per frame to `path` (default: a timestamped file in PROFILE_DIR)."""
+        self.stop_csv()
+        if path is None:
+            os.makedirs(PROFILE_DIR, exist_ok=True)
+            stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            path = os.path.join(PROFILE_DIR, f"frame_profile_{stamp}.csv")
+        # Line buffered: every frame is on disk even if the game exits abruptly
+        self.csv_file = open(path, "w", newline="", buffering=1)
+        self.csv_path = path
+        return path
+
+    def _write_csv(self, record: Dict[str, float]):
+        if self.csv_writer is None:
+            # Columns are fixed by the first recorded frame's counts
+            self.csv_writer = csv.DictWriter(self.csv_file, fieldnames=list(record),
+                                             restval=0, extrasaction="ignore")
+            self.csv_writer.writeheader()
+        self.csv_writer.writerow({key: round(value, 4) if isinstance(value, float) else value
+                                  for key, value in record.items()})
+
+    def stop_csv(self) -> Optional[str]:
+        path = self.csv_path
+        if self.csv_file is not None:
+            self.csv_file.close()
+        self.csv_file = None
+        self.csv_writer = None
+        self.csv_path = None
+        return path
+
+    def toggle_csv(self):
+        if self.csv_file is not None:
+            print(f"[Profiler] CSV saqlandi: {self.stop_csv()}")
+        else:
+            print(f"[Profiler] CSV yozilmoqda: {self.start_csv()}")
+
+    def toggle_overlay(self):
+        self.show_overlay = not self.show_overlay
+        self.overlay_lines = []
+
+    # ---- overlay -------------------------------------------------------------
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Mean and max of every recorded column over the history window."""
+        result = {}
+        if not self.history:
+            return result
+        for key in self.history[-1]:
+            if key == "frame":
+                continue
+            values = [record.get(key, 0) for record in self.history]
+            result[key] = {"mean": sum(values) / len(values), "max": max(values)}
+        return result
+
+    def _build_overlay_lines(self) -> List[tuple]:
+        """(label, value, colour) rows; phase rows put their timings in the value column."""
+        stats = self.summary()
+        if not stats:
+            return []
+        frame = stats["frame_ms"]
+        budget_color = (255, 80, 80) if frame["max"] > FRAME_BUDGET_MS else (120, 255, 120)
+        lines = [(f"frame {frame['mean']:.2f} ms (max {frame['max']:.2f}, budget {FRAME_BUDGET_MS:.1f})",
+                  "", budget_color)]
+        for name in self.phases:
+            phase = stats[name]
+            if phase["max"] > 0:
+                lines.append((name, f"{phase['mean']:.2f}  max {phase['max']:.2f}", (255, 255, 255)))
+        allocations = ("alloc_blocks", "gc_collections")
+        counts = [key for key in stats if key not in self.phases and key != "frame_ms" and key not in allocations]
+        lines.append(("  ".join(f"{key} {stats[key]['mean']:.0f}" for key in counts), "", (200, 200, 120)))
+        lines.append((f"alloc blocks/frame {stats['alloc_blocks']['mean']:+.0f}  "
+                      f"gc/frame {stats['gc_collections']['mean']:.2f}", "", (200, 200, 120)))
+        if self.csv_file is not None:
+            lines.append((f"REC {os.path.basename(self.csv_path)}", "", (255, 80, 80)))
+        return lines
+
+    def render(self, screen):
+        """Draw the overlay in the bottom-left corner when it is shown."""
+        if not self.show_overlay:
+            return
+        if not self.overlay_lines or self.frame_index % OVERLAY_REFRESH_FRAMES == 0:
+            self.overlay_lines = self._build_overlay_lines()
+        if not self.overlay_lines:
+            return
+        rows = [(render_text(label, OVERLAY_FONT_SIZE, color),
+                 render_text(value, OVERLAY_FONT_SIZE, color) if value else None)
+                for label, value, color in self.overlay_lines]
+        value_x = 16 + max((label.get_width() for label, value in rows if value), default=0) + 12
+        width = max(value_x + value.get_width() if value else 16 + label.get_width() for label, value in rows)
+        line_height = OVERLAY_FONT_SIZE - 4
+        height = line_height * len(rows) + 10
+        top = screen.get_height() - height - 10
+        pygame.draw.rect(screen, (0, 0, 0), (10, top, width, height))
+        for i, (label, value) in enumerate(rows):
+            y = top + 5 + i * line_height
+            screen.blit(label, (16, y))
+            if value:
+                screen.blit(value, (value_x, y))
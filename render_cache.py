@@ -0,0 +1,73 @@
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+import pygame
+
+# LRU limits. HUD and level labels are a few dozen distinct strings; the
+# limits only guard against unbounded growth from changing numbers.
+MAX_TEXT_SURFACES = 512
+MAX_SPRITES = 256
+
+_fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+_texts: "OrderedDict[Hashable, pygame.Surface]" = OrderedDict()
+_sprites: "OrderedDict[Hashable, pygame.Surface]" = OrderedDict()
+_stats = {"text_hits": 0, "text_misses": 0, "sprite_hits": 0, "sprite_misses": 0}
+
+
+def get_font(size: int, name: Optional[str] = None) -> pygame.font.Font:
+    """Shared Font instance; creating a Font loads the font file every time."""
+    key = (name, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.Font(name, size)
+        _fonts[key] = font
+    return font
+
+
+def render_text(text: str, size: int, color, antialias: bool = True,
+                font_name: Optional[str] = None) -> pygame.Surface:
+    """Font.render with the result cached by content, size and colour."""
+    key = (font_name, size, text, tuple(color), antialias)
+    surface = _texts.get(key)
+    if surface is not None:
+        _texts.move_to_end(key)
+        _stats["text_hits"] += 1
+        return surface
+    _stats["text_misses"] += 1
+    surface = get_font(size, font_name).render(text, antialias, color)
+    _texts[key] = surface
+    if len(_texts) > MAX_TEXT_SURFACES:
+        _texts.popitem(last=False)
+    return surface
+
+
+def get_sprite(key: Hashable, build: Callable[[], pygame.Surface]) -> pygame.Surface:
+    """Return the cached surface for `key`, rasterizing it with `build()` once."""
+    surface = _sprites.get(key)
+    if surface is not None:
+        _sprites.move_to_end(key)
+        _stats["sprite_hits"] += 1
+        return surface
+    _stats["sprite_misses"] += 1
+    surface = build()
+    _sprites[key] = surface
+    if len(_sprites) > MAX_SPRITES:
+        _sprites.popitem(last=False)
+    return surface
+
+
+def new_sprite_surface(width: int, height: int) -> pygame.Surface:
+    """Transparent surface to draw a sprite into."""
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert_alpha()
+    return surface
+
+
+def get_stats() -> dict:
+    return dict(_stats, fonts=len(_fonts), texts=len(_texts), sprites=len(_sprites))
+
+
+def clear():
+    _texts.clear()
+    _sprites.clear()
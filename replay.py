@@ -0,0 +1,196 @@
+"""
+Deterministic session recording and replay.
+
+A session is reproducible from its global `random` seed, its setup (module,
+player slots, backend) and the human input of every simulation step, since
+game time comes from the step-driven clock. InputRecorder writes that to a
+compact binary log: a header, then a 9-byte event only when a player's
+input or the pause state changes, plus a state checksum every
+CHECK_INTERVAL steps. replay() drives a headless engine from the log and
+reports the first step whose checksum differs, if any.
+
+Sessions loaded from a save or joined over the network are not recorded.
+"""
+import importlib
+import json
+import os
+import random
+import struct
+import time
+import zlib
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+MAGIC = b"UWRL"
+VERSION = 1
+HEADER = struct.Struct("<4sHQdI")    # magic, version, seed, step dt, metadata length
+EVENT = struct.Struct("<IBI")        # step, code, value
+EVENT_PAUSE = 0xF0
+EVENT_CHECK = 0xF1
+EVENT_END = 0xFF
+CHECK_INTERVAL = 60
+
+INPUT_FLAGS = ("move_up", "move_down", "move_left", "move_right", "shooting", "orbit_left", "orbit_right")
+
+REPLAY_DIR = os.path.join(os.path.expanduser("~"), "Documents", "Unknown_World", "replays")
+MAX_REPLAYS = 10
+
+
+def seed_session(seed: Optional[int] = None) -> int:
+    """Seed the global `random` module for a new session and return the seed."""
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(32)
+    random.seed(seed)
+    return seed
+
+
+def input_mask(player) -> int:
+    mask = 0
+    for bit, flag in enumerate(INPUT_FLAGS):
+        if getattr(player, flag, False):
+            mask |= 1 << bit
+    return mask
+
+
+def apply_input_mask(player, mask: int):
+    for bit, flag in enumerate(INPUT_FLAGS):
+        value = bool(mask & (1 << bit))
+        if value or hasattr(player, flag):
+            setattr(player, flag, value)
+
+
+def fingerprint(engine) -> int:
+    """CRC32 of the gameplay state: time, counters, players and the horde's centre of mass."""
+    values = [engine.game_time, engine.zombies_killed, len(engine.zombies), len(engine.bullets)]
+    for player in engine.players:
+        values += [player.id, player.position.x, player.position.y, player.health, player.level, player.zombie_kills]
+    zombie_x = zombie_y = 0.0
+    for zombie in engine.zombies:
+        position = zombie.position
+        zombie_x += position.x
+        zombie_y += position.y
+    values += [zombie_x, zombie_y]
+    base = getattr(engine, "base", None)
+    if base is not None:
+        values += [base.health, base.position.x, base.position.y]
+    packed = struct.pack(f"<{len(values)}d", *values) + engine.state.encode()
+    return zlib.crc32(packed)
+
+
+class InputRecorder:
+    """Writes one session's input log; the engine calls capture() before every step."""
+    def __init__(self, path: str, seed: int, dt: float, meta: Dict):
+        self.path = path
+        self.file = open(path, "wb")
+        encoded = json.dumps(meta).encode()
+        self.file.write(HEADER.pack(MAGIC, VERSION, seed, dt, len(encoded)))
+        self.file.write(encoded)
+        self.step = 0
+        self.masks: Dict[int, int] = {}
+        self.paused = False
+
+    def _event(self, code: int, value: int):
+        self.file.write(EVENT.pack(self.step, code, value))
+
+    def capture(self, engine):
+        if self.step % CHECK_INTERVAL == 0:
+            self._event(EVENT_CHECK, fingerprint(engine))
+        paused = engine.state == "PAUSED"
+        if paused != self.paused:
+            self._event(EVENT_PAUSE, int(paused))
+            self.paused = paused
+        for player in engine.players:
+            if not getattr(player, "controls", None):
+                continue
+            mask = input_mask(player)
+            if self.masks.get(player.id, 0) != mask:
+                self._event(player.id, mask)
+                self.masks[player.id] = mask
+        self.step += 1
+
+    def close(self) -> str:
+        if not self.file.closed:
+            self._event(EVENT_END, 0)
+            self.file.close()
+        return self.path
+
+
+def new_recording_path(modul_name: str) -> str:
+    """Timestamped log path in REPLAY_DIR; only the newest MAX_REPLAYS logs are kept."""
+    os.makedirs(REPLAY_DIR, exist_ok=True)
+    logs = sorted(name for name in os.listdir(REPLAY_DIR) if name.endswith(".uwr"))
+    for name in logs[:max(0, len(logs) - MAX_REPLAYS + 1)]:
+        os.remove(os.path.join(REPLAY_DIR, name))
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return os.path.join(REPLAY_DIR, f"{stamp}_{modul_name}.uwr")
+
+
+def read_log(path: str) -> Tuple[int, float, Dict, List[Tuple[int, int, int]]]:
+    """Return (seed, dt, metadata, events) of a recorded session."""
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, version, seed, dt, meta_length = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} replay log")
+    offset = HEADER.size
+    meta = json.loads(data[offset:offset + meta_length].decode())
+    offset += meta_length
+    # A session that ended abruptly has no END event and may end mid-record
+    usable = offset + (len(data) - offset) // EVENT.size * EVENT.size
+    events = list(EVENT.iter_unpack(data[offset:usable]))
+    return seed, dt, meta, events
+
+
+def replay(path: str, profiler=None) -> Dict:
+    """
+    Re-run a recorded session on a headless engine, step by step.
+    Returns throughput, end state and `desync_step`: the first step whose
+    checksum differs from the recording (None when the replay matched).
+    """
+    seed, dt, meta, events = read_log(path)
+    game_logic = importlib.import_module(f"Moduls.{meta['module']}.game_logic")
+    seed_session(seed)
+    engine = game_logic.GameEngine(None, meta["width"], meta["height"], use_horde=meta["use_horde"],
+                                   headless=True, time_scale=meta["time_scale"])
+    if profiler is not None:
+        engine.profiler = profiler
+    engine._last_selected_slots = meta["slots"]
+    engine.setup_players(meta["slots"])
+    engine.setup_world()
+    players = {player.id: player for player in engine.players}
+
+    last_step = events[-1][0] if events else 0
+    desync_step = None
+    checks = 0
+    index = 0
+    start = time.perf_counter()
+    for step in range(last_step):
+        while index < len(events) and events[index][0] == step:
+            _, code, value = events[index]
+            index += 1
+            if code == EVENT_CHECK:
+                checks += 1
+                if desync_step is None and fingerprint(engine) != value:
+                    desync_step = step
+            elif code == EVENT_PAUSE:
+                if engine.state in ("PLAYING", "PAUSED"):
+                    engine.state = "PAUSED" if value else "PLAYING"
+            elif code in players:
+                apply_input_mask(players[code], value)
+        engine.step_update(dt)
+        if profiler is not None:
+            profiler.end_frame(engine.profile_counts())
+    elapsed = time.perf_counter() - start
+
+    return {
+        "steps": last_step,
+        "wall_seconds": elapsed,
+        "steps_per_second": last_step / elapsed if elapsed > 0 else float("inf"),
+        "game_seconds": engine.game_time / 1000,
+        "checks": checks,
+        "desync_step": desync_step,
+        "state": engine.state,
+        "day": engine.current_day,
+        "zombies": len(engine.zombies),
+        "kills": sum(p.zombie_kills for p in engine.players),
+    }
@@ -0,0 +1,77 @@
+"""
+Save metadata for the Load menu.
+
+Each save has a one-row `summary` table (written by the modules'
+save_load) with what the menu shows, so a slot costs one small query
+instead of load_game_data. SAVE_INDEX caches those rows in memory keyed by
+the file's mtime and size, so a visible slot costs one os.stat per frame
+and a save is only reread after it was written again. Saves from before
+the summary table are summarised from their player and meta tables.
+"""
+import os
+import sqlite3
+from typing import Dict, Optional, Tuple
+
+
+def read_summary(path: str) -> Optional[Dict]:
+    """Players, bots and play time of one save file; None if it can't be read."""
+    try:
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    except sqlite3.Error:
+        return None
+    try:
+        try:
+            row = conn.execute(
+                "SELECT players, bots, game_time, current_day, saved_at FROM summary WHERE id=1"
+            ).fetchone()
+        except sqlite3.OperationalError:
+            row = None
+        if row is None:
+            types = [player_type for (player_type,) in conn.execute("SELECT type FROM player")]
+            meta = conn.execute("SELECT game_time, current_day FROM meta WHERE id=1").fetchone()
+            if meta is None:
+                return None
+            row = (types.count("player"), types.count("bot"), meta[0], meta[1], None)
+        players, bots, game_time, current_day, saved_at = row
+        return {
+            "players": players,
+            "bots": bots,
+            "game_time": game_time or 0,
+            "current_day": current_day or 1,
+            "saved_at": saved_at,
+        }
+    except sqlite3.Error:
+        return None
+    finally:
+        conn.close()
+
+
+class SaveIndex:
+    """
+    In-memory summaries of save files. An entry is valid while the file's
+    (mtime, size) is unchanged; write_snapshot closes its connection, which
+    checkpoints the WAL into the file, so every finished save changes both.
+    Unreadable files are cached as None too, so they are not reopened every
+    frame either.
+    """
+    def __init__(self):
+        self.entries: Dict[str, Tuple[Tuple[int, int], Optional[Dict]]] = {}
+        self.reads = 0
+
+    def summary(self, path: str) -> Optional[Dict]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self.entries.pop(path, None)
+            return None
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        entry = self.entries.get(path)
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+        summary = read_summary(path)
+        self.reads += 1
+        self.entries[path] = (stamp, summary)
+        return summary
+
+
+SAVE_INDEX = SaveIndex()
@@ -0,0 +1,15 @@
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+MODULES = ("default", "ProtectBase")
+
+
+@pytest.fixture(params=MODULES)
+def modul_name(request):
+    return request.param
@@ -0,0 +1,53 @@
+import threading
+
+import pytest
+
+from autosave import AutoSaver, replace_atomically
+
+
+def write_text(text):
+    def write(tmp_path, snapshot=None):
+        with open(tmp_path, "w") as f:
+            f.write(text if snapshot is None else snapshot)
+    return write
+
+
+def test_failed_write_keeps_the_previous_file(tmp_path):
+    path = str(tmp_path / "autosave.db")
+    replace_atomically(path, write_text("first"))
+
+    def crash(tmp_path):
+        write_text("half")(tmp_path)
+        raise OSError("disk full")
+
+    with pytest.raises(OSError):
+        replace_atomically(path, crash)
+    with open(path) as f:
+        assert f.read() == "first"
+
+
+def test_only_the_latest_waiting_snapshot_is_written(tmp_path):
+    path = str(tmp_path / "autosave.db")
+    started = threading.Event()
+    release = threading.Event()
+    written = []
+
+    def write(tmp_path, snapshot):
+        if snapshot == "slow":
+            started.set()
+            release.wait(5)
+        written.append(snapshot)
+        write_text("")(tmp_path, snapshot)
+
+    saver = AutoSaver()
+    saver.submit(path, write, "slow")
+    assert started.wait(5)
+    saver.submit(path, write, "stale")
+    saver.submit(path, write, "latest")
+    release.set()
+
+    assert saver.flush(5)
+    assert written == ["slow", "latest"]
+    assert saver.saves == 2
+    with open(path) as f:
+        assert f.read() == "latest"
@@ -0,0 +1,50 @@
+import importlib
+
+import pytest
+
+from bullet_pool import BULLET_RANGE, BulletPool
+from core import Vector2
+
+
+@pytest.fixture
+def bullet_cls(modul_name):
+    return importlib.import_module(f"Moduls.{modul_name}.bullet").Bullet
+
+
+def test_bullets_expire_on_the_same_tick_as_module_bullets(bullet_cls):
+    pool = BulletPool(bullet_cls)
+    speeds = [200, 300, 350, 400]
+    slots = [pool.fire(Vector2(0, 0), Vector2(3, 4), 7, 1, speed) for speed in speeds]
+    bullets = [bullet_cls(Vector2(0, 0), Vector2(3, 4), 7, 1, speed) for speed in speeds]
+
+    for _ in range(120):
+        pool.update(1 / 60)
+        for bullet in bullets:
+            bullet.update(1 / 60)
+        for slot, bullet in zip(slots, bullets):
+            assert pool.active[slot] == bullet.active
+            if bullet.active:
+                assert pool.view(slot).position.x == pytest.approx(bullet.position.x)
+                assert pool.view(slot).position.y == pytest.approx(bullet.position.y)
+    assert len(pool) == 0
+
+
+def test_a_bullet_travels_its_range_then_expires(bullet_cls):
+    pool = BulletPool(bullet_cls)
+    slot = pool.fire(Vector2(10, 10), Vector2(1, 0), 7, 1, speed=BULLET_RANGE)
+    pool.update(0.5)
+    assert pool.active[slot] and pool.x[slot] == pytest.approx(10 + BULLET_RANGE / 2)
+    pool.update(0.5)
+    assert not pool.active[slot]
+    assert list(pool) == []
+
+
+def test_expired_slots_are_reused_before_the_pool_grows(bullet_cls):
+    pool = BulletPool(bullet_cls, capacity=4)
+    first = [pool.fire(Vector2(0, 0), Vector2(1, 0), 7, 1) for _ in range(4)]
+    pool.release(first[1])
+    assert pool.fire(Vector2(0, 0), Vector2(1, 0), 7, 1) == first[1]
+    assert pool.capacity == 4
+
+    pool.fire(Vector2(0, 0), Vector2(1, 0), 7, 1)
+    assert pool.capacity == 8 and len(pool) == 5
@@ -0,0 +1,25 @@
+from core import Vector2, within, within_inclusive, items_within, first_within, count_within
+
+
+class Item:
+    def __init__(self, x, y):
+        self.position = Vector2(x, y)
+
+
+def test_within_excludes_the_boundary_and_within_inclusive_keeps_it():
+    origin = Vector2(0, 0)
+    assert not within(origin, Vector2(3, 4), 5)
+    assert within_inclusive(origin, Vector2(3, 4), 5)
+    assert within(origin, Vector2(3, 3.9), 5)
+    assert not within_inclusive(origin, Vector2(3, 4.1), 5)
+
+
+def test_batch_forms_agree_with_within():
+    origin = Vector2(10, 10)
+    items = [Item(x, y) for x in range(0, 30, 3) for y in range(0, 30, 4)]
+    expected = [item for item in items if within(item.position, origin, 8)]
+
+    assert items_within(origin, items, 8) == expected
+    assert count_within(origin, items, 8) == len(expected)
+    assert first_within(origin, items, 8) is expected[0]
+    assert first_within(origin, items, 0.5) is None
@@ -0,0 +1,40 @@
+from types import SimpleNamespace
+
+from entities import EntityList
+
+
+def entity(**kwargs):
+    return SimpleNamespace(active=True, **kwargs)
+
+
+def test_ids_are_unique_and_never_reused():
+    entities = EntityList([entity(), entity()])
+    first, second = entities
+    assert (first.entity_id, second.entity_id) == (1, 2)
+
+    entities.remove(first)
+    entities.remove_inactive()
+    third = entities.append(entity())
+    assert third.entity_id == 3
+    assert entities.get(1) is None
+    assert entities.get(3) is third
+
+
+def test_loaded_ids_are_kept_unless_taken():
+    entities = EntityList([entity(entity_id=7)])
+    clash = entities.append(entity(entity_id=7))
+    assert entities.get(7) is entities[0]
+    assert clash.entity_id == 8
+    assert entities.append(entity()).entity_id == 9
+
+
+def test_removed_entities_stay_until_compaction():
+    entities = EntityList(entity() for _ in range(5))
+    for dead in list(entities)[1::2]:
+        entities.remove(dead)
+    assert len(entities) == 5
+    assert [e.active for e in entities] == [True, False, True, False, True]
+
+    entities.remove_inactive()
+    assert [e.entity_id for e in entities] == [1, 3, 5]
+    assert sorted(entities.by_id) == [1, 3, 5]
@@ -0,0 +1,54 @@
+import importlib
+
+import pytest
+
+from core import Vector2
+from game_clock import GameClock, VirtualClock, get_ticks, use_clock
+
+
+def test_use_clock_is_scoped_and_nests():
+    outer = GameClock(VirtualClock())
+    inner = GameClock(VirtualClock())
+    inner.reset(5000)
+    with use_clock(outer):
+        assert get_ticks() == outer.now
+        with use_clock(inner):
+            assert get_ticks() == 5000
+        assert get_ticks() == outer.now
+
+
+def test_reset_continues_from_the_given_time():
+    source = VirtualClock()
+    clock = GameClock(source)
+    clock.reset(90000)
+    source.advance(0.5)
+    assert clock.tick() == 90500
+
+
+def test_an_engine_built_mid_game_does_not_change_the_live_engine_time(modul_name):
+    game_logic = importlib.import_module(f"Moduls.{modul_name}.game_logic")
+    live = game_logic.GameEngine(None, 800, 600, headless=True)
+    live.setup_players([{'type': 'bot', 'id': 1, 'name': 'Bot 1'}])
+    live.setup_world()
+    for _ in range(60):
+        live.step_update(1 / 60)
+
+    game_logic.GameEngine(None, 800, 600, headless=True)
+    seen = []
+    live.update_day_night_cycle = lambda: seen.append(get_ticks())
+    live.step_update(1 / 60)
+    assert seen == [live.now] and live.now > 1000
+
+
+@pytest.mark.parametrize("multi_player", [True, False])
+def test_take_damage_uses_the_step_time(modul_name, multi_player):
+    player_module = importlib.import_module(f"Moduls.{modul_name}.player")
+    player = player_module.Player(Vector2(0, 0), 1)
+    player.multi_player_mode = multi_player
+    player.can_go_down = True
+    player.shield = 0
+    player.health = 1
+    player.take_damage(10, now=123456)
+    assert player.last_damage_time == 123456
+    if multi_player:
+        assert player.down_time == player.protection_timer == 123456
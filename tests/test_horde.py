@@ -0,0 +1,78 @@
+import importlib
+import random
+
+import pytest
+
+from core import Vector2
+from horde import ZombieHorde
+
+
+def make_zombies(zombie_module, count, seed):
+    rng = random.Random(seed)
+    types = zombie_module.ALL_ZOMBIE_TYPES
+    return [
+        zombie_module.Zombie(Vector2(rng.uniform(-600, 600), rng.uniform(-600, 600)),
+                             rng.randint(1, 4), rng.choice(types))
+        for _ in range(count)
+    ]
+
+
+def horde_of(zombie_module, zombies):
+    horde = ZombieHorde(zombie_module.Zombie, zombie_module.ALL_ZOMBIE_TYPES, capacity=8, seed=1)
+    views = [horde.append(zombie) for zombie in zombies]
+    return horde, views
+
+
+@pytest.fixture
+def zombie_module(modul_name):
+    return importlib.import_module(f"Moduls.{modul_name}.zombie")
+
+
+def test_horde_moves_like_zombie_update(zombie_module):
+    zombies = make_zombies(zombie_module, 200, seed=4)
+    zombies[3].active = False
+    horde, views = horde_of(zombie_module, zombies)
+    players = [Vector2(0, 0), Vector2(400, -250)]
+
+    for _ in range(120):
+        for zombie in zombies:
+            zombie.update(1 / 60, players, [])
+        horde.update(1 / 60, players, [])
+
+    for zombie, view in zip(zombies, views):
+        assert view.active == zombie.active
+        assert view.position.x == pytest.approx(zombie.position.x, abs=1e-6)
+        assert view.position.y == pytest.approx(zombie.position.y, abs=1e-6)
+
+
+def test_horde_kills_zombies_touching_a_protection_circle_like_zombie_update(zombie_module):
+    zombies = make_zombies(zombie_module, 300, seed=9)
+    # Exactly on the touch distance, which counts as touching
+    zombies.append(zombie_module.Zombie(Vector2(100 + 10, 0)))
+    horde, views = horde_of(zombie_module, zombies)
+    players = [Vector2(0, 0)]
+    circles = [{'active': True, 'position': Vector2(0, 0), 'radius': 100}]
+
+    for zombie in zombies:
+        zombie.update(1 / 60, players, circles)
+    horde.update(1 / 60, players, circles)
+
+    assert not views[-1].active
+    assert any(not zombie.active for zombie in zombies[:-1])
+    for zombie, view in zip(zombies, views):
+        assert view.active == zombie.active
+        # Zombies that walk around the circle pick a random side; the rest must agree
+        if not zombie.position.distance_to(Vector2(0, 0)) < 100 + 20 + zombie.speed * 5 / 60 + 5:
+            assert view.position.x == pytest.approx(zombie.position.x, abs=1e-6)
+            assert view.position.y == pytest.approx(zombie.position.y, abs=1e-6)
+
+
+def test_attackers_respect_reach_and_cooldown(zombie_module):
+    zombies = [zombie_module.Zombie(Vector2(10, 0)), zombie_module.Zombie(Vector2(40, 0))]
+    horde, views = horde_of(zombie_module, zombies)
+
+    attackers = list(horde.attackers([Vector2(0, 0)], [25], current_time=5000))
+    assert [(view.entity_id, in_reach) for view, in_reach in attackers] == [(views[0].entity_id, [True])]
+
+    views[0].attack(5000)
+    assert list(horde.attackers([Vector2(0, 0)], [25], current_time=5500)) == []
@@ -0,0 +1,39 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from core import Vector2
+from interpolation import MAX_BLEND_DISTANCE, Interpolator, lerp_arrays, lerp_position
+
+
+def test_lerp_position_blends_short_moves_and_snaps_jumps():
+    current = Vector2(10, 20)
+    blended = lerp_position(0, 0, current, 0.25)
+    assert (blended.x, blended.y) == pytest.approx((2.5, 5))
+    jumped = Vector2(MAX_BLEND_DISTANCE + 1, 0)
+    assert lerp_position(0, 0, jumped, 0.25) is jumped
+
+
+def test_lerp_arrays_matches_lerp_position():
+    prev_x = np.array([0.0, 5.0, 0.0])
+    prev_y = np.array([0.0, 5.0, 0.0])
+    x = np.array([10.0, 5.0, 200.0])
+    y = np.array([20.0, -5.0, 0.0])
+    blend_x, blend_y = lerp_arrays(x, y, prev_x, prev_y, 0.4)
+    for i in range(3):
+        expected = lerp_position(prev_x[i], prev_y[i], Vector2(x[i], y[i]), 0.4)
+        assert (blend_x[i], blend_y[i]) == pytest.approx((expected.x, expected.y))
+
+
+def test_blend_restores_simulated_positions():
+    mover = SimpleNamespace(position=Vector2(0, 0))
+    newcomer = SimpleNamespace(position=Vector2(50, 50))
+    interpolator = Interpolator()
+    interpolator.capture([mover])
+    simulated = mover.position = Vector2(8, 0)
+
+    with interpolator.blend([mover, newcomer], 0.5):
+        assert (mover.position.x, mover.position.y) == pytest.approx((4, 0))
+        assert (newcomer.position.x, newcomer.position.y) == (50, 50)
+    assert mover.position is simulated
@@ -0,0 +1,54 @@
+import os
+import sqlite3
+
+from save_index import SaveIndex, read_summary
+
+
+def write_summary(path, game_time, players=1, bots=2):
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute("CREATE TABLE IF NOT EXISTS summary (id INTEGER PRIMARY KEY, players INTEGER, bots INTEGER, "
+                     "game_time REAL, current_day INTEGER, saved_at TEXT)")
+        conn.execute("INSERT OR REPLACE INTO summary VALUES (1, ?, ?, ?, 3, 'now')", (players, bots, game_time))
+    conn.close()
+
+
+def test_summary_is_cached_until_the_file_changes(tmp_path):
+    path = str(tmp_path / "slot.db")
+    write_summary(path, 1000)
+    index = SaveIndex()
+    assert index.summary(path)["game_time"] == 1000
+    assert index.summary(path)["game_time"] == 1000
+    assert index.reads == 1
+
+    write_summary(path, 2000, players=2)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    summary = index.summary(path)
+    assert (summary["game_time"], summary["players"], index.reads) == (2000, 2, 2)
+
+    os.remove(path)
+    assert index.summary(path) is None
+    assert path not in index.entries
+
+
+def test_old_saves_are_summarised_from_player_and_meta(tmp_path):
+    path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute("CREATE TABLE player (id INTEGER, type TEXT)")
+        conn.execute("CREATE TABLE meta (id INTEGER, game_time REAL, current_day INTEGER)")
+        conn.executemany("INSERT INTO player VALUES (?, ?)", [(0, "player"), (1, "bot"), (2, "bot")])
+        conn.execute("INSERT INTO meta VALUES (1, 4500, 2)")
+    conn.close()
+    assert read_summary(path) == {"players": 1, "bots": 2, "game_time": 4500, "current_day": 2, "saved_at": None}
+
+
+def test_unreadable_files_are_cached_as_none(tmp_path):
+    path = str(tmp_path / "broken.db")
+    with open(path, "wb") as f:
+        f.write(b"not a database" * 100)
+    index = SaveIndex()
+    assert index.summary(path) is None
+    assert index.summary(path) is None
+    assert index.reads == 1
@@ -0,0 +1,101 @@
+import importlib
+import sqlite3
+
+import pytest
+
+from core import Vector2
+
+BOT_SLOTS = [{'type': 'bot', 'id': 1, 'name': 'Bot 1'}, {'type': 'bot', 'id': 2, 'name': 'Bot 2'}]
+
+
+@pytest.fixture
+def modules(modul_name, tmp_path, monkeypatch):
+    game_logic = importlib.import_module(f"Moduls.{modul_name}.game_logic")
+    save_load = importlib.import_module(f"Moduls.{modul_name}.save_load")
+    world = importlib.import_module(f"Moduls.{modul_name}.world")
+    monkeypatch.setattr(save_load, "SAVE_ROOT", str(tmp_path))
+    return modul_name, game_logic, save_load, world
+
+
+def played_engine(game_logic, ticks=600):
+    engine = game_logic.GameEngine(None, 800, 600, headless=True)
+    engine.setup_players(BOT_SLOTS)
+    engine.setup_world()
+    engine.world.pregenerate = False
+    for _ in range(20):
+        engine.spawn_zombie()
+    for _ in range(ticks):
+        engine.step_update(1 / 60)
+    return engine
+
+
+def reload(game_logic, save_load, modul_name, engine, save_name="round_trip"):
+    save_load.save_game(engine, save_name, engine.mode, modul_name=modul_name)
+    data = save_load.load_game_data(save_name, modul_name=modul_name)
+    loaded = game_logic.GameEngine(None, 800, 600, headless=True)
+    save_load.load_from_data(loaded, data)
+    return loaded
+
+
+def scenery(world, keys):
+    for key in keys:
+        world.generate_chunk(*key)
+    return {key: sorted((obj.position.x, obj.position.y, obj.type) for obj in world.chunks.get(key, []))
+            for key in keys}
+
+
+def test_round_trip_keeps_entities_and_continues_the_clock(modules):
+    modul_name, game_logic, save_load, _ = modules
+    engine = played_engine(game_logic)
+    loaded = reload(game_logic, save_load, modul_name, engine)
+
+    assert loaded.now == engine.now
+    assert loaded.game_time == engine.game_time
+    assert [p.health for p in loaded.players] == [p.health for p in engine.players]
+    assert sorted(z.entity_id for z in loaded.zombies) == sorted(z.entity_id for z in engine.zombies)
+    assert max(p.last_fire_time for p in loaded.players) <= loaded.now
+
+    loaded.step_update(1 / 60)
+    assert loaded.game_time > engine.game_time
+
+
+def test_saves_without_clock_time_continue_from_the_newest_timestamp(modules):
+    modul_name, game_logic, save_load, _ = modules
+    engine = played_engine(game_logic)
+    save_load.save_game(engine, "legacy", engine.mode, modul_name=modul_name)
+    conn = sqlite3.connect(save_load.get_save_path("legacy", modul_name))
+    with conn:
+        conn.execute("UPDATE meta SET clock_time = NULL")
+    conn.close()
+
+    loaded = game_logic.GameEngine(None, 800, 600, headless=True)
+    save_load.load_from_data(loaded, save_load.load_game_data("legacy", modul_name=modul_name))
+    newest = max(max(p.last_fire_time, p.last_damage_time) for p in loaded.players)
+    assert loaded.now >= newest
+    assert loaded.game_time == engine.game_time
+
+
+def test_round_trip_keeps_chunk_deltas(modules):
+    modul_name, game_logic, save_load, world_module = modules
+    engine = played_engine(game_logic, ticks=1)
+    world = engine.world
+    keys = [(x, y) for x in range(-3, 4) for y in range(-3, 4)] + [(9, 9)]
+    for key in keys[:-1]:
+        world.generate_chunk(*key)
+    world.add_object(world_module.WorldObject(Vector2(2500, 2500), Vector2(30, 30), "rock", (1, 2, 3)))
+    # Placed in a chunk nobody has generated yet
+    world.add_object(world_module.WorldObject(Vector2(9500, 9500), Vector2(30, 30), "tree", (1, 2, 3)))
+    assert world.remove_object(world.chunks[(1, 1)][0])
+    # Evicted chunks keep their delta
+    world.unload_chunk(2, 2)
+    before = scenery(world, keys)
+
+    loaded = reload(game_logic, save_load, modul_name, engine, "deltas")
+    assert loaded.world.seed == world.seed
+    assert scenery(loaded.world, keys) == before
+    conn = sqlite3.connect(save_load.get_save_path("deltas", modul_name))
+    try:
+        # Only placed objects are stored; generated scenery comes from the seed
+        assert conn.execute("SELECT COUNT(*) FROM world_object").fetchone()[0] == 2
+    finally:
+        conn.close()
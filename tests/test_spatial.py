@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+from core import Vector2
+from spatial import SpatialHash
+
+
+class Item:
+    def __init__(self, x, y, active=True):
+        self.position = Vector2(x, y)
+        self.active = active
+
+
+def brute_nearest_d2(items, x, y, max_distance=None):
+    limit = float("inf") if max_distance is None else max_distance * max_distance
+    best = None
+    for item in items:
+        if not item.active:
+            continue
+        d2 = (item.position.x - x) ** 2 + (item.position.y - y) ** 2
+        if d2 < limit and (best is None or d2 < best):
+            best = d2
+    return best
+
+
+def d2(item, x, y):
+    return (item.position.x - x) ** 2 + (item.position.y - y) ** 2
+
+
+@pytest.mark.parametrize("count", [1, 7, 300])
+@pytest.mark.parametrize("max_distance", [None, 40, 250])
+def test_nearest_matches_brute_force(count, max_distance):
+    rng = random.Random(count)
+    items = [Item(rng.uniform(-800, 800), rng.uniform(-800, 800), rng.random() > 0.2) for _ in range(count)]
+    grid = SpatialHash.from_items(items)
+    for _ in range(200):
+        x, y = rng.uniform(-3000, 3000), rng.uniform(-3000, 3000)
+        expected = brute_nearest_d2(items, x, y, max_distance)
+        found = grid.nearest(x, y, max_distance)
+        if expected is None:
+            assert found is None
+        else:
+            assert found is not None and found.active
+            assert d2(found, x, y) == expected
+
+
+def test_nearest_on_an_empty_grid_is_none():
+    assert SpatialHash().nearest(0, 0) is None
+    assert SpatialHash.from_items([Item(5, 5, active=False)]).nearest(0, 0) is None
+
+
+def test_query_covers_every_item_in_radius():
+    rng = random.Random(3)
+    items = [Item(rng.uniform(-500, 500), rng.uniform(-500, 500)) for _ in range(500)]
+    grid = SpatialHash.from_items(items)
+    for _ in range(100):
+        x, y = rng.uniform(-500, 500), rng.uniform(-500, 500)
+        near = {id(item) for item in items if d2(item, x, y) < 15 * 15}
+        assert near <= {id(item) for item in grid.query(x, y, 15)}
@@ -0,0 +1,48 @@
+import importlib
+
+from core import Vector2
+
+
+def walk(world_module, ticks, step=4):
+    """Walk one player along +x, letting the worker finish before each tick."""
+    world = world_module.World(max_resident_chunks=32, surface_cache_size=0)
+    integrated = []
+    integrate_chunk = world.integrate_chunk
+
+    def record(chunk_x, chunk_y, chunk_objects):
+        added = integrate_chunk(chunk_x, chunk_y, chunk_objects)
+        if added:
+            integrated.append((chunk_x, chunk_y))
+        return added
+
+    world.integrate_chunk = record
+    position = Vector2(0, 0)
+    synchronous = 0
+    for _ in range(ticks):
+        world_module.get_chunk_executor().submit(lambda: None).result()
+        position.x += step
+        pregenerated = world.pregenerated_chunks
+        generated = world.generated_chunks
+        world.update([position])
+        synchronous += (world.generated_chunks - generated) - (world.pregenerated_chunks - pregenerated)
+    return world, integrated, synchronous
+
+
+def test_pregenerated_chunks_are_not_evicted_before_they_are_reached(modul_name):
+    world_module = importlib.import_module(f"Moduls.{modul_name}.world")
+    world, integrated, synchronous = walk(world_module, ticks=5000)
+
+    assert world.evicted_chunks > 0
+    assert len(world.loaded_chunks) <= world.max_resident_chunks
+    # Every chunk was built once, ahead of the player
+    assert synchronous == 0
+    assert len(integrated) == len(set(integrated))
+
+
+def test_evicted_chunks_are_least_recently_used(modul_name):
+    world_module = importlib.import_module(f"Moduls.{modul_name}.world")
+    world = world_module.World(max_resident_chunks=9, pregenerate=False, surface_cache_size=0)
+    world.update([Vector2(500, 500)])
+
+    assert world.loaded_chunks == {f"{x},{y}" for x in range(-1, 2) for y in range(-1, 2)}
+    assert world.evicted_chunks == 16